@@ -0,0 +1,3 @@
+"""
+Benchmark suite, run with `airspeed velocity <https://asv.readthedocs.io/>`_.
+"""
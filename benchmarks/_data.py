@@ -0,0 +1,59 @@
+"""Synthetic data shared by benchmarks."""
+
+import numpy as np
+import xarray as xr
+
+#: Number of variables (data variables, coordinates or attributes) in sweeps
+N_ITEMS = [10, 1_000, 100_000]
+
+#: Number of pattern keys in sweeps
+N_PATTERNS = [0, 10, 500]
+
+#: Validation modes
+MODES = ["eager", "lazy"]
+
+#: Timeout (in seconds) of benchmarks on the largest objects
+TIMEOUT = 600
+
+
+def make_dataset(n_vars: int) -> xr.Dataset:
+    """
+    Make a Dataset with ``n_vars`` small data variables named ``var_<i>``,
+    each with a ``units`` attribute, sharing a ``time`` coordinate.
+    """
+    data = np.zeros(4, dtype="float32")
+    return xr.Dataset(
+        {
+            f"var_{i}": xr.Variable("time", data, {"units": "K", "index": i})
+            for i in range(n_vars)
+        },
+        coords={"time": np.arange(4)},
+        attrs={"title": "benchmark"},
+    )
+
+
+def make_dataarray(n_coords: int) -> xr.DataArray:
+    """
+    Make a DataArray with ``n_coords`` scalar coordinates named ``coord_<i>``
+    in addition to its ``time`` dimension coordinate.
+    """
+    coords = {f"coord_{i}": i for i in range(n_coords)}
+    coords["time"] = np.arange(4)
+    return xr.DataArray(
+        np.zeros(4, dtype="float32"),
+        dims="time",
+        coords=coords,
+        name="foo",
+        attrs={"units": "K"},
+    )
+
+
+def pattern_keys(n_patterns: int, prefix: str) -> list:
+    """
+    Make ``n_patterns`` distinct glob pattern keys: all but the last one match
+    no name built with ``prefix``, so that matching has to go through them.
+    """
+    keys = [f"unmatched_{i}_*" for i in range(n_patterns - 1)]
+    if n_patterns:
+        keys.append(f"{prefix}*")
+    return keys
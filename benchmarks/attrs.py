@@ -0,0 +1,56 @@
+"""Benchmarks for attribute and unit validation."""
+
+import xarray_validate as xv
+
+from ._data import MODES, N_ITEMS, N_PATTERNS, TIMEOUT, pattern_keys
+
+
+class AttrsPatternKeys:
+    """Matching of attributes against exact and pattern keys."""
+
+    params = [N_ITEMS, N_PATTERNS, MODES]
+    param_names = ["n_attrs", "n_patterns", "mode"]
+    timeout = TIMEOUT
+
+    def setup(self, n_attrs, n_patterns, mode):
+        self.attrs = {f"attr_{i}": "value" for i in range(n_attrs)}
+        if n_patterns:
+            keys = pattern_keys(n_patterns, "attr_")
+        else:
+            keys = list(self.attrs)
+        self.schema = xv.AttrsSchema(
+            {key: xv.AttrSchema(type=str) for key in keys}, allow_extra_keys=False
+        )
+
+    def time_validate(self, n_attrs, n_patterns, mode):
+        self.schema.validate(self.attrs, xv.ValidationContext(mode=mode))
+
+    def time_is_valid(self, n_attrs, n_patterns, mode):
+        self.schema.is_valid(self.attrs)
+
+
+class UnitsValidation:
+    """Validation of unit attributes with pint."""
+
+    params = [["value", "units", "units_compatible"]]
+    param_names = ["check"]
+
+    def setup(self, check):
+        try:
+            import pint  # noqa: F401
+        except ImportError:
+            raise NotImplementedError("pint is not installed")
+
+        self.attrs = {"units": "W / m**2"}
+        # Exact string match, same unit with another spelling, compatible unit
+        expected = {
+            "value": "W / m**2",
+            "units": "watt / meter**2",
+            "units_compatible": "kW / cm**2",
+        }[check]
+        self.schema = xv.AttrsSchema({"units": xv.AttrSchema(**{check: expected})})
+        # Warm up the unit registry, which is created on first use
+        self.schema.is_valid(self.attrs)
+
+    def time_validate(self, check):
+        self.schema.validate(self.attrs, xv.ValidationContext(mode="lazy"))
@@ -0,0 +1,59 @@
+"""Benchmarks for DataArray and coordinate validation."""
+
+import numpy as np
+
+import xarray_validate as xv
+
+from ._data import MODES, N_ITEMS, N_PATTERNS, TIMEOUT, make_dataarray, pattern_keys
+
+
+class DataArrayValidation:
+    """Validation of all components of a small DataArray."""
+
+    params = [MODES]
+    param_names = ["mode"]
+
+    def setup(self, mode):
+        self.da = make_dataarray(0)
+        self.schema = xv.DataArraySchema(
+            dtype=np.float32,
+            dims=["time"],
+            shape=(4,),
+            name="foo",
+            attrs={"units": xv.AttrSchema(value="K")},
+            coords={"time": xv.DataArraySchema(dtype=np.int64, dims=["time"])},
+        )
+        self.plan = self.schema.compile()
+
+    def time_validate(self, mode):
+        self.schema.validate(self.da, mode=mode)
+
+    def time_validate_compiled(self, mode):
+        self.plan.validate(self.da, mode=mode)
+
+    def time_is_valid(self, mode):
+        self.schema.is_valid(self.da)
+
+    def time_from_dataarray(self, mode):
+        xv.DataArraySchema.from_dataarray(self.da)
+
+
+class CoordsValidation:
+    """Validation of DataArrays with an increasing number of coordinates."""
+
+    params = [N_ITEMS, N_PATTERNS, MODES]
+    param_names = ["n_coords", "n_patterns", "mode"]
+    timeout = TIMEOUT
+
+    def setup(self, n_coords, n_patterns, mode):
+        self.da = make_dataarray(n_coords)
+        if n_patterns:
+            keys = pattern_keys(n_patterns, "coord_")
+        else:
+            keys = [f"coord_{i}" for i in range(n_coords)]
+        coords = {key: xv.DataArraySchema(dtype=np.int64) for key in keys}
+        coords["time"] = xv.DataArraySchema(dtype=np.int64, dims=["time"])
+        self.schema = xv.CoordsSchema(coords, allow_extra_keys=False)
+
+    def time_validate(self, n_coords, n_patterns, mode):
+        self.schema.validate(self.da.coords, xv.ValidationContext(mode=mode))
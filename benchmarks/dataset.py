@@ -0,0 +1,114 @@
+"""Benchmarks for Dataset validation."""
+
+import numpy as np
+
+import xarray_validate as xv
+
+from ._data import MODES, N_ITEMS, N_PATTERNS, TIMEOUT, make_dataset, pattern_keys
+
+
+class DatasetValidation:
+    """Validation of Datasets with an increasing number of data variables."""
+
+    params = [N_ITEMS, MODES]
+    param_names = ["n_vars", "mode"]
+    timeout = TIMEOUT
+
+    def setup(self, n_vars, mode):
+        self.ds = make_dataset(n_vars)
+        self.schema = xv.DatasetSchema(
+            data_vars={
+                name: xv.DataArraySchema(
+                    dtype=np.float32,
+                    dims=["time"],
+                    attrs={"units": xv.AttrSchema(value="K")},
+                )
+                for name in self.ds.data_vars
+            },
+            coords={"time": xv.DataArraySchema(dtype=np.int64)},
+            attrs={"title": xv.AttrSchema(value="benchmark")},
+        )
+        self.plan = self.schema.compile()
+
+    def time_validate(self, n_vars, mode):
+        self.schema.validate(self.ds, mode=mode)
+
+    def time_validate_compiled(self, n_vars, mode):
+        self.plan.validate(self.ds, mode=mode)
+
+    def time_compile(self, n_vars, mode):
+        self.schema.compile()
+
+    def peakmem_validate(self, n_vars, mode):
+        self.schema.validate(self.ds, mode=mode)
+
+
+class DatasetErrors:
+    """Error collection on Datasets where all data variables are invalid."""
+
+    params = [N_ITEMS]
+    param_names = ["n_vars"]
+    timeout = TIMEOUT
+
+    def setup(self, n_vars):
+        self.ds = make_dataset(n_vars)
+        self.schema = xv.DatasetSchema(
+            data_vars={"var_*": xv.DataArraySchema(dtype=np.float64, dims=["x"])}
+        )
+
+    def time_validate_lazy(self, n_vars):
+        self.schema.validate(self.ds, mode="lazy")
+
+    def time_validate_lazy_budget(self, n_vars):
+        self.schema.validate(self.ds, mode="lazy", max_errors=10)
+
+    def time_validate_eager(self, n_vars):
+        try:
+            self.schema.validate(self.ds)
+        except xv.SchemaError:
+            pass
+
+    def time_is_valid(self, n_vars):
+        self.schema.is_valid(self.ds)
+
+
+class DatasetPatternKeys:
+    """Matching of data variables against pattern keys."""
+
+    params = [N_ITEMS, N_PATTERNS, MODES]
+    param_names = ["n_vars", "n_patterns", "mode"]
+    timeout = TIMEOUT
+
+    def setup(self, n_vars, n_patterns, mode):
+        self.ds = make_dataset(n_vars)
+        data_vars = {
+            key: xv.DataArraySchema(dtype=np.float32)
+            for key in pattern_keys(n_patterns, "var_")
+        }
+        self.schema = xv.DatasetSchema(data_vars=data_vars, allow_extra_keys=False)
+        if not n_patterns:
+            # Without patterns, all variables are exact keys
+            self.schema = xv.DatasetSchema(
+                data_vars={
+                    name: xv.DataArraySchema(dtype=np.float32)
+                    for name in self.ds.data_vars
+                },
+                allow_extra_keys=False,
+            )
+
+    def time_validate(self, n_vars, n_patterns, mode):
+        self.schema.validate(self.ds, mode=mode)
+
+
+class DatasetInference:
+    """Schema inference from Datasets."""
+
+    params = [N_ITEMS]
+    param_names = ["n_vars"]
+    timeout = TIMEOUT
+
+    def setup(self, n_vars):
+        self.ds = make_dataset(n_vars)
+
+    def time_from_dataset(self, n_vars):
+        xv.DatasetSchema.from_dataset(self.ds)
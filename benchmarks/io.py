@@ -0,0 +1,41 @@
+"""Benchmarks for schema loading and serialization."""
+
+import tempfile
+from pathlib import Path
+
+import xarray_validate as xv
+
+from ._data import N_ITEMS, TIMEOUT, make_dataset
+
+
+class SchemaYAML:
+    """Loading of Dataset schemas from YAML files."""
+
+    params = [N_ITEMS]
+    param_names = ["n_vars"]
+    timeout = TIMEOUT
+
+    def setup(self, n_vars):
+        try:
+            from ruamel.yaml import YAML
+        except ImportError:
+            raise NotImplementedError("ruamel.yaml is not installed")
+
+        self.schema = xv.DatasetSchema.from_dataset(make_dataset(n_vars))
+        self.serialized = self.schema.serialize()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "schema.yaml"
+        with open(self.path, "w") as f:
+            YAML(typ="safe").dump(self.serialized, f)
+
+    def teardown(self, n_vars):
+        self.tmpdir.cleanup()
+
+    def time_from_yaml(self, n_vars):
+        xv.DatasetSchema.from_yaml(self.path)
+
+    def time_deserialize(self, n_vars):
+        xv.DatasetSchema.deserialize(self.serialized)
+
+    def time_serialize(self, n_vars):
+        self.schema.serialize()
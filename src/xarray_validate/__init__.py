@@ -2,14 +2,22 @@
 Main interface.
 """
 
-from . import testing, types
+from . import headers, testing, types
 from ._version import version as __version__
+from .aio import avalidate_files
 from .base import (
+    ProfileEntry,
+    SampleCoverage,
     SchemaError,
     ValidationContext,
     ValidationMode,
+    ValidationObserver,
     ValidationResult,
+    register_observer,
+    unregister_observer,
 )
+from .batch import validate_files
+from .cache import ValidationCache
 from .components import (
     ArrayTypeSchema,
     AttrSchema,
@@ -17,11 +25,15 @@ from .components import (
     ChunksSchema,
     DimsSchema,
     DTypeSchema,
+    IndexSchema,
     NameSchema,
     ShapeSchema,
+    TimeAxisSchema,
+    ValuesSchema,
 )
 from .dataarray import CoordsSchema, DataArraySchema
 from .dataset import DatasetSchema
+from .plan import ValidationPlan
 
 __all__ = [
     "__version__",
@@ -34,12 +46,25 @@ __all__ = [
     "DatasetSchema",
     "DimsSchema",
     "DTypeSchema",
+    "IndexSchema",
     "NameSchema",
+    "ProfileEntry",
+    "SampleCoverage",
     "SchemaError",
     "ShapeSchema",
+    "TimeAxisSchema",
+    "ValidationCache",
     "ValidationContext",
     "ValidationMode",
+    "ValidationObserver",
+    "ValidationPlan",
     "ValidationResult",
+    "ValuesSchema",
+    "avalidate_files",
+    "headers",
+    "register_observer",
     "testing",
     "types",
+    "unregister_observer",
+    "validate_files",
 ]
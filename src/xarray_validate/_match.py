@@ -2,7 +2,16 @@
 
 import fnmatch
 import re
-from typing import Any, Dict, Mapping, Set, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Set,
+    Tuple,
+)
 
 
 def is_regex_pattern(key: str) -> bool:
@@ -54,6 +63,21 @@ def pattern_to_regex(pattern: str) -> re.Pattern:
         return re.compile(re.escape(pattern) + "$")
 
 
+# Characters starting a wildcard or a character class in glob patterns
+_GLOB_SPECIAL = re.compile(r"[*?\[]")
+
+
+def literal_prefix(key: str) -> str:
+    """
+    Get the literal prefix of a glob pattern key, *i.e.* the characters
+    preceding its first wildcard. Regex pattern keys have no literal prefix.
+    """
+    if is_regex_pattern(key):
+        return ""
+    m = _GLOB_SPECIAL.search(key)
+    return key[: m.start()] if m is not None else key
+
+
 def separate_keys(
     schema_keys: Dict[str, Any],
 ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, re.Pattern]]:
@@ -82,6 +106,222 @@ def separate_keys(
     return exact_keys, pattern_keys, compiled_patterns
 
 
+# Constructs that cannot be safely embedded in a combined alternation: group
+# references and conditionals depend on group numbering, which shifts when
+# patterns are concatenated.
+_NON_COMBINABLE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+class PatternMatcher:
+    """
+    Single-pass matcher for a collection of compiled patterns.
+
+    Glob patterns starting with literal characters (*e.g.* ``'t2m_*'``) are
+    indexed by their literal prefix: matching a key only tests the patterns
+    whose prefix the key starts with, which takes one dictionary lookup per
+    distinct prefix length.
+
+    Other patterns are combined into one alternation regex in which each
+    pattern is wrapped in its own capturing group. Matching a key then takes a
+    single :meth:`re.Pattern.fullmatch` call, and the index of the last closed
+    group identifies the first pattern matching it. Subsequent matching
+    patterns are found by matching the alternation of the patterns following
+    it, compiled on first use. Patterns that cannot be embedded in an
+    alternation (*e.g.* with numbered backreferences, which would be shifted)
+    are kept aside and tested individually.
+
+    Parameters
+    ----------
+    compiled_patterns : mapping
+        Mapping of pattern keys to compiled regex objects.
+    """
+
+    __slots__ = ("_combinable", "_combined", "_fallback", "_order", "_prefixes")
+
+    def __init__(self, compiled_patterns: Mapping[str, re.Pattern]):
+        self._order = {key: i for i, key in enumerate(compiled_patterns)}
+        # [(order, pattern key, regex)], in order
+        self._combinable: List[Tuple[int, str, re.Pattern]] = []
+        self._fallback: List[Tuple[int, str, re.Pattern]] = []
+        # Prefix length -> prefix -> [(order, pattern key, regex)], in order
+        self._prefixes: Dict[int, Dict[str, list]] = {}
+        # Start position in _combinable -> (alternation, group -> position)
+        self._combined: Dict[int, Tuple[re.Pattern, Dict[int, int]]] = {}
+
+        for i, (key, regex) in enumerate(compiled_patterns.items()):
+            prefix = literal_prefix(key)
+            if prefix:
+                self._prefixes.setdefault(len(prefix), {}).setdefault(
+                    prefix, []
+                ).append((i, key, regex))
+            elif regex.flags & ~re.UNICODE or _NON_COMBINABLE.search(regex.pattern):
+                self._fallback.append((i, key, regex))
+            else:
+                self._combinable.append((i, key, regex))
+
+        if self._combinable:
+            try:
+                self._alternation(0)
+            except re.error:
+                # Duplicate group names, misplaced global flags, etc.
+                self._fallback = sorted(self._fallback + self._combinable)
+                self._combinable = []
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._order)!r})"
+
+    def __bool__(self) -> bool:
+        return bool(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _alternation(self, start: int) -> Tuple[re.Pattern, Dict[int, int]]:
+        # Alternation of the combinable patterns from position start
+        entry = self._combined.get(start)
+        if entry is None:
+            parts = []
+            positions = {}
+            group = 1
+            for position in range(start, len(self._combinable)):
+                regex = self._combinable[position][2]
+                parts.append(f"({regex.pattern})")
+                positions[group] = position
+                group += regex.groups + 1
+            entry = (re.compile("|".join(parts)), positions)
+            self._combined[start] = entry
+        return entry
+
+    def match(self, key: str) -> Tuple[str, ...]:
+        """
+        Find the pattern keys matching a given key.
+
+        Parameters
+        ----------
+        key : str
+            Key to match (*e.g.* a variable name).
+
+        Returns
+        -------
+        tuple of str
+            Pattern keys matching ``key``, in insertion order. Empty if no
+            pattern matches.
+        """
+        matches = self._match_general(key)
+
+        for length, table in self._prefixes.items():
+            candidates = table.get(key[:length])
+            if candidates is None:
+                continue
+            for entry in candidates:
+                if entry[2].fullmatch(key):
+                    matches.append(entry)
+
+        if len(matches) > 1:
+            matches.sort()
+        return tuple(entry[1] for entry in matches)
+
+    def _match_general(self, key: str) -> list:
+        # Match patterns without a literal prefix
+        matches = []
+
+        start, stop = 0, len(self._combinable)
+        while start < stop:
+            combined, positions = self._alternation(start)
+            m = combined.fullmatch(key)
+            if m is None:
+                break
+            position = positions[m.lastindex]
+            matches.append(self._combinable[position])
+            start = position + 1
+
+        for entry in self._fallback:
+            if entry[2].fullmatch(key):
+                matches.append(entry)
+
+        return matches
+
+
+class KeyTable(NamedTuple):
+    """
+    Precomputed lookup table for a mapping with exact and pattern keys.
+    """
+
+    exact_keys: Dict[str, Any]  #: Entries with exact (non-pattern) keys
+    pattern_keys: Dict[str, Any]  #: Entries with pattern keys
+    matcher: PatternMatcher  #: Matcher for pattern keys
+
+    @classmethod
+    def from_mapping(cls, schema_keys: Dict[str, Any]) -> "KeyTable":
+        """Build a key table from a mapping with exact and pattern keys."""
+        exact_keys, pattern_keys, compiled_patterns = separate_keys(schema_keys)
+        return cls(exact_keys, pattern_keys, PatternMatcher(compiled_patterns))
+
+    def claim(self, key: str) -> Tuple[str, ...]:
+        """
+        Find the schema keys governing an actual key.
+
+        An exact key governs the actual key alone; otherwise, all matching
+        pattern keys do.
+
+        Returns
+        -------
+        tuple of str
+            The governing schema keys, in schema order. Empty if ``key`` is
+            not matched.
+        """
+        if key in self.exact_keys:
+            return (key,)
+        return self.matcher.match(key)
+
+    def classify(
+        self, keys: Iterable[str]
+    ) -> Tuple[Dict[str, Tuple[str, ...]], List[str]]:
+        """
+        Assign actual keys to the schema keys governing them, in a single pass.
+
+        Parameters
+        ----------
+        keys : iterable of str
+            Actual keys (*e.g.* variable names).
+
+        Returns
+        -------
+        claimed : dict
+            Mapping of claimed actual keys to their governing schema keys (see
+            :meth:`claim`), in the order of ``keys``.
+
+        unclaimed : list
+            Actual keys matched by no schema key, in the order of ``keys``.
+        """
+        exact_keys = self.exact_keys
+        match = self.matcher.match if self.matcher else None
+        claimed = {}
+        unclaimed = []
+        for key in keys:
+            if key in exact_keys:
+                claimed[key] = (key,)
+                continue
+            schema_keys = match(key) if match is not None else ()
+            if schema_keys:
+                claimed[key] = schema_keys
+            else:
+                unclaimed.append(key)
+        return claimed, unclaimed
+
+
+def update_key_table(instance: Any, attribute: Any, value: Any) -> Any:
+    """
+    ``on_setattr`` hook refreshing the cached key table of a schema.
+
+    Schemas with pattern-keyed mappings cache a :class:`KeyTable` in a private
+    ``_key_table`` attribute. This hook rebuilds it when the mapping is
+    reassigned.
+    """
+    instance._key_table = KeyTable.from_mapping(value) if value is not None else None
+    return value
+
+
 def find_matched_keys(
     actual_keys: Mapping[str, Any],
     exact_keys: Dict[str, Any],
@@ -106,15 +346,9 @@ def find_matched_keys(
     set
         Set of actual keys that match either exact or pattern keys.
     """
-    matched_keys = set()
-    for key_name in actual_keys:
-        # Check exact match
-        if key_name in exact_keys:
-            matched_keys.add(key_name)
-            continue
-        # Check pattern match
-        for pattern, regex in compiled_patterns.items():
-            if regex.fullmatch(key_name):
-                matched_keys.add(key_name)
-                break
-    return matched_keys
+    matcher = PatternMatcher(compiled_patterns)
+    return {
+        key_name
+        for key_name in actual_keys
+        if key_name in exact_keys or matcher.match(key_name)
+    }
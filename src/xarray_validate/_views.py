@@ -0,0 +1,232 @@
+"""Lightweight views of the variables of xarray objects."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable, Iterator, Mapping, Tuple
+
+import xarray as xr
+
+
+class VariableView:
+    """
+    View of a variable of a Dataset or DataArray, which mimics the parts of
+    the :class:`xarray.DataArray` interface inspected by
+    :class:`.DataArraySchema` without constructing a DataArray.
+
+    Indexing a Dataset (``ds[name]``) or a coordinate mapping
+    (``coords[name]``) builds a new DataArray and collects its coordinates by
+    scanning all variables, which dominates the validation time of objects
+    with many variables. Views wrap the underlying :class:`xarray.Variable`
+    and share the coordinate view of their parent object instead.
+
+    Parameters
+    ----------
+    name : hashable
+        Variable name.
+
+    variable : xarray.Variable
+        Underlying variable.
+
+    parent : CoordinatesView
+        Coordinates of the object holding the variable.
+
+    getitem : callable
+        Function constructing the DataArray of the variable from its name.
+    """
+
+    __slots__ = ("name", "variable", "_parent", "_getitem")
+
+    def __init__(
+        self,
+        name: Hashable,
+        variable: xr.Variable,
+        parent: CoordinatesView,
+        getitem: Callable[[Hashable], xr.DataArray],
+    ):
+        self.name = name
+        self.variable = variable
+        self._parent = parent
+        self._getitem = getitem
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+    @property
+    def dtype(self):
+        return self.variable.dtype
+
+    @property
+    def dims(self) -> Tuple[Hashable, ...]:
+        return self.variable.dims
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.variable.shape
+
+    @property
+    def chunks(self):
+        return self.variable.chunks
+
+    @property
+    def attrs(self) -> dict:
+        return self.variable.attrs
+
+    @property
+    def data(self) -> Any:
+        return self.variable.data
+
+    @property
+    def coords(self) -> CoordinatesView:
+        """Coordinates attached to the variable, as xarray would attach them."""
+        return self._parent.subset(self.variable.dims)
+
+    @property
+    def xindexes(self) -> Dict[Hashable, Any]:
+        indexes = self._parent.xindexes
+        return {name: indexes[name] for name in self.coords if name in indexes}
+
+    def to_dataarray(self) -> xr.DataArray:
+        """Construct the DataArray this view stands for."""
+        return self._getitem(self.name)
+
+
+class CoordinatesView(Mapping):
+    """
+    Read-only mapping of coordinate names to :class:`VariableView` objects.
+
+    Coordinate views of the variables of an object are derived from the
+    coordinate view of the object: coordinates whose dimensions are a subset
+    of the dimensions of a variable are attached to it. They are computed
+    once per distinct dimension tuple and shared.
+
+    Parameters
+    ----------
+    variables : mapping
+        Coordinate variables, keyed by name.
+
+    xindexes : mapping
+        Indexes of the object, keyed by coordinate name.
+
+    getitem : callable
+        Function constructing the DataArray of a variable from its name.
+    """
+
+    __slots__ = ("_variables", "xindexes", "getitem", "_views", "_subsets")
+
+    def __init__(
+        self,
+        variables: Mapping[Hashable, xr.Variable],
+        xindexes: Mapping[Hashable, Any],
+        getitem: Callable[[Hashable], xr.DataArray],
+    ):
+        self._variables = variables
+        self.xindexes = xindexes
+        self.getitem = getitem
+        self._views: Dict[Hashable, VariableView] = {}
+        self._subsets: Dict[Tuple[Hashable, ...], CoordinatesView] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._variables)!r})"
+
+    def __getitem__(self, key: Hashable) -> VariableView:
+        view = self._views.get(key)
+        if view is None:
+            view = VariableView(key, self._variables[key], self, self.getitem)
+            self._views[key] = view
+        return view
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._variables
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._variables)
+
+    def __len__(self) -> int:
+        return len(self._variables)
+
+    def subset(self, dims: Tuple[Hashable, ...]) -> CoordinatesView:
+        """Coordinates attached to a variable with dimensions ``dims``."""
+        subset = self._subsets.get(dims)
+        if subset is None:
+            needed = set(dims)
+            variables = {
+                name: variable
+                for name, variable in self._variables.items()
+                if needed.issuperset(variable.dims)
+            }
+            if len(variables) == len(self._variables):
+                subset = self
+            else:
+                subset = CoordinatesView(variables, self.xindexes, self.getitem)
+                # Subsets share views and their own subsets
+                subset._views = self._views
+                subset._subsets = self._subsets
+            self._subsets[dims] = subset
+        return subset
+
+
+class DataVariablesView(Mapping):
+    """
+    Read-only mapping of the data variable names of a Dataset to
+    :class:`VariableView` objects.
+
+    Parameters
+    ----------
+    ds : xarray.Dataset
+        Viewed Dataset.
+    """
+
+    __slots__ = ("_ds", "_names", "coords")
+
+    def __init__(self, ds: xr.Dataset):
+        self._ds = ds
+        self._names = ds.data_vars
+        #: Coordinates of the Dataset, shared by all variable views
+        self.coords = coordinates(ds)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._names)!r})"
+
+    def __getitem__(self, key: Hashable) -> VariableView:
+        if key not in self._names:
+            raise KeyError(key)
+        return VariableView(
+            key, self._ds.variables[key], self.coords, self._ds.__getitem__
+        )
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._names
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+def coordinates(obj: Any) -> Any:
+    """
+    Get a view of the coordinates of a Dataset or DataArray. Other objects
+    (*e.g.* headers or views) are returned their own coordinates.
+    """
+    if isinstance(obj, (xr.Dataset, xr.DataArray)):
+        coords = obj.coords
+        return CoordinatesView(coords.variables, obj.xindexes, coords.__getitem__)
+    return obj.coords
+
+
+def data_variables(ds: Any) -> Any:
+    """
+    Get a view of the data variables of a Dataset. Other objects (*e.g.*
+    headers) are returned their own data variables.
+    """
+    if isinstance(ds, xr.Dataset):
+        return DataVariablesView(ds)
+    return ds.data_vars
+
+
+def as_dataarray(obj: Any) -> Any:
+    """Construct the DataArray a variable view stands for, if ``obj`` is one."""
+    if isinstance(obj, VariableView):
+        return obj.to_dataarray()
+    return obj
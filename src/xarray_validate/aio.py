@@ -0,0 +1,161 @@
+"""Asynchronous validation for asyncio applications."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import itertools
+import os
+from typing import Any, AsyncIterator, Iterable, Literal, Optional, Tuple, Union
+
+from . import batch
+from .base import ValidationContext, ValidationMode, ValidationResult
+
+
+def _offloaded(schema: Any, obj: Any) -> bool:
+    # Paths are read from disk, and checks, value and index schemas may load
+    # or compute data: these are run in an executor. Other schemas only
+    # inspect metadata, which is fast enough to run inline.
+    return isinstance(obj, (str, os.PathLike)) or schema._has_checks()
+
+
+class _NoLimit:
+    # Stand-in for a semaphore when concurrency is not limited
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+async def avalidate(
+    schema: Any,
+    obj: Any,
+    mode: Literal["eager", "lazy"] | None = None,
+    max_errors: int | None = None,
+    max_errors_per_path: int | None = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+    limiter: Optional[asyncio.Semaphore] = None,
+    offload: Optional[bool] = None,
+) -> Optional[ValidationResult]:
+    """
+    Validate an object against a schema without blocking the event loop.
+
+    See :meth:`.DatasetSchema.avalidate` for details.
+    """
+    context = ValidationContext(
+        mode=mode if mode is not None else "eager",
+        max_errors=max_errors,
+        max_errors_per_path=max_errors_per_path,
+    )
+    validate = functools.partial(schema.validate, obj, context)
+
+    if offload is None:
+        offload = _offloaded(schema, obj)
+    if not offload:
+        validate()
+        return None if context.mode is ValidationMode.EAGER else context.result
+
+    loop = asyncio.get_running_loop()
+    if limiter is None:
+        limiter = _NoLimit()
+    async with limiter:
+        future = loop.run_in_executor(executor, validate)
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The worker thread cannot be interrupted: skip its remaining steps
+            context.stop()
+            raise
+    return None if context.mode is ValidationMode.EAGER else context.result
+
+
+async def avalidate_files(
+    schema: Any,
+    paths: Iterable[Union[str, os.PathLike]],
+    engine: Optional[str] = None,
+    max_concurrency: int = 4,
+    executor: Optional[concurrent.futures.Executor] = None,
+    **open_kwargs,
+) -> AsyncIterator[Tuple[Union[str, os.PathLike], ValidationResult]]:
+    """
+    Validate a collection of files without blocking the event loop.
+
+    Files are opened and validated in lazy mode in an executor, at most
+    ``max_concurrency`` at a time; paths are pulled as validations complete.
+    Closing the iterator or cancelling the consuming task cancels the
+    validation of pending files.
+
+    Parameters
+    ----------
+    schema : DatasetSchema or DataArraySchema
+        Validation schema. Files are opened with :func:`xarray.open_dataset`,
+        or :func:`xarray.open_dataarray` if ``schema`` is a
+        :class:`.DataArraySchema`.
+
+    paths : iterable of path-like
+        Paths to the validated files or stores, consumed lazily.
+
+    engine : str, optional
+        Engine used to open files. If unset, xarray guesses it from each file.
+
+    max_concurrency : int, default: 4
+        Maximum number of files opened and validated at the same time.
+
+    executor : concurrent.futures.Executor, optional
+        Executor opening and validating files. Defaults to the event loop's
+        default executor (a thread pool). The HDF5 library is not thread-safe:
+        for netCDF4 and HDF5 files, use a
+        :class:`~concurrent.futures.ProcessPoolExecutor` (the schema must then
+        be picklable).
+
+    **open_kwargs
+        Additional keyword arguments passed to the function opening files.
+
+    Yields
+    ------
+    tuple[path-like, ValidationResult]
+        Paths and their validation results, in completion order. A file that
+        cannot be opened yields a result with a ``"file_unreadable"`` error.
+
+    Examples
+    --------
+    >>> async def check(paths):  # doctest: +SKIP
+    ...     async for path, result in xv.avalidate_files(schema, paths):
+    ...         if result.has_errors:
+    ...             print(path, result.get_error_summary())
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"'max_concurrency' must be positive (got {max_concurrency})")
+
+    loop = asyncio.get_running_loop()
+    open_ = batch._opener(schema)
+    paths = iter(paths)
+
+    def validate_file(path):
+        return loop.run_in_executor(
+            executor,
+            batch._open_and_validate,
+            open_,
+            schema.validate,
+            path,
+            engine,
+            open_kwargs,
+        )
+
+    # Paths are pulled as validations complete, so that at most
+    # max_concurrency files are in flight and paths are not consumed ahead
+    pending = {}
+    try:
+        while True:
+            for path in itertools.islice(paths, max_concurrency - len(pending)):
+                pending[validate_file(path)] = path
+            if not pending:
+                break
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        for future in pending:
+            future.cancel()
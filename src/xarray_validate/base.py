@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import sys
+import time
+import tracemalloc
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import attrs
 
@@ -17,6 +20,101 @@ class ValidationMode(Enum):
     LAZY = "lazy"  #: Collect all validation errors and return them in ValidationResult
 
 
+@attrs.frozen
+class SampleCoverage:
+    """
+    Coverage of a sampled value validation.
+
+    Parameters
+    ----------
+    chunks_checked : int
+        Number of sampled chunks.
+
+    chunks_total : int
+        Number of chunks of the array.
+
+    elements_checked : int
+        Number of elements in the sampled chunks.
+
+    elements_total : int
+        Number of elements of the array.
+
+    chunks_failed : int
+        Number of sampled chunks which failed validation.
+
+    confidence : float, default: 0.95
+        Confidence level of :attr:`max_failing_fraction`.
+    """
+
+    chunks_checked: int
+    chunks_total: int
+    elements_checked: int
+    elements_total: int
+    chunks_failed: int
+    confidence: float = 0.95
+
+    @property
+    def fraction(self) -> float:
+        """Fraction of the array elements which were checked."""
+        return self.elements_checked / self.elements_total
+
+    @property
+    def max_failing_fraction(self) -> Optional[float]:
+        """
+        Upper bound of the fraction of failing chunks in the whole array, at
+        the :attr:`confidence` level, or ``None`` if sampled chunks failed.
+
+        It is derived from the probability of drawing no failing chunk, which
+        is at most :math:`(1 - p)^n` for :math:`n` chunks drawn when a
+        fraction :math:`p` of chunks fail.
+        """
+        if self.chunks_failed:
+            return None
+        if self.chunks_checked == self.chunks_total:
+            return 0.0
+        return 1.0 - (1.0 - self.confidence) ** (1.0 / self.chunks_checked)
+
+    @property
+    def statement(self) -> str:
+        """Human-readable coverage and confidence statement."""
+        checked = (
+            f"checked {self.chunks_checked} of {self.chunks_total} chunks "
+            f"({self.fraction:.3g} of elements)"
+        )
+        if self.chunks_failed:
+            return f"{checked}: {self.chunks_failed} failed"
+        return (
+            f"{checked}: with {self.confidence:.0%} confidence, less than "
+            f"{self.max_failing_fraction:.3g} of chunks fail"
+        )
+
+
+@attrs.define
+class ProfileEntry:
+    """
+    Profile of a validated path (see the ``profile`` parameter of
+    :class:`.ValidationContext`).
+
+    Parameters
+    ----------
+    calls : int, default: 0
+        Number of times the path was visited.
+
+    time : float, default: 0.0
+        Cumulated wall time (in seconds) spent validating the path, including
+        its children.
+
+    memory : int, optional
+        Largest increase of the memory traced by :mod:`tracemalloc` (in bytes)
+        over a visit of the path, including its children. Only recorded if
+        memory tracing is enabled.
+    """
+
+    calls: int = 0
+    time: float = 0.0
+    memory: Optional[int] = None
+
+
 @attrs.define
 class ValidationResult:
     """
@@ -26,9 +124,30 @@ class ValidationResult:
     ----------
     errors : list of tuple[str, SchemaError]
         List of (path, error) pairs mapping errors to tree locations.
+
+    truncated : bool, default: False
+        Whether validation stopped before the whole schema tree was explored
+        or errors were dropped because the error budget was spent (see
+        :class:`.ValidationContext`).
+
+    coverage : dict[str, SampleCoverage], optional
+        Coverage of sampled value validations, mapped by path (see
+        :class:`.ValuesSchema`).
+
+    check_durations : dict[str, float], optional
+        Wall time (in seconds) of each user-defined check, mapped by path
+        (*e.g.* ``"checks.check_range"``).
+
+    profile : dict[str, ProfileEntry], optional
+        Profile of each visited path, in visit order. Only recorded if
+        profiling is enabled (see :class:`.ValidationContext`).
     """
 
     errors: list[tuple[str, SchemaError]] = attrs.field(factory=list)
+    truncated: bool = attrs.field(default=False, repr=False)
+    coverage: Dict[str, SampleCoverage] = attrs.field(factory=dict, repr=False)
+    check_durations: Dict[str, float] = attrs.field(factory=dict, repr=False, eq=False)
+    profile: Dict[str, ProfileEntry] = attrs.field(factory=dict, repr=False, eq=False)
 
     @property
     def has_errors(self):
@@ -38,18 +157,312 @@ class ValidationResult:
         """Add an error at the specified path."""
         self.errors.append((path, error))
 
+    def add_coverage(self, path: str, coverage: SampleCoverage) -> None:
+        """Record the coverage of a sampled validation at the specified path."""
+        self.coverage[path] = coverage
+
+    def filter_errors(self, code: str) -> list[tuple[str, SchemaError]]:
+        """
+        Get errors with a given error code.
+
+        Parameters
+        ----------
+        code : str
+            Error code (see :attr:`.SchemaError.code`).
+
+        Returns
+        -------
+        list of tuple[str, SchemaError]
+            List of (path, error) pairs.
+        """
+        return [(path, error) for path, error in self.errors if error.code == code]
+
     def get_error_summary(self) -> str:
-        """Get a formatted summary of all validation errors."""
+        """
+        Get a formatted summary of all validation errors.
+
+        Error messages are rendered upon calling this method.
+        """
         if not self.has_errors:
             return "Validation passed"
 
         lines = ["Validation failed with errors:"]
         for path, error in self.errors:
             lines.append(f"  {path}: {error}")
+        if self.truncated:
+            lines.append("  ... (truncated: error budget exhausted)")
+        for path, coverage in self.coverage.items():
+            lines.append(f"  {path}: sampled, {coverage.statement}")
+        return "\n".join(lines)
+
+    def get_profile_table(self, sort_by: str = "visit") -> str:
+        """
+        Get a formatted table of the validation profile.
+
+        Parameters
+        ----------
+        sort_by : {"visit", "time", "calls"}, default: "visit"
+            Row order: path visit order, or decreasing wall time or call
+            count.
+
+        Returns
+        -------
+        str
+            Table with one row per visited path. Times are cumulated and
+            include children paths.
+        """
+        if sort_by == "visit":
+            rows = list(self.profile.items())
+        elif sort_by in {"time", "calls"}:
+            rows = sorted(
+                self.profile.items(),
+                key=lambda item: getattr(item[1], sort_by),
+                reverse=True,
+            )
+        else:
+            raise ValueError(
+                f"'sort_by' must be 'visit', 'time' or 'calls' (got {sort_by!r})"
+            )
+
+        memory = any(entry.memory is not None for _, entry in rows)
+        header = ["path", "calls", "time (ms)"] + (["memory (KiB)"] if memory else [])
+        table = [header]
+        for path, entry in rows:
+            row = [path, str(entry.calls), f"{entry.time * 1e3:.3f}"]
+            if memory:
+                row.append("" if entry.memory is None else f"{entry.memory / 1024:.1f}")
+            table.append(row)
+
+        width = max(len(row[0]) for row in table)
+        lines = []
+        for row in table:
+            line = row[0].ljust(width) + "".join(
+                cell.rjust(len(title) + 2) for cell, title in zip(row[1:], header[1:])
+            )
+            lines.append(line)
         return "\n".join(lines)
 
 
+def _convert_mode(value: ValidationMode | str) -> ValidationMode:
+    return ValidationMode(value.lower() if isinstance(value, str) else value)
+
+
+class ValidationObserver:
+    """
+    Base class for validation observers.
+
+    Observers are notified of validation events, *e.g.* to export latency
+    and error metrics. Subclasses override the hooks they need; default hooks
+    do nothing. Observers are registered globally with
+    :func:`register_observer` or for a single run with the ``observers``
+    parameter of :class:`.ValidationContext`.
+
+    Hooks are called synchronously from the validating thread: they should be
+    fast, and globally registered observers must be thread-safe if objects
+    are validated concurrently (*e.g.* with ``validate_many()``).
+
+    Examples
+    --------
+    >>> class ErrorCounter(xv.ValidationObserver):
+    ...     def __init__(self):
+    ...         self.count = 0
+    ...
+    ...     def on_error(self, context, error):
+    ...         self.count += 1
+    >>> counter = ErrorCounter()
+    >>> context = xv.ValidationContext(mode="lazy", observers=[counter])
+    >>> _ = xv.DataArraySchema(dtype="int32").validate(xr.DataArray([1.0]), context)
+    >>> counter.count
+    1
+    """
+
+    def on_validate_start(self, context: ValidationContext, obj: Any) -> None:
+        """
+        Called when the validation of ``obj`` starts, with the root context.
+        """
+
+    def on_validate_end(
+        self,
+        context: ValidationContext,
+        duration: float,
+        exception: Optional[BaseException],
+    ) -> None:
+        """
+        Called when a validation ends, with the root context, its wall time
+        (in seconds) and the exception it raised, if any (*e.g.* the
+        :class:`.SchemaError` raised in eager mode).
+        """
+
+    def on_node_enter(self, context: ValidationContext) -> None:
+        """Called when the validation of a schema tree node starts."""
+
+    def on_node_exit(self, context: ValidationContext, duration: float) -> None:
+        """
+        Called when the validation of a schema tree node ends, with its wall
+        time (in seconds), including its children.
+        """
+
+    def on_error(self, context: ValidationContext, error: Exception) -> None:
+        """
+        Called when an error is recorded (lazy mode) or raised (eager mode).
+        """
+
+
+#: Globally registered observers
+_observers: List[ValidationObserver] = []
+
+
+def register_observer(observer: ValidationObserver) -> None:
+    """
+    Register an observer notified by all subsequently created validation
+    contexts.
+
+    Parameters
+    ----------
+    observer : ValidationObserver
+        Observer to register.
+    """
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def unregister_observer(observer: ValidationObserver) -> None:
+    """
+    Unregister a globally registered observer.
+
+    Parameters
+    ----------
+    observer : ValidationObserver
+        Observer to unregister. Unknown observers are ignored.
+    """
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+class _Notifier:
+    """
+    Dispatches the events of a validation run to its observers and times
+    schema tree nodes.
+    """
+
+    def __init__(self, observers: Iterable[ValidationObserver]):
+        self.observers = tuple(observers)
+        # Frames: (context, start time)
+        self._stack: list = []
+
+    @property
+    def current(self) -> Optional[ValidationContext]:
+        """Context of the innermost entered node."""
+        return self._stack[-1][0] if self._stack else None
+
+    def validate_start(self, context: ValidationContext, obj: Any) -> float:
+        for observer in self.observers:
+            observer.on_validate_start(context, obj)
+        return time.perf_counter()
+
+    def validate_end(
+        self,
+        context: ValidationContext,
+        start: float,
+        exception: Optional[BaseException],
+    ) -> None:
+        duration = time.perf_counter() - start
+        for observer in self.observers:
+            observer.on_validate_end(context, duration, exception)
+
+    def enter(self, context: ValidationContext) -> None:
+        for observer in self.observers:
+            observer.on_node_enter(context)
+        self._stack.append((context, time.perf_counter()))
+
+    def exit(self) -> None:
+        end = time.perf_counter()
+        context, start = self._stack.pop()
+        for observer in self.observers:
+            observer.on_node_exit(context, end - start)
+
+    def error(self, context: ValidationContext, error: Exception) -> None:
+        for observer in self.observers:
+            observer.on_error(context, error)
+
+
 @attrs.define
+class _RunState:
+    """
+    Settings and bookkeeping shared by all contexts of a validation run.
+    """
+
+    max_errors: Optional[int] = attrs.field(default=None)
+    max_errors_per_path: Optional[int] = attrs.field(default=None)
+    stopped: bool = False
+    path_counts: Dict[str, int] = attrs.field(factory=dict)
+    deferred: Optional[list] = None
+    profiler: Optional[_Profiler] = None
+
+    @max_errors.validator
+    @max_errors_per_path.validator
+    def _budget_validator(self, attribute, value):
+        if value is not None and value < 1:
+            raise ValueError(f"'{attribute.name}' must be positive (got {value})")
+
+
+class _Profiler(ValidationObserver):
+    """
+    Records the wall time, call count and optionally the traced memory of
+    the paths visited during a validation run.
+    """
+
+    def __init__(self, entries: Dict[str, ProfileEntry], trace_memory: bool):
+        self.entries = entries
+        self.trace_memory = trace_memory
+        # Frames: [context, entry, start memory, peak memory]
+        self._stack: list = []
+        self._owns_tracing = False
+
+    @property
+    def current(self) -> Optional[ValidationContext]:
+        """Context of the innermost profiled path."""
+        return self._stack[-1][0] if self._stack else None
+
+    def on_node_enter(self, context: ValidationContext) -> None:
+        path = context.get_path_string()
+        entry = self.entries.get(path)
+        if entry is None:
+            entry = self.entries[path] = ProfileEntry()
+
+        memory = peak = None
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracing = True
+            memory, peak = tracemalloc.get_traced_memory()
+            # The traced peak is reset for each path: the enclosing path keeps
+            # track of its own peak
+            if self._stack:
+                frame = self._stack[-1]
+                frame[3] = max(frame[3], peak)
+            tracemalloc.reset_peak()
+            peak = memory
+
+        self._stack.append([context, entry, memory, peak])
+
+    def on_node_exit(self, context: ValidationContext, duration: float) -> None:
+        _, entry, memory, peak = self._stack.pop()
+        entry.calls += 1
+        entry.time += duration
+
+        if self.trace_memory:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            entry.memory = max(entry.memory or 0, peak - memory)
+            if self._stack:
+                frame = self._stack[-1]
+                frame[3] = max(frame[3], peak)
+            elif self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+
+
+@attrs.define(init=False, repr=False, eq=False, on_setattr=attrs.setters.NO_OP)
 class ValidationContext:
     """
     Context for tracking validation state during schema tree traversal.
@@ -65,14 +478,123 @@ class ValidationContext:
 
     result : ValidationResult, optional
         Shared result object for collecting errors in lazy mode.
+
+    max_errors : int, optional
+        Lazy mode only. Maximum number of errors to collect. Once it is
+        reached, traversal of the schema tree stops and the result is marked as
+        truncated.
+
+    max_errors_per_path : int, optional
+        Lazy mode only. Maximum number of errors to collect for a single path.
+        Additional errors at that path are dropped and the result is marked as
+        truncated, but traversal continues.
+
+    defer_values : bool, default: False
+        If ``True``, value checks do not compute their statistics: they
+        register them with :meth:`defer`, and the caller computes all of them
+        at once after traversal (see :meth:`.ValidationPlan.validate`).
+
+    profile : bool, default: False
+        If ``True``, the wall time and call count of each visited path are
+        recorded in :attr:`.ValidationResult.profile` (see
+        :meth:`.ValidationResult.get_profile_table`). When disabled,
+        profiling costs one attribute lookup per visited schema node.
+
+    trace_memory : bool, default: False
+        If ``True``, profiling is enabled and also records the peak memory
+        allocated while visiting each path, traced with :mod:`tracemalloc`
+        (which slows validation down significantly). Requires Python 3.9+.
+
+    observers : iterable of ValidationObserver, optional
+        Observers notified of the events of this validation run, in addition
+        to globally registered observers (see :func:`register_observer`).
+        Observers are collected when the context is created; without any
+        observer, notifications cost one attribute lookup per visited schema
+        node.
+
+    Raises
+    ------
+    ValueError
+        If an error budget is not positive, or if memory tracing is requested
+        on Python < 3.9.
+
+    Notes
+    -----
+    Contexts are parent-linked: :meth:`push` only allocates a small node
+    holding a reference to its parent and the added path component. The full
+    path is assembled on demand, *i.e.* when an error is recorded.
+
+    Examples
+    --------
+    >>> schema = xv.DataArraySchema(dtype="int64", attrs={"units": {"value": "m"}})
+    >>> context = xv.ValidationContext(mode="lazy", profile=True)
+    >>> result = schema.validate(xr.DataArray([1, 2]), context)
+    >>> list(result.profile)
+    ['<root>', 'dtype', 'attrs']
+    >>> result.profile["dtype"].calls
+    1
     """
 
-    path: list[str] = attrs.field(factory=list, converter=list)
-    mode: ValidationMode = attrs.field(
-        default=ValidationMode.EAGER,
-        converter=lambda x: ValidationMode(x.lower() if isinstance(x, str) else x),
-    )
-    result: ValidationResult = attrs.field(factory=ValidationResult)
+    mode: ValidationMode
+    result: ValidationResult
+    notifier: Optional[_Notifier]
+    _run: _RunState
+    _parent: Optional[ValidationContext]
+    _component: Optional[str]
+    _prefix: Tuple[str, ...]
+
+    def __init__(
+        self,
+        path: Iterable[str] = (),
+        mode: ValidationMode | str = ValidationMode.EAGER,
+        result: ValidationResult | None = None,
+        max_errors: int | None = None,
+        max_errors_per_path: int | None = None,
+        defer_values: bool = False,
+        profile: bool = False,
+        trace_memory: bool = False,
+        observers: Iterable[ValidationObserver] = (),
+    ):
+        self.mode = _convert_mode(mode)
+        self.result = result if result is not None else ValidationResult()
+        if trace_memory and sys.version_info < (3, 9):
+            raise ValueError("memory tracing requires Python 3.9 or later")
+        profiler = (
+            _Profiler(self.result.profile, trace_memory)
+            if profile or trace_memory
+            else None
+        )
+        observers = [*_observers, *observers]
+        if profiler is not None:
+            observers.append(profiler)
+        #: Dispatcher of observer events, or ``None`` if there is no observer
+        self.notifier = _Notifier(observers) if observers else None
+        self._run = _RunState(
+            max_errors=max_errors,
+            max_errors_per_path=max_errors_per_path,
+            deferred=[] if defer_values else None,
+            profiler=profiler,
+        )
+        self._parent = None
+        self._component = None
+        self._prefix = tuple(path)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(path={self.path!r}, mode={self.mode!r}, "
+            f"result={self.result!r})"
+        )
+
+    @property
+    def path(self) -> list[str]:
+        """Current validation path through the schema tree."""
+        components = []
+        node = self
+        while node._parent is not None:
+            components.append(node._component)
+            node = node._parent
+        components.reverse()
+        return [*node._prefix, *components]
 
     def push(self, component: str) -> ValidationContext:
         """
@@ -88,20 +610,88 @@ class ValidationContext:
         ValidationContext
             New context with extended path sharing the same mode and result.
         """
-        return ValidationContext(
-            path=self.path + [component], mode=self.mode, result=self.result
-        )
+        # Bypass __init__: this is called for every visited schema node
+        child = object.__new__(ValidationContext)
+        child.mode = self.mode
+        child.result = self.result
+        child.notifier = self.notifier
+        child._run = self._run
+        child._parent = self
+        child._component = component
+        child._prefix = ()
+        return child
+
+    @property
+    def max_errors(self) -> int | None:
+        """Maximum number of collected errors in lazy mode."""
+        return self._run.max_errors
+
+    @property
+    def max_errors_per_path(self) -> int | None:
+        """Maximum number of collected errors per path in lazy mode."""
+        return self._run.max_errors_per_path
+
+    @property
+    def stopped(self) -> bool:
+        """Whether the error budget is spent and traversal should stop."""
+        return self._run.stopped
+
+    @property
+    def profiler(self) -> Optional[_Profiler]:
+        """Profiler of this validation run, or ``None`` if profiling is off."""
+        return self._run.profiler
+
+    @property
+    def defers_values(self) -> bool:
+        """Whether value statistics are deferred (see :meth:`defer`)."""
+        return self._run.deferred is not None
+
+    def defer(self, statistics: Any, callback: Callable) -> None:
+        """
+        Register uncomputed value statistics for later validation.
+
+        Parameters
+        ----------
+        statistics
+            Value statistics, possibly lazy (Dask collections).
+
+        callback : callable
+            Validation function called as ``callback(computed, context)``
+            once statistics are computed, with this context.
+        """
+        self._run.deferred.append((statistics, callback, self))
+
+    def pop_deferred(self) -> list:
+        """
+        Get and clear registered ``(statistics, callback, context)`` triplets.
+        """
+        deferred = self._run.deferred
+        self._run.deferred = []
+        return deferred
+
+    def stop(self) -> None:
+        """
+        Stop the traversal of the schema tree.
+
+        Steps which have not started yet are skipped and the result is marked
+        as truncated. This is used to cancel a validation running in another
+        thread.
+        """
+        self._run.stopped = True
+        self.result.truncated = True
 
     def get_path_string(self) -> str:
         """Get current path as dot-separated string."""
-        return ".".join(self.path) if self.path else "<root>"
+        path = self.path
+        return ".".join(path) if path else "<root>"
 
     def handle_error(self, error: SchemaError) -> None:
         """
         Handle validation error based on mode.
 
         * In EAGER mode: raise the error immediately
-        * In LAZY mode: collect error in result object
+        * In LAZY mode: collect error in result object, within the limits of
+          the error budget
 
         Parameters
         ----------
@@ -109,9 +699,31 @@ class ValidationContext:
             Validation error to handle.
         """
         if self.mode == ValidationMode.EAGER:
+            if self.notifier is not None:
+                self.notifier.error(self, error)
             raise error
-        else:  # LAZY mode
-            self.result.add_error(self.get_path_string(), error)
+
+        # LAZY mode
+        run = self._run
+        if run.stopped:
+            return
+
+        path = self.get_path_string()
+
+        if run.max_errors_per_path is not None:
+            count = run.path_counts.get(path, 0)
+            if count >= run.max_errors_per_path:
+                self.result.truncated = True
+                return
+            run.path_counts[path] = count + 1
+
+        self.result.add_error(path, error)
+        if self.notifier is not None:
+            self.notifier.error(self, error)
+
+        if run.max_errors is not None and len(self.result.errors) >= run.max_errors:
+            run.stopped = True
+            self.result.truncated = True
 
     def get_errors(self) -> List[tuple[str, SchemaError]]:
         """Get all collected errors with their paths."""
@@ -152,8 +764,148 @@ def raise_or_handle(
             raise error
 
 
+def _format_dtype_mismatch(got, expected) -> str:
+    return f"dtype mismatch: got {got!r}, expected " + (
+        f"{expected[0]!r}" if len(expected) == 1 else f"one of {expected!r}"
+    )
+
+
+def _time_formatter(times) -> Callable[[Any], Any]:
+    # datetime64 values are shown as pandas timestamps
+    if times.dtype.kind == "M":
+        import pandas as pd
+
+        return pd.Timestamp
+    return lambda value: value
+
+
+def _format_time_gaps(count, missing, positions, sizes, times, step) -> str:
+    # Only the ranges shown in the message are converted to timestamps
+    as_time = _time_formatter(times)
+    shown = ", ".join(
+        f"{as_time(times[i] + step)} to {as_time(times[i + 1] - step)} ({n})"
+        for i, n in zip(positions[:3], sizes[:3])
+    )
+    return f"{count} gaps ({missing} missing timestamps): {shown}" + (
+        ", ..." if count > 3 else ""
+    )
+
+
+def _format_time_duplicates(count, positions, sizes, times) -> str:
+    as_time = _time_formatter(times)
+    shown = ", ".join(
+        f"{as_time(times[i])} (x{n})" for i, n in zip(positions[:3], sizes[:3])
+    )
+    return f"{count} duplicated timestamps: {shown}" + (", ..." if count > 3 else "")
+
+
+#: Message templates of the built-in error codes. Templates are either format
+#: strings or callables, both receiving the error parameters as keyword
+#: arguments.
+ERROR_MESSAGES: Dict[str, Union[str, Callable[..., str]]] = {
+    "dtype_mismatch": _format_dtype_mismatch,
+    "dims_count_mismatch": "dimension number mismatch: got {got}, expected {expected}",
+    "dims_mismatch": "dimension mismatch in axis {axis}: "
+    "got {got}, expected {expected}",
+    "dims_missing": "dimension mismatch: expected {expected} is missing from "
+    "actual dimension list {got}",
+    "shape_count_mismatch": "dimension count mismatch: got {got}, expected {expected}",
+    "shape_mismatch": "shape mismatch in axis {axis}: got {got}, expected {expected}",
+    "name_mismatch": "name mismatch: got {got}, expected {expected}",
+    "not_chunked": "expected array to be chunked but it is not",
+    "unexpected_chunks": "expected unchunked array but it is chunked",
+    "chunks_mismatch": "chunk mismatch for {dim}: got {got}, expected {expected}",
+    "array_type_mismatch": "array type mismatch: got {got}, expected {expected}",
+    "attr_type_mismatch": "attribute type mismatch {got} is not of type {expected}",
+    "attr_pattern_mismatch": "attribute value {got!r} does not match pattern "
+    "{expected!r}",
+    "attr_value_mismatch": "name {got} != {expected}",
+    "units_not_string": "Unit validation requires attribute to be a string, got "
+    "{got.__name__}",
+    "units_invalid": "{prefix} '{got}': {reason}",
+    "units_mismatch": "Unit mismatch: expected '{expected}' "
+    "(or equivalent like '{expected_unit:~}'), got '{got}'",
+    "units_incompatible": "Unit '{got}' is not compatible with '{expected}'. "
+    "Expected dimensionality: {expected_unit.dimensionality}, "
+    "got: {got_unit.dimensionality}",
+    "missing_keys": "{label} has missing keys: {keys}",
+    "extra_keys": "{label} has extra keys: {keys}",
+    "key_missing": "key {key} not in {label}",
+    "file_unreadable": "cannot open file {path}: {reason}",
+    "values_below_min": "minimum value {got} is below lower bound {expected}",
+    "values_above_max": "maximum value {got} is above upper bound {expected}",
+    "nan_fraction_exceeded": "NaN fraction {got:.3g} exceeds {expected}",
+    "values_not_finite": "array contains non-finite values",
+    "index_not_monotonic": "index is not monotonically {expected}",
+    "index_not_unique": "index has duplicate values",
+    "index_not_regular": "index is not regularly spaced: got step {got} at "
+    "position {position}, expected {expected}",
+    "check_failed": "check {check} failed: {error!r}",
+    "time_off_cadence": "{count} time steps do not match frequency {freq}, first "
+    "at position {position} (got {got})",
+    "time_gaps": _format_time_gaps,
+    "time_duplicates": _format_time_duplicates,
+    "chunks_out_of_range": "{count} chunks out of range, first at block {block} "
+    "(element offset {offset})",
+    "chunks_not_finite": "{count} chunks contain non-finite values, first at block "
+    "{block} (element offset {offset})",
+}
+
+
 class SchemaError(Exception):
-    """Custom schema error."""
+    """
+    Custom schema error.
+
+    Errors raised by the library carry a machine-readable :attr:`code` and the
+    :attr:`params` describing the failure. The human-readable message is only
+    rendered when the error is converted to a string, which keeps error
+    collection cheap in lazy mode.
+
+    Parameters
+    ----------
+    message : str, optional
+        Error message. If unset, the message is rendered from the template
+        registered for ``code`` in :data:`ERROR_MESSAGES`.
+
+    code : str, default: "schema_error"
+        Machine-readable error code.
+
+    **params
+        Error parameters, used to render the message.
+
+    Examples
+    --------
+    >>> error = SchemaError(code="name_mismatch", got="foo", expected="bar")
+    >>> error.code, error.params
+    ('name_mismatch', {'got': 'foo', 'expected': 'bar'})
+    >>> str(error)
+    'name mismatch: got foo, expected bar'
+    """
+
+    def __init__(
+        self, message: str | None = None, *, code: str = "schema_error", **params
+    ):
+        if message is None:
+            super().__init__()
+        else:
+            super().__init__(message)
+        self._message = message
+        self.code = code
+        self.params = params
+
+    def __str__(self) -> str:
+        if self._message is None:
+            template = ERROR_MESSAGES.get(self.code)
+            if template is None:
+                self._message = ", ".join(f"{k}={v!r}" for k, v in self.params.items())
+            elif callable(template):
+                self._message = template(**self.params)
+            else:
+                self._message = template.format(**self.params)
+        return self._message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
 
 
 class BaseSchema(ABC):
@@ -241,3 +993,30 @@ class BaseSchema(ABC):
             If validation fails.
         """
         pass
+
+    def is_valid(self, value: Any, *args) -> bool:
+        """
+        Check whether an object is valid against this schema.
+
+        Unlike :meth:`validate`, this method returns a boolean and does not
+        raise. The base implementation wraps :meth:`validate`; subclasses
+        override it with predicates that do not instantiate errors.
+
+        Parameters
+        ----------
+        value
+            Object to validate.
+
+        *args
+            Additional arguments passed to :meth:`validate`, if any.
+
+        Returns
+        -------
+        bool
+            ``True`` if ``value`` passes validation, ``False`` otherwise.
+        """
+        try:
+            self.validate(value, *args)
+        except SchemaError:
+            return False
+        return True
@@ -0,0 +1,206 @@
+"""Concurrent validation of object collections."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import os
+from typing import Any, Callable, Iterable, Iterator, Literal, Optional, Tuple, Union
+
+import xarray as xr
+
+from .base import SchemaError, ValidationResult
+
+#: Validation callable used by pool workers, set by :func:`_init_worker`
+_worker_validate: Optional[Callable] = None
+
+#: File opening callable used by pool workers, set by :func:`_init_file_worker`
+_worker_open: Optional[Callable] = None
+
+
+def _validator(schema: Any) -> Callable:
+    # Compile the schema once, unless it caches outcomes
+    return schema.validate if schema.cache is not None else schema.compile().validate
+
+
+def _init_worker(schema: Any) -> None:
+    # Process pool initializer: the schema is unpickled once per worker
+    global _worker_validate
+    _worker_validate = _validator(schema)
+
+
+def _validate_in_worker(obj: Any, mode: str) -> Optional[ValidationResult]:
+    return _worker_validate(obj, mode=mode)
+
+
+def validate_many(
+    schema: Any,
+    objects: Iterable[Any],
+    mode: Literal["eager", "lazy"] | None = None,
+    executor: Union[
+        Literal["thread", "process"], concurrent.futures.Executor, None
+    ] = None,
+    max_workers: int | None = None,
+    as_completed: bool = False,
+) -> Union[list, Iterator[Tuple[int, Optional[ValidationResult]]]]:
+    """
+    Validate many objects concurrently against a schema.
+
+    See :meth:`.DatasetSchema.validate_many` for details.
+    """
+    if mode is None:
+        mode = "eager"
+
+    objects = list(objects)
+    owned = not isinstance(executor, concurrent.futures.Executor)
+
+    if executor is None or executor == "thread":
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        validate = _validator(schema)
+        futures = [pool.submit(validate, obj, mode=mode) for obj in objects]
+    elif executor == "process":
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(schema,)
+        )
+        futures = [pool.submit(_validate_in_worker, obj, mode) for obj in objects]
+    elif not owned:
+        # User-provided executors may not run our initializer: the schema is
+        # shipped with each task
+        pool = executor
+        futures = [pool.submit(schema.validate, obj, mode=mode) for obj in objects]
+    else:
+        raise ValueError(
+            "executor must be 'thread', 'process' or a concurrent.futures.Executor "
+            f"instance (got {executor!r})"
+        )
+
+    if as_completed:
+        return _iter_completed(pool, futures, owned)
+
+    try:
+        return [future.result() for future in futures]
+    finally:
+        _shutdown(pool, futures, owned)
+
+
+def _iter_completed(
+    pool: concurrent.futures.Executor, futures: list, owned: bool
+) -> Iterator[Tuple[int, Optional[ValidationResult]]]:
+    indices = {future: i for i, future in enumerate(futures)}
+    try:
+        for future in concurrent.futures.as_completed(futures):
+            yield indices[future], future.result()
+    finally:
+        _shutdown(pool, futures, owned)
+
+
+def _shutdown(pool: concurrent.futures.Executor, futures: list, owned: bool) -> None:
+    # Pending tasks are cancelled if iteration stopped early (e.g. an error
+    # was raised in eager mode)
+    for future in futures:
+        future.cancel()
+    if owned:
+        pool.shutdown()
+
+
+def _init_file_worker(schema: Any) -> None:
+    # Process pool initializer: the schema is unpickled once per worker
+    global _worker_open
+    _init_worker(schema)
+    _worker_open = _opener(schema)
+
+
+def _open_and_validate(
+    open_: Callable,
+    validate: Callable,
+    path: Union[str, os.PathLike],
+    engine: Optional[str],
+    open_kwargs: dict,
+) -> ValidationResult:
+    # Unreadable files are reported as a validation error
+    try:
+        obj = open_(path, engine=engine, **open_kwargs)
+    except Exception as e:
+        result = ValidationResult()
+        result.add_error(
+            "<root>",
+            SchemaError(code="file_unreadable", path=str(path), reason=str(e)),
+        )
+        return result
+
+    with obj:
+        return validate(obj, mode="lazy")
+
+
+def _opener(schema: Any) -> Callable:
+    from .dataarray import DataArraySchema
+
+    return xr.open_dataarray if isinstance(schema, DataArraySchema) else xr.open_dataset
+
+
+def _validate_file(
+    path: Union[str, os.PathLike], engine: Optional[str], open_kwargs: dict
+) -> Tuple[Union[str, os.PathLike], ValidationResult]:
+    return path, _open_and_validate(
+        _worker_open, _worker_validate, path, engine, open_kwargs
+    )
+
+
+def validate_files(
+    schema: Any,
+    paths: Iterable[Union[str, os.PathLike]],
+    engine: Optional[str] = None,
+    workers: Optional[int] = None,
+    **open_kwargs,
+) -> Iterator[Tuple[Union[str, os.PathLike], ValidationResult]]:
+    """
+    Validate a collection of files in a process pool.
+
+    Each worker process receives the schema once, then opens the files it is
+    assigned and validates them in lazy mode. Files are opened lazily: data
+    is only loaded if the schema requires it.
+
+    Parameters
+    ----------
+    schema : DatasetSchema or DataArraySchema
+        Validation schema. It must be picklable. Files are opened with
+        :func:`xarray.open_dataset`, or :func:`xarray.open_dataarray` if
+        ``schema`` is a :class:`.DataArraySchema`.
+
+    paths : iterable of path-like
+        Paths to the validated files or stores.
+
+    engine : str, optional
+        Engine used to open files (*e.g.* ``"netcdf4"``, ``"h5netcdf"``,
+        ``"zarr"``). If unset, xarray guesses it from each file.
+
+    workers : int, optional
+        Number of worker processes. Defaults to the number of processors.
+
+    **open_kwargs
+        Additional keyword arguments passed to the function opening files.
+
+    Yields
+    ------
+    tuple[path-like, ValidationResult]
+        Paths and their validation results, in completion order. A file that
+        cannot be opened yields a result with a ``"file_unreadable"`` error.
+
+    Examples
+    --------
+    >>> schema = xv.DatasetSchema(data_vars={"t2m": {"dtype": "float32"}})
+    >>> for path, result in xv.validate_files(schema, paths):  # doctest: +SKIP
+    ...     if result.has_errors:
+    ...         print(path, result.get_error_summary())
+    """
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_file_worker, initargs=(schema,)
+    ) as pool:
+        futures = [
+            pool.submit(_validate_file, path, engine, open_kwargs) for path in paths
+        ]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,240 @@
+"""Memoization of validation outcomes."""
+
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import attrs
+import numpy as np
+
+from .base import SchemaError, ValidationContext
+from .plan import PlanStep, ValidationPlan
+
+#: Type of a cache entry: (relative path, error) pairs collected in lazy mode
+Outcome = Tuple[Tuple[str, SchemaError], ...]
+
+
+@attrs.define(eq=False)
+class ValidationCache:
+    """
+    Bounded LRU cache of validation outcomes, keyed by structural fingerprint.
+
+    A cache is attached to a :class:`.DataArraySchema` or
+    :class:`.DatasetSchema` through its ``cache`` parameter. The schema then
+    computes a fingerprint of the metadata it inspects (dtype, dims, shape,
+    chunks, name, attribute values, coordinate and data variable structure)
+    for each validated object. Objects sharing a fingerprint share the same
+    validation outcome, which is replayed from the cache without running the
+    validation plan.
+
+    Parameters
+    ----------
+    maxsize : int, default: 128
+        Maximum number of stored outcomes. When the cache is full, the least
+        recently used entry is evicted.
+
+    Notes
+    -----
+    * The cache is bypassed if the schema tree holds ``checks`` or ``values``
+      schemas: they inspect values, which are not part of the fingerprint.
+    * The cache is cleared when a field of the owning schema is reassigned.
+      In-place modifications of child schemas are not tracked: call
+      :meth:`clear` after making them.
+    * A cache holds outcomes for a single schema and should not be shared.
+    * Concurrent use from several threads is safe, but hit and miss counts
+      are then approximate.
+    """
+
+    maxsize: int = attrs.field(
+        default=128, validator=[attrs.validators.instance_of(int)]
+    )
+    hits: int = attrs.field(default=0, init=False)
+    misses: int = attrs.field(default=0, init=False)
+    _entries: OrderedDict = attrs.field(factory=OrderedDict, init=False, repr=False)
+
+    @maxsize.validator
+    def _maxsize_validator(self, attribute, value):
+        if value < 1:
+            raise ValueError(f"'maxsize' must be positive (got {value})")
+
+    @classmethod
+    def convert(cls, value: Any) -> Optional[ValidationCache]:
+        """
+        Convert a value to a cache.
+
+        ``True`` creates a cache with default settings, an integer sets the
+        cache size and ``False`` or ``None`` disable caching.
+        """
+        if value is None or value is False:
+            return None
+        if value is True:
+            return cls()
+        if isinstance(value, int):
+            return cls(maxsize=value)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Outcome]:
+        """
+        Look up an outcome and mark it as recently used.
+
+        Returns
+        -------
+        tuple or None
+            The cached outcome, or ``None`` on a cache miss.
+        """
+        try:
+            outcome = self._entries[key]
+            self._entries.move_to_end(key)
+        except KeyError:  # Also raised if evicted by a concurrent thread
+            self.misses += 1
+            return None
+        self.hits += 1
+        return outcome
+
+    def put(self, key: Hashable, outcome: Outcome) -> None:
+        """Store an outcome, evicting the least recently used one if needed."""
+        self._entries.pop(key, None)
+        self._entries[key] = outcome
+        while len(self._entries) > self.maxsize:
+            try:
+                self._entries.popitem(last=False)
+            except KeyError:  # Emptied by a concurrent thread
+                break
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def clear_cache(instance: Any, attribute: attrs.Attribute, value: Any) -> Any:
+    """
+    ``on_setattr`` hook clearing the cache of a schema when one of its fields
+    is reassigned.
+    """
+    if attribute.name != "cache" and instance.cache is not None:
+        instance.cache.clear()
+    return value
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Convert a metadata value to a hashable key.
+
+    Types are part of the key because schemas distinguish values that compare
+    equal (*e.g.* ``1`` and ``1.0``).
+
+    Raises
+    ------
+    TypeError
+        If the value cannot be converted.
+    """
+    if isinstance(value, np.ndarray):
+        return (np.ndarray, value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(freeze(v) for v in value))
+    if isinstance(value, dict):
+        return (dict, tuple((k, freeze(v)) for k, v in value.items()))
+    hash(value)
+    return (type(value), value)
+
+
+def fingerprint(func: Callable[[Any], Hashable], obj: Any) -> Optional[Hashable]:
+    """
+    Compute the fingerprint of an object.
+
+    Returns
+    -------
+    hashable or None
+        The fingerprint, or ``None`` if some metadata is not hashable.
+    """
+    try:
+        key = func(obj)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def collect(plan: ValidationPlan, obj: Any) -> Outcome:
+    """
+    Run a plan in lazy mode without error budget and collect its errors.
+
+    Observers are not notified: they see the events of the replay only.
+    """
+    context = ValidationContext(mode="lazy")
+    context.notifier = None
+    plan.run(obj, context)
+    return tuple(context.result.errors)
+
+
+def replay(outcome: Outcome, context: ValidationContext) -> None:
+    """
+    Replay cached errors in a validation context.
+
+    Errors are copied, so that raising them does not alter cached entries.
+    The error budget of ``context`` applies as if the errors were produced by
+    running the plan.
+    """
+    for path, error in outcome:
+        if context.stopped:
+            return
+        target = context if path == "<root>" else context.push(path)
+        target.handle_error(copy.copy(error))
+
+
+def cached_plan(
+    schema: Any, obj: Any, input_check: Optional[Callable[[Any], None]] = None
+) -> Optional[ValidationPlan]:
+    """
+    Make a plan replaying the cached validation outcome for an object.
+
+    On a cache miss, the schema is compiled and run on ``obj`` and the
+    outcome is stored.
+
+    Parameters
+    ----------
+    schema
+        Schema with a ``cache`` field and ``_has_checks()`` and
+        ``_fingerprint()`` methods.
+
+    obj
+        Validated object.
+
+    input_check : callable, optional
+        Input check applied to ``obj`` before computing its fingerprint.
+
+    Returns
+    -------
+    ValidationPlan or None
+        A plan replaying the outcome, or ``None`` if the cache does not apply.
+    """
+    cache = schema.cache
+    if cache is None or schema._has_checks():
+        return None
+
+    if input_check is not None:
+        input_check(obj)
+
+    key = fingerprint(schema._fingerprint, obj)
+    if key is None:
+        return None
+
+    outcome = cache.get(key)
+    if outcome is None:
+        outcome = collect(schema.compile(), obj)
+        cache.put(key, outcome)
+
+    def run(obj, context):
+        replay(outcome, context)
+
+    def test(obj):
+        return not outcome
+
+    return ValidationPlan([PlanStep(None, run, test)])
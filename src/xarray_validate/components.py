@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import functools
+import warnings
 from collections.abc import Iterable, Sequence
-from typing import Any, Dict, Hashable, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import attrs as _attrs
 import numpy as np
+import pandas as pd
+import xarray as xr
 from numpy.typing import DTypeLike
 
 from . import _match, converters
-from .base import BaseSchema, SchemaError, ValidationContext, raise_or_handle
+from .base import (
+    BaseSchema,
+    SampleCoverage,
+    SchemaError,
+    ValidationContext,
+    raise_or_handle,
+)
 from .types import ChunksT, DimsT, ShapeT
 
 
@@ -111,26 +132,21 @@ class DTypeSchema(BaseSchema):
             If validation fails.
         """
 
+        if not self.is_valid(dtype):
+            self_dtypes = self.dtype
+            if not isinstance(self_dtypes, tuple):
+                self_dtypes = (self_dtypes,)
+            error = SchemaError(code="dtype_mismatch", got=dtype, expected=self_dtypes)
+            raise_or_handle(error, context)
+
+    def is_valid(self, dtype: DTypeLike) -> bool:
+        # Inherit docstring
         self_dtypes = self.dtype
 
         if not isinstance(self_dtypes, tuple):
-            self_dtypes = (self_dtypes,)
+            return np.issubdtype(dtype, self_dtypes)
 
-        for self_dtype in self_dtypes:
-            if np.issubdtype(dtype, self_dtype):
-                passed = True
-                break
-        else:
-            passed = False
-
-        if not passed:
-            msg = f"dtype mismatch: got {repr(dtype)}, expected " + (
-                f"{repr(self_dtypes[0])}"
-                if len(self_dtypes) == 1
-                else f"one of {repr(self_dtypes)}"
-            )
-            error = SchemaError(msg)
-            raise_or_handle(error, context)
+        return any(np.issubdtype(dtype, self_dtype) for self_dtype in self_dtypes)
 
 
 @_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
@@ -212,7 +228,7 @@ class DimsSchema(BaseSchema):
 
         if len(self.dims) != len(dims):
             error = SchemaError(
-                f"dimension number mismatch: got {len(dims)}, expected {len(self.dims)}"
+                code="dims_count_mismatch", got=len(dims), expected=len(self.dims)
             )
             raise_or_handle(error, context)
 
@@ -220,19 +236,30 @@ class DimsSchema(BaseSchema):
             for i, (actual, expected) in enumerate(zip(dims, self.dims)):
                 if expected is not None and actual != expected:
                     error = SchemaError(
-                        f"dimension mismatch in axis {i}: got {actual}, "
-                        f"expected {expected}"
+                        code="dims_mismatch", axis=i, got=actual, expected=expected
                     )
                     raise_or_handle(error, context)
         else:
             for i, expected in enumerate(self.dims):
                 if expected is not None and expected not in dims:
                     error = SchemaError(
-                        f"dimension mismatch: expected {expected} is missing "
-                        f"from actual dimension list {dims}"
+                        code="dims_missing", got=dims, expected=expected
                     )
                     raise_or_handle(error, context)
 
+    def is_valid(self, dims: DimsT) -> bool:
+        # Inherit docstring
+        if len(self.dims) != len(dims):
+            return False
+
+        if self.ordered:
+            return all(
+                expected is None or actual == expected
+                for actual, expected in zip(dims, self.dims)
+            )
+        else:
+            return all(expected is None or expected in dims for expected in self.dims)
+
 
 @_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
 class ShapeSchema(BaseSchema):
@@ -290,18 +317,24 @@ class ShapeSchema(BaseSchema):
 
         if len(self.shape) != len(shape):
             error = SchemaError(
-                "dimension count mismatch: "
-                f"got {len(shape)}, expected {len(self.shape)}"
+                code="shape_count_mismatch", got=len(shape), expected=len(self.shape)
             )
             raise_or_handle(error, context)
 
         for i, (actual, expected) in enumerate(zip(shape, self.shape)):
             if expected is not None and actual != expected:
                 error = SchemaError(
-                    f"shape mismatch in axis {i}: got {actual}, expected {expected}"
+                    code="shape_mismatch", axis=i, got=actual, expected=expected
                 )
                 raise_or_handle(error, context)
 
+    def is_valid(self, shape: tuple) -> bool:
+        # Inherit docstring
+        return len(self.shape) == len(shape) and all(
+            expected is None or actual == expected
+            for actual, expected in zip(shape, self.shape)
+        )
+
 
 @_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
 class NameSchema(BaseSchema):
@@ -354,9 +387,13 @@ class NameSchema(BaseSchema):
         # - http://json-schema.org/understanding-json-schema/reference/regular_expressions.html
         # - https://docs.python.org/3.9/library/re.html
         if self.name != name:
-            error = SchemaError(f"name mismatch: got {name}, expected {self.name}")
+            error = SchemaError(code="name_mismatch", got=name, expected=self.name)
             raise_or_handle(error, context)
 
+    def is_valid(self, name: str) -> bool:
+        # Inherit docstring
+        return self.name == name
+
 
 @_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
 class ChunksSchema(BaseSchema):
@@ -432,14 +469,14 @@ class ChunksSchema(BaseSchema):
 
         if isinstance(self.chunks, bool):
             if self.chunks and not chunks:
-                error = SchemaError("expected array to be chunked but it is not")
+                error = SchemaError(code="not_chunked")
                 raise_or_handle(error, context)
             elif not self.chunks and chunks:
-                error = SchemaError("expected unchunked array but it is chunked")
+                error = SchemaError(code="unexpected_chunks")
                 raise_or_handle(error, context)
         elif isinstance(self.chunks, dict):
             if chunks is None:
-                error = SchemaError("expected array to be chunked but it is not")
+                error = SchemaError(code="not_chunked")
                 raise_or_handle(error, context)
             dim_chunks = dict(zip(dims, chunks))
             dim_sizes = dict(zip(dims, shape))
@@ -454,7 +491,7 @@ class ChunksSchema(BaseSchema):
                     ac = dim_chunks[key]
                     if any([a != ec for a in ac[:-1]]) or ac[-1] > ec:
                         error = SchemaError(
-                            f"chunk mismatch for {key}: got {ac}, expected {ec}"
+                            code="chunks_mismatch", dim=key, got=ac, expected=ec
                         )
                         raise_or_handle(error, context)
 
@@ -462,12 +499,39 @@ class ChunksSchema(BaseSchema):
                     ac = dim_chunks[key]
                     if ec is not None and tuple(ac) != tuple(ec):
                         error = SchemaError(
-                            f"chunk mismatch for {key}: got {ac}, expected {ec}"
+                            code="chunks_mismatch", dim=key, got=ac, expected=ec
                         )
                         raise_or_handle(error, context)
         else:
             raise ValueError(f"got unknown chunks type: {type(self.chunks)}")
 
+    def is_valid(
+        self,
+        chunks: Optional[Tuple[Tuple[int, ...], ...]],
+        dims: Tuple,
+        shape: Tuple[int, ...],
+    ) -> bool:
+        # Inherit docstring
+        if isinstance(self.chunks, bool):
+            return bool(chunks) == self.chunks
+
+        if chunks is None:
+            return False
+
+        dim_chunks = dict(zip(dims, chunks))
+        dim_sizes = dict(zip(dims, shape))
+        for key, ec in self.chunks.items():
+            ac = dim_chunks[key]
+            if isinstance(ec, int):
+                if ec < 0:
+                    ec = dim_sizes[key]
+                if any(a != ec for a in ac[:-1]) or ac[-1] > ec:
+                    return False
+            elif ec is not None and tuple(ac) != tuple(ec):
+                return False
+
+        return True
+
 
 @_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
 class ArrayTypeSchema(BaseSchema):
@@ -521,10 +585,843 @@ class ArrayTypeSchema(BaseSchema):
 
         if not isinstance(array, self.array_type):
             error = SchemaError(
-                f"array type mismatch: got {type(array)}, expected {self.array_type}"
+                code="array_type_mismatch", got=type(array), expected=self.array_type
+            )
+            raise_or_handle(error, context)
+
+    def is_valid(self, array: Any) -> bool:
+        # Inherit docstring
+        return isinstance(array, self.array_type)
+
+
+#: Number of elements processed at once by the vectorised index passes
+_INDEX_BLOCK_SIZE = 1 << 20
+
+
+def _pairwise_any(values: np.ndarray, predicate: Callable) -> Optional[int]:
+    # Position of the first pair of consecutive values for which predicate
+    # holds, processed in blocks of views to bound memory use
+    for start in range(0, len(values) - 1, _INDEX_BLOCK_SIZE):
+        stop = min(start + _INDEX_BLOCK_SIZE, len(values) - 1)
+        mask = predicate(values[start:stop], values[start + 1 : stop + 1])
+        if mask.any():
+            return start + int(np.argmax(mask))
+    return None
+
+
+@_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
+class IndexSchema(BaseSchema):
+    """
+    Index properties schema.
+
+    This schema validates the ordering and spacing of a (dimension)
+    coordinate. Properties cached by the coordinate's pandas index (see
+    :attr:`xarray.DataArray.xindexes`) are used when available; otherwise,
+    coordinate values are checked with a vectorised pass which does not copy
+    them.
+
+    Parameters
+    ----------
+    monotonic : {"increasing", "decreasing"}, optional
+        Expected ordering of the coordinate values. Combine with
+        ``unique=True`` to require a strictly monotonic coordinate.
+
+    unique : bool, default: False
+        If ``True``, coordinate values must be unique.
+
+    regular : bool, default: False
+        If ``True``, coordinate values must be regularly spaced.
+
+    step : Any, optional
+        Expected spacing of consecutive values (*e.g.* ``1.0`` or
+        ``np.timedelta64(1, "h")``). Implies ``regular``.
+
+    tolerance : Any, optional
+        Absolute tolerance on the spacing of consecutive values. Defaults to
+        exact comparison for integer and datetime coordinates, and to
+        :math:`10^{-6}` times the step for floating-point coordinates.
+
+    Examples
+    --------
+    >>> schema = xv.IndexSchema(monotonic="increasing", unique=True, step=1)
+    >>> schema.is_valid(xr.DataArray([1, 2, 3], dims="x"))
+    True
+    >>> schema.is_valid(xr.DataArray([1, 2, 4], dims="x"))
+    False
+    """
+
+    monotonic: Optional[Literal["increasing", "decreasing"]] = _attrs.field(
+        default=None,
+        validator=_attrs.validators.optional(
+            _attrs.validators.in_(["increasing", "decreasing"])
+        ),
+    )
+    unique: bool = _attrs.field(default=False, converter=bool)
+    regular: bool = _attrs.field(default=False, converter=bool)
+    step: Optional[Any] = _attrs.field(default=None)
+    tolerance: Optional[Any] = _attrs.field(default=None)
+
+    def serialize(self) -> dict:
+        # Inherit docstring
+        return {
+            "monotonic": self.monotonic,
+            "unique": self.unique,
+            "regular": self.regular,
+            "step": self.step,
+            "tolerance": self.tolerance,
+        }
+
+    @classmethod
+    def deserialize(cls, obj: dict):
+        """
+        Instantiate schema from a dictionary.
+        """
+        return cls(**obj)
+
+    def _errors(self, coord: Any):
+        # Yield errors for a coordinate, cheapest checks first
+        index = _pandas_index(coord)
+        values = None
+
+        monotonic = False
+        if self.monotonic is not None:
+            if index is not None:
+                monotonic = (
+                    index.is_monotonic_increasing
+                    if self.monotonic == "increasing"
+                    else index.is_monotonic_decreasing
+                )
+            else:
+                values = _index_values(coord)
+                position = _pairwise_any(
+                    values, np.greater if self.monotonic == "increasing" else np.less
+                )
+                monotonic = position is None
+            if not monotonic:
+                yield SchemaError(code="index_not_monotonic", expected=self.monotonic)
+
+        if self.unique:
+            if index is not None:
+                # Cached by pandas. Its monotonicity check, which is cheap,
+                # flags strictly monotonic indexes as unique: run it first to
+                # avoid hashing values
+                index.is_monotonic_increasing
+                unique = index.is_unique
+            else:
+                values = _index_values(coord) if values is None else values
+                if monotonic:
+                    # Duplicates of monotonic values are neighbours
+                    unique = _pairwise_any(values, np.equal) is None
+                else:
+                    unique = pd.Index(values, copy=False).is_unique
+            if not unique:
+                yield SchemaError(code="index_not_unique")
+
+        if self.regular or self.step is not None:
+            if isinstance(index, pd.RangeIndex):
+                # Regular by construction: only the step needs checking
+                values = np.asarray(index[:2])
+            elif values is None:
+                values = index.to_numpy() if index is not None else _index_values(coord)
+            yield from self._spacing_errors(values)
+
+    def _spacing_errors(self, values: np.ndarray):
+        if values.size < 2:
+            return
+
+        # Work on integers for datetime-like values, in their own unit
+        step, tolerance, unit = self.step, self.tolerance, None
+        if values.dtype.kind in "mM":
+            unit = np.datetime_data(values.dtype)[0]
+            values = values.view(np.int64)
+            if step is not None:
+                step = _timedelta_to_int(step, unit)
+            if tolerance is not None:
+                tolerance = _timedelta_to_int(tolerance, unit)
+
+        if values.dtype.kind == "u":
+            # Unsigned differences wrap around: compute them as signed
+            # integers, one block at a time
+            def difference(a, b):
+                return b.astype(np.int64) - a.astype(np.int64)
+
+        else:
+
+            def difference(a, b):
+                return b - a
+
+        expected = difference(values[0], values[1]) if step is None else step
+        if tolerance is None:
+            inexact = np.issubdtype(values.dtype, np.inexact)
+            tolerance = 1e-6 * abs(expected) if inexact else 0
+
+        position = _pairwise_any(
+            values, lambda a, b: np.abs(difference(a, b) - expected) > tolerance
+        )
+        if position is not None:
+            got = difference(values[position], values[position + 1])
+            if unit is not None:
+                got = np.timedelta64(int(got), unit)
+                expected = np.timedelta64(int(expected), unit)
+            yield SchemaError(
+                code="index_not_regular",
+                got=got,
+                expected=expected,
+                position=position,
+            )
+
+    def validate(self, coord: Any, context: ValidationContext | None = None) -> None:
+        """
+        Validate coordinate index properties against this schema.
+
+        Parameters
+        ----------
+        coord : DataArray or pandas.Index or array-like
+            Coordinate to validate.
+
+        context : ValidationContext, optional
+            Validation context for tracking tree traversal state.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        SchemaError
+            If validation fails.
+        """
+        for error in self._errors(coord):
+            raise_or_handle(error, context)
+
+    def is_valid(self, coord: Any) -> bool:
+        # Inherit docstring
+        return next(self._errors(coord), None) is None
+
+
+def _pandas_index(coord: Any) -> Optional[pd.Index]:
+    # The already-built pandas index of a coordinate, if any
+    if isinstance(coord, pd.Index):
+        return coord
+    xindexes = getattr(coord, "xindexes", None)
+    if xindexes is not None and coord.name in xindexes:
+        index = getattr(xindexes[coord.name], "index", None)
+        if isinstance(index, pd.Index):
+            return index
+    return None
+
+
+def _timedelta_to_int(value: Any, unit: str) -> int:
+    return int(np.timedelta64(value).astype(f"m8[{unit}]").astype(np.int64))
+
+
+def _index_values(coord: Any) -> np.ndarray:
+    # Coordinate values, as a view where possible
+    variable = getattr(coord, "variable", coord)
+    values = variable.values if isinstance(variable, xr.Variable) else coord
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError("index properties can only be validated on 1D coordinates")
+    return values
+
+
+def _freq_to_timedelta(freq: Any) -> np.timedelta64:
+    # Only fixed frequencies have a constant step: calendar-dependent offsets
+    # (e.g. "MS") are rejected
+    if isinstance(freq, str):
+        freq = pd.tseries.frequencies.to_offset(freq)
+    return pd.Timedelta(freq).to_timedelta64()
+
+
+def _runs(positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Split sorted positions into runs of consecutive positions: get the
+    # first position and the length of each run
+    starts = np.flatnonzero(np.diff(positions, prepend=-2) != 1)
+    return positions[starts], np.diff(starts, append=positions.size)
+
+
+@_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
+class TimeAxisSchema(BaseSchema):
+    """
+    Time axis cadence schema.
+
+    This schema validates that a time coordinate follows a fixed frequency and
+    locates its gaps and duplicate timestamps. Consecutive timestamps are
+    compared in a vectorised pass over the int64 view of ``datetime64``
+    values; ``cftime`` values are converted to integers through
+    :class:`xarray.CFTimeIndex`. Gaps are reported as ranges of missing
+    timestamps and duplicates as runs, rather than one error per timestamp:
+    error parameters hold their positions (``positions``) and sizes
+    (``sizes``) as arrays, and timestamps are only computed for the ranges
+    shown in error messages.
+
+    Parameters
+    ----------
+    freq : str or timedelta-like
+        Expected fixed frequency, as a pandas frequency string (*e.g.*
+        ``"1h"``, ``"15min"``) or a timedelta.
+
+    allow_gaps : bool, default: False
+        Whether missing timestamps are allowed.
+
+    allow_duplicates : bool, default: False
+        Whether repeated timestamps are allowed.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> schema = xv.TimeAxisSchema(freq="1h")
+    >>> time = pd.date_range("2000-01-01", periods=6, freq="h")
+    >>> schema.is_valid(xr.DataArray(time, dims="time"))
+    True
+    >>> schema.is_valid(xr.DataArray(time.delete([2, 3]), dims="time"))
+    False
+    """
+
+    freq: Any = _attrs.field()
+    allow_gaps: bool = _attrs.field(default=False, converter=bool)
+    allow_duplicates: bool = _attrs.field(default=False, converter=bool)
+
+    @freq.validator
+    def _freq_validator(self, attribute, value):
+        try:
+            step = _freq_to_timedelta(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"'freq' must be a fixed frequency (got {value!r})") from e
+        if step <= np.timedelta64(0):
+            raise ValueError(f"'freq' must be positive (got {value!r})")
+
+    @property
+    def step(self) -> np.timedelta64:
+        """Expected step between consecutive timestamps."""
+        return _freq_to_timedelta(self.freq)
+
+    def serialize(self) -> dict:
+        # Inherit docstring
+        return {
+            "freq": self.freq,
+            "allow_gaps": self.allow_gaps,
+            "allow_duplicates": self.allow_duplicates,
+        }
+
+    @classmethod
+    def deserialize(cls, obj: dict):
+        """
+        Instantiate schema from a dictionary.
+        """
+        return cls(**obj)
+
+    def _time_steps(self, coord: Any) -> Tuple[np.ndarray, Any, Iterator[tuple]]:
+        # Get time values, the step as an offset applicable to them, and an
+        # iterator classifying consecutive differences, block by block
+        values = _index_values(coord)
+        if values.dtype.kind == "M":
+            unit = np.datetime_data(values.dtype)[0]
+            ints = values.view(np.int64)
+            offset = self.step
+        else:
+            index = _pandas_index(coord)
+            if not isinstance(index, xr.CFTimeIndex):
+                try:
+                    index = xr.CFTimeIndex(values)
+                except (TypeError, ValueError) as e:
+                    raise TypeError(
+                        "time axes must hold datetime64 or cftime values "
+                        f"(got {values.dtype})"
+                    ) from e
+            unit = "us"
+            ints = index.asi8
+            offset = pd.Timedelta(self.step).to_pytimedelta()
+
+        step = _timedelta_to_int(self.step, unit)
+
+        def blocks():
+            for start in range(0, len(ints) - 1, _INDEX_BLOCK_SIZE):
+                stop = min(start + _INDEX_BLOCK_SIZE, len(ints) - 1)
+                diff = ints[start + 1 : stop + 1] - ints[start:stop]
+                is_duplicate = diff == 0
+                is_gap = (diff > step) & (diff % step == 0)
+                is_irregular = (diff != step) & ~is_duplicate & ~is_gap
+                yield start, diff // step - 1, is_duplicate, is_gap, is_irregular
+
+        return values, offset, blocks()
+
+    def _errors(self, coord: Any):
+        # Yield errors for a time coordinate. Gaps and duplicates are kept as
+        # position arrays: timestamps are only built when messages are rendered
+        values, offset, blocks = self._time_steps(coord)
+
+        duplicates, gaps, missing, irregular = [], [], [], []
+        for start, n_missing, is_duplicate, is_gap, is_irregular in blocks:
+            duplicates.append(np.flatnonzero(is_duplicate) + start)
+            gaps.append(np.flatnonzero(is_gap) + start)
+            missing.append(n_missing[is_gap])
+            irregular.append(np.flatnonzero(is_irregular) + start)
+
+        irregular = np.concatenate(irregular) if irregular else np.array([], int)
+        if irregular.size:
+            position = int(irregular[0])
+            got = values[position + 1] - values[position]
+            yield SchemaError(
+                code="time_off_cadence",
+                count=irregular.size,
+                freq=self.freq,
+                position=position,
+                got=pd.Timedelta(got) if values.dtype.kind == "M" else got,
+            )
+
+        gaps = np.concatenate(gaps) if gaps else np.array([], int)
+        if gaps.size and not self.allow_gaps:
+            missing = np.concatenate(missing)
+            yield SchemaError(
+                code="time_gaps",
+                count=gaps.size,
+                missing=int(missing.sum()),
+                positions=gaps,
+                sizes=missing,
+                times=values,
+                step=offset,
+            )
+
+        duplicates = np.concatenate(duplicates) if duplicates else np.array([], int)
+        if duplicates.size and not self.allow_duplicates:
+            positions, lengths = _runs(duplicates)
+            yield SchemaError(
+                code="time_duplicates",
+                count=positions.size,
+                positions=positions,
+                sizes=lengths + 1,
+                times=values,
+            )
+
+    def validate(self, coord: Any, context: ValidationContext | None = None) -> None:
+        """
+        Validate a time coordinate against this schema.
+
+        Parameters
+        ----------
+        coord : DataArray or array-like
+            Time coordinate to validate, sorted in increasing order.
+
+        context : ValidationContext, optional
+            Validation context for tracking tree traversal state.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        SchemaError
+            If validation fails.
+        """
+        for error in self._errors(coord):
+            raise_or_handle(error, context)
+
+    def is_valid(self, coord: Any) -> bool:
+        # Inherit docstring
+        _, _, blocks = self._time_steps(coord)
+        for _, _, is_duplicate, is_gap, is_irregular in blocks:
+            if (
+                is_irregular.any()
+                or (not self.allow_gaps and is_gap.any())
+                or (not self.allow_duplicates and is_duplicate.any())
+            ):
+                return False
+        return True
+
+
+def _is_dask_collection(value: Any) -> bool:
+    return hasattr(value, "__dask_graph__")
+
+
+def _is_lazy(value: Any) -> bool:
+    # Blockwise statistics are lists of Dask delayed objects
+    if isinstance(value, list):
+        return any(_is_dask_collection(x) for x in value)
+    return _is_dask_collection(value)
+
+
+def compute_statistics(statistics: list[dict], scheduler: Any = None) -> list[dict]:
+    """
+    Compute value statistics gathered with :meth:`.ValuesSchema.statistics`.
+
+    All lazy (Dask) statistics are computed in a single :func:`dask.compute`
+    call, so that each array is read once, whatever the number of statistics
+    and arrays.
+
+    Parameters
+    ----------
+    statistics : list of dict
+        Statistics of one or several arrays.
+
+    scheduler : optional
+        Dask scheduler computing the statistics, *e.g.* a
+        :class:`distributed.Client`: statistics are then reduced on the
+        cluster and only their (small) values are gathered. Defaults to the
+        current Dask scheduler.
+
+    Returns
+    -------
+    list of dict
+        Computed statistics.
+    """
+    if any(_is_lazy(v) for stats in statistics for v in stats.values()):
+        import dask
+
+        with warnings.catch_warnings():  # All-NaN slices
+            warnings.simplefilter("ignore", RuntimeWarning)
+            (statistics,) = dask.compute(statistics, scheduler=scheduler)
+    return statistics
+
+
+def _first_offset(mask: np.ndarray) -> Optional[Tuple[int, ...]]:
+    # Offset of the first true element of a mask, if any
+    if not mask.any():
+        return None
+    return tuple(int(i) for i in np.unravel_index(np.argmax(mask), mask.shape))
+
+
+def _reduce_block(
+    block: np.ndarray, lower: Any, upper: Any, finite: bool, count_nan: bool
+) -> Tuple[Optional[Tuple[int, ...]], Optional[Tuple[int, ...]], int]:
+    # Reduce a chunk to the offsets of its first out-of-range and non-finite
+    # elements, and its NaN count. NaN values compare as in range.
+    out_of_range = np.zeros(block.shape, dtype=bool)
+    if lower is not None:
+        out_of_range |= block < lower
+    if upper is not None:
+        out_of_range |= block > upper
+    return (
+        _first_offset(out_of_range),
+        _first_offset(~np.isfinite(block)) if finite else None,
+        int(np.isnan(block).sum()) if count_nan else 0,
+    )
+
+
+@_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
+class ValuesSchema(BaseSchema):
+    """
+    Array values schema.
+
+    This schema validates array values through reductions: NumPy arrays are
+    reduced immediately, Dask arrays lazily (see :func:`compute_statistics`).
+
+    Parameters
+    ----------
+    min : Any, optional
+        Lower bound of the array values (inclusive). NaN values are ignored.
+
+    max : Any, optional
+        Upper bound of the array values (inclusive). NaN values are ignored.
+
+    max_nan_fraction : float, optional
+        Maximum allowed fraction of NaN values, between 0 and 1.
+
+    finite : bool, default: False
+        If ``True``, all values must be finite (no NaN or infinite value).
+
+    blockwise : bool, default: False
+        If ``True``, values are checked chunk by chunk and failures are
+        located: errors report the number of failing chunks, the index of the
+        first one in the chunk grid and the offset of its first failing
+        element. Unchunked arrays (including memory-mapped arrays and lazily
+        loaded file variables) are split into chunks of automatic size, so
+        that memory use is bounded by the chunk size. Requires Dask.
+
+    sample : int or float, optional
+        If set, only a random sample of the chunks is checked (this implies
+        ``blockwise``): an integer sets the number of sampled chunks, a float
+        between 0 and 1 the fraction of elements they must cover at least.
+        Only the sampled chunks are read. In lazy mode, the achieved coverage
+        and a confidence statement are recorded in
+        :attr:`.ValidationResult.coverage`.
+
+    seed : int, optional, default: 0
+        Seed of the chunk sampling. The same chunks are sampled on every run
+        unless it is set to ``None``.
+
+    Examples
+    --------
+    >>> import dask.array
+    >>> schema = xv.ValuesSchema(min=0, blockwise=True)
+    >>> schema.is_valid(dask.array.arange(0, 12, chunks=4))
+    True
+    >>> schema.is_valid(dask.array.arange(-2, 10, chunks=4))
+    False
+    """
+
+    min: Optional[Any] = _attrs.field(default=None)
+    max: Optional[Any] = _attrs.field(default=None)
+    max_nan_fraction: Optional[float] = _attrs.field(
+        default=None,
+        validator=_attrs.validators.optional(
+            [_attrs.validators.ge(0.0), _attrs.validators.le(1.0)]
+        ),
+    )
+    finite: bool = _attrs.field(default=False, converter=bool)
+    blockwise: bool = _attrs.field(default=False, converter=bool)
+    sample: Optional[Union[int, float]] = _attrs.field(default=None)
+    seed: Optional[int] = _attrs.field(default=0)
+
+    @sample.validator
+    def _sample_validator(self, attribute, value):
+        if value is None:
+            return
+        if isinstance(value, (bool, np.bool_)) or not isinstance(
+            value, (int, float, np.integer, np.floating)
+        ):
+            raise TypeError(f"'sample' must be an int or a float (got {value!r})")
+        if isinstance(value, (int, np.integer)):
+            if value < 1:
+                raise ValueError(f"'sample' must be positive (got {value!r})")
+        elif not 0.0 < value <= 1.0:
+            raise ValueError(
+                f"'sample' must be a fraction in (0, 1] when a float (got {value!r})"
+            )
+
+    def serialize(self) -> dict:
+        # Inherit docstring
+        return {
+            "min": self.min,
+            "max": self.max,
+            "max_nan_fraction": self.max_nan_fraction,
+            "finite": self.finite,
+            "blockwise": self.blockwise,
+            "sample": self.sample,
+            "seed": self.seed,
+        }
+
+    @classmethod
+    def deserialize(cls, obj: dict):
+        """
+        Instantiate schema from a dictionary.
+        """
+        return cls(**obj)
+
+    def statistics(self, data: Any) -> dict:
+        """
+        Gather the statistics required to validate array values.
+
+        Parameters
+        ----------
+        data : array-like or xarray.Variable
+            Array to validate.
+
+        Returns
+        -------
+        dict
+            Statistics, lazy if ``data`` is a Dask array or if
+            :attr:`blockwise` or :attr:`sample` is set.
+        """
+        if self.blockwise or self.sample is not None:
+            return self._block_statistics(data)
+
+        if isinstance(data, xr.Variable):
+            data = data.data
+
+        stats = {"size": data.size}
+        if data.size == 0:
+            return stats
+
+        inexact = np.issubdtype(data.dtype, np.inexact)
+        with warnings.catch_warnings():  # All-NaN slices
+            warnings.simplefilter("ignore", RuntimeWarning)
+            if self.min is not None:
+                stats["min"] = np.nanmin(data) if inexact else np.min(data)
+            if self.max is not None:
+                stats["max"] = np.nanmax(data) if inexact else np.max(data)
+        if inexact:
+            if self.max_nan_fraction is not None:
+                stats["nan_count"] = np.isnan(data).sum()
+            if self.finite:
+                stats["finite"] = np.isfinite(data).all()
+        return stats
+
+    def _block_statistics(self, data: Any) -> dict:
+        try:
+            import dask
+            import dask.array
+        except ImportError as e:
+            raise ImportError(
+                "Blockwise value validation requires dask. "
+                "Install it with: pip install dask"
+            ) from e
+
+        # Chunk unchunked arrays without loading them
+        if isinstance(data, xr.Variable):
+            data = (data if data.chunks is not None else data.chunk("auto")).data
+        elif not _is_dask_collection(data):
+            data = dask.array.from_array(data, chunks="auto")
+
+        stats = {"size": data.size}
+        if data.size == 0:
+            return stats
+
+        reduce = dask.delayed(_reduce_block, pure=True)
+        inexact = np.issubdtype(data.dtype, np.inexact)
+        finite = self.finite and inexact
+        count_nan = self.max_nan_fraction is not None and inexact
+        indices = list(np.ndindex(*data.numblocks))
+        if self.sample is not None:
+            indices, size = self._sample_blocks(indices, data.chunks)
+            stats["population"] = (data.npartitions, data.size)
+            stats["size"] = size
+
+        blocks = data.to_delayed()
+        stats["block_indices"] = indices
+        stats["blocks"] = [
+            reduce(blocks[index], self.min, self.max, finite, count_nan)
+            for index in indices
+        ]
+        return stats
+
+    def _sample_blocks(
+        self, indices: list, chunks: Tuple[Tuple[int, ...], ...]
+    ) -> Tuple[list, int]:
+        # Draw chunks at random; return their indices in grid order and
+        # their total number of elements
+        sizes = functools.reduce(
+            np.multiply.outer, chunks, np.ones((), dtype=np.int64)
+        ).ravel()
+        order = np.random.default_rng(self.seed).permutation(len(indices))
+        if isinstance(self.sample, (int, np.integer)):
+            n = min(int(self.sample), len(indices))
+        else:
+            covered = np.cumsum(sizes[order])
+            target = self.sample * covered[-1]
+            n = min(int(np.searchsorted(covered, target)) + 1, len(indices))
+        chosen = np.sort(order[:n])
+        return [indices[i] for i in chosen], int(sizes[chosen].sum())
+
+    def _coverage(self, stats: dict) -> SampleCoverage:
+        chunks_total, elements_total = stats["population"]
+        return SampleCoverage(
+            chunks_checked=len(stats["blocks"]),
+            chunks_total=chunks_total,
+            elements_checked=stats["size"],
+            elements_total=elements_total,
+            chunks_failed=sum(
+                block[0] is not None or block[1] is not None
+                for block in stats["blocks"]
+            ),
+        )
+
+    def _check_blocks(self, stats: dict):
+        # Yield errors for computed blockwise statistics
+        indices, blocks = stats["block_indices"], stats["blocks"]
+
+        for code, position in [("chunks_out_of_range", 0), ("chunks_not_finite", 1)]:
+            failing = [
+                (index, block[position])
+                for index, block in zip(indices, blocks)
+                if block[position] is not None
+            ]
+            if failing:
+                (block, offset) = failing[0]
+                yield SchemaError(
+                    code=code,
+                    count=len(failing),
+                    total=len(indices),
+                    block=block,
+                    offset=offset,
+                    blocks=[index for index, _ in failing],
+                )
+
+        if self.max_nan_fraction is not None:
+            fraction = sum(block[2] for block in blocks) / stats["size"]
+            if fraction > self.max_nan_fraction:
+                yield SchemaError(
+                    code="nan_fraction_exceeded",
+                    got=fraction,
+                    expected=self.max_nan_fraction,
+                )
+
+    def _check_statistics(self, stats: dict):
+        # Yield errors for computed statistics
+        if "blocks" in stats:
+            yield from self._check_blocks(stats)
+            return
+
+        got = stats.get("min")
+        if got is not None and got == got and got < self.min:  # Skip NaN
+            yield SchemaError(code="values_below_min", got=got, expected=self.min)
+
+        got = stats.get("max")
+        if got is not None and got == got and got > self.max:
+            yield SchemaError(code="values_above_max", got=got, expected=self.max)
+
+        if "nan_count" in stats:
+            fraction = stats["nan_count"] / stats["size"]
+            if fraction > self.max_nan_fraction:
+                yield SchemaError(
+                    code="nan_fraction_exceeded",
+                    got=fraction,
+                    expected=self.max_nan_fraction,
+                )
+
+        if not stats.get("finite", True):
+            yield SchemaError(code="values_not_finite")
+
+    def validate_statistics(
+        self, stats: dict, context: ValidationContext | None = None
+    ) -> None:
+        """
+        Validate computed statistics against this schema.
+
+        Parameters
+        ----------
+        stats : dict
+            Statistics gathered by :meth:`statistics` and computed.
+
+        context : ValidationContext, optional
+            Validation context for tracking tree traversal state.
+
+        Raises
+        ------
+        SchemaError
+            If validation fails.
+        """
+        if context is not None and "population" in stats:
+            context.result.add_coverage(
+                context.get_path_string(), self._coverage(stats)
             )
+        for error in self._check_statistics(stats):
             raise_or_handle(error, context)
 
+    def validate(self, data: Any, context: ValidationContext | None = None) -> None:
+        """
+        Validate array values against this schema.
+
+        Parameters
+        ----------
+        data : array-like or xarray.Variable
+            Array to validate.
+
+        context : ValidationContext, optional
+            Validation context for tracking tree traversal state.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        SchemaError
+            If validation fails.
+        """
+        stats = self.statistics(data)
+        if context is not None and context.defers_values:
+            context.defer(stats, self.validate_statistics)
+            return
+        (stats,) = compute_statistics([stats])
+        self.validate_statistics(stats, context)
+
+    def is_valid(self, data: Any) -> bool:
+        # Inherit docstring
+        (stats,) = compute_statistics([self.statistics(data)])
+        return next(self._check_statistics(stats), None) is None
+
 
 @_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
 class AttrSchema(BaseSchema):
@@ -605,7 +1502,7 @@ class AttrSchema(BaseSchema):
         if self.type is not None:
             if not isinstance(attr, self.type):
                 error = SchemaError(
-                    f"attribute type mismatch {attr} is not of type {self.type}"
+                    code="attr_type_mismatch", got=attr, expected=self.type
                 )
                 raise_or_handle(error, context)
 
@@ -617,24 +1514,22 @@ class AttrSchema(BaseSchema):
                 pattern = _match.pattern_to_regex(self.value)
                 if not pattern.fullmatch(attr_str):
                     error = SchemaError(
-                        f"attribute value {attr!r} does not match pattern "
-                        f"{self.value!r}"
+                        code="attr_pattern_mismatch", got=attr, expected=self.value
                     )
                     raise_or_handle(error, context)
             else:
                 # Exact match for non-pattern values
                 if self.value != attr:
-                    error = SchemaError(f"name {attr} != {self.value}")
+                    error = SchemaError(
+                        code="attr_value_mismatch", got=attr, expected=self.value
+                    )
                     raise_or_handle(error, context)
 
         # Unit validation
         if self.units is not None or self.units_compatible is not None:
             # Ensure attr is a string
             if not isinstance(attr, str):
-                error = SchemaError(
-                    "Unit validation requires attribute to be a string, got "
-                    f"{type(attr).__name__}"
-                )
+                error = SchemaError(code="units_not_string", got=type(attr))
                 raise_or_handle(error, context)
                 return
 
@@ -657,8 +1552,10 @@ class AttrSchema(BaseSchema):
 
                 if attr_unit != expected_unit:
                     error = SchemaError(
-                        f"Unit mismatch: expected '{self.units}' "
-                        f"(or equivalent like '{expected_unit:~}'), got '{attr}'"
+                        code="units_mismatch",
+                        got=attr,
+                        expected=self.units,
+                        expected_unit=expected_unit,
                     )
                     raise_or_handle(error, context)
 
@@ -674,13 +1571,32 @@ class AttrSchema(BaseSchema):
 
                 if not attr_unit.is_compatible_with(expected_unit):
                     error = SchemaError(
-                        f"Unit '{attr}' is not compatible with "
-                        f"'{self.units_compatible}'. "
-                        f"Expected dimensionality: {expected_unit.dimensionality}, "
-                        f"got: {attr_unit.dimensionality}"
+                        code="units_incompatible",
+                        got=attr,
+                        expected=self.units_compatible,
+                        got_unit=attr_unit,
+                        expected_unit=expected_unit,
                     )
                     raise_or_handle(error, context)
 
+    def is_valid(self, attr: Any) -> bool:
+        # Inherit docstring
+        if self.type is not None and not isinstance(attr, self.type):
+            return False
+
+        if self.value is not None:
+            if isinstance(self.value, str) and _match.is_pattern_key(self.value):
+                if not _match.pattern_to_regex(self.value).fullmatch(str(attr)):
+                    return False
+            elif self.value != attr:
+                return False
+
+        if self.units is not None or self.units_compatible is not None:
+            # Unit parsing may fail in several ways: delegate to validate()
+            return super().is_valid(attr)
+
+        return True
+
 
 @_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
 class AttrsSchema(BaseSchema):
@@ -697,11 +1613,27 @@ class AttrsSchema(BaseSchema):
 
     allow_extra_keys : bool
         Whether to allow coordinates not included in ``attrs`` dict.
+
+    Notes
+    -----
+    Pattern keys are compiled when ``attrs`` is assigned. Reassign the mapping
+    rather than modifying it in place.
     """
 
-    attrs: Dict[Hashable, AttrSchema] = _attrs.field(converter=dict)
+    attrs: Dict[Hashable, AttrSchema] = _attrs.field(
+        converter=dict,
+        on_setattr=[
+            _attrs.setters.convert,
+            _attrs.setters.validate,
+            _match.update_key_table,
+        ],
+    )
     require_all_keys: bool = _attrs.field(default=True)
     allow_extra_keys: bool = _attrs.field(default=True)
+    _key_table: _match.KeyTable = _attrs.field(init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        self._key_table = _match.KeyTable.from_mapping(self.attrs)
 
     def serialize(self) -> dict:
         # Inherit docstring
@@ -755,41 +1687,75 @@ class AttrsSchema(BaseSchema):
             If validation fails.
         """
 
-        # Separate exact keys from pattern keys and compile patterns
-        exact_keys, pattern_keys, compiled_patterns = _match.separate_keys(self.attrs)
+        # Exact and pattern keys are separated once, when attrs are assigned
+        key_table = self._key_table
+        exact_keys = key_table.exact_keys
 
         if self.require_all_keys:
             # Only check exact keys for require_all_keys
-            missing_keys = set(exact_keys) - set(attrs)
+            missing_keys = {key for key in exact_keys if key not in attrs}
             if missing_keys:
-                error = SchemaError(f"attrs has missing keys: {missing_keys}")
+                error = SchemaError(
+                    code="missing_keys", label="attrs", keys=missing_keys
+                )
                 raise_or_handle(error, context)
 
+        # Assign non-exact attributes to the pattern keys matching them, in a
+        # single pass
+        pattern_matches = []
+        extra_keys = set()
+        if key_table.matcher or not self.allow_extra_keys:
+            match = key_table.matcher.match
+            for attr_name in attrs:
+                if attr_name in exact_keys:
+                    continue
+                pattern_keys = match(attr_name)
+                if not pattern_keys:
+                    extra_keys.add(attr_name)
+                for pattern_key in pattern_keys:
+                    pattern_matches.append((attr_name, pattern_key))
+
         if not self.allow_extra_keys:
             # Check that all attributes match either exact or pattern keys
-            matched_attrs = _match.find_matched_keys(
-                attrs, exact_keys, compiled_patterns
-            )
-            extra_keys = set(attrs) - matched_attrs
             if extra_keys:
-                error = SchemaError(f"attrs has extra keys: {extra_keys}")
+                error = SchemaError(code="extra_keys", label="attrs", keys=extra_keys)
                 raise_or_handle(error, context)
 
         # Validate attributes matching exact keys
         for key, attr_schema in exact_keys.items():
             if key not in attrs:
-                error = SchemaError(f"key {key} not in attrs")
+                error = SchemaError(code="key_missing", key=key, label="attrs")
                 raise_or_handle(error, context)
             else:
                 child_context = context.push(f"attrs.{key}") if context else None
                 attr_schema.validate(attrs[key], child_context)
 
         # Validate attributes matching pattern keys
-        for pattern_key, attr_schema in pattern_keys.items():
-            regex = compiled_patterns[pattern_key]
+        pattern_keys = key_table.pattern_keys
+        for attr_name, pattern_key in pattern_matches:
+            child_context = context.push(f"attrs.{attr_name}") if context else None
+            pattern_keys[pattern_key].validate(attrs[attr_name], child_context)
+
+    def is_valid(self, attrs: Any) -> bool:
+        # Inherit docstring
+        key_table = self._key_table
+        exact_keys = key_table.exact_keys
+
+        for key, attr_schema in exact_keys.items():
+            if key not in attrs or not attr_schema.is_valid(attrs[key]):
+                return False
+
+        if key_table.matcher or not self.allow_extra_keys:
+            match = key_table.matcher.match
+            pattern_keys = key_table.pattern_keys
             for attr_name in attrs:
-                if regex.fullmatch(attr_name) and attr_name not in exact_keys:
-                    child_context = (
-                        context.push(f"attrs.{attr_name}") if context else None
-                    )
-                    attr_schema.validate(attrs[attr_name], child_context)
+                if attr_name in exact_keys:
+                    continue
+                matched = match(attr_name)
+                if not matched and not self.allow_extra_keys:
+                    return False
+                for pattern_key in matched:
+                    if not pattern_keys[pattern_key].is_valid(attrs[attr_name]):
+                        return False
+
+        return True
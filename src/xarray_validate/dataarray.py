@@ -1,39 +1,61 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Executor
 from typing import (
     Any,
     Callable,
     ClassVar,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
     Optional,
+    Union,
 )
 
 import attrs as _attrs
 import xarray as xr
 
-from . import _match
+from . import _match, _views, aio, batch
 from .base import (
     BaseSchema,
     SchemaError,
     ValidationContext,
-    ValidationMode,
     ValidationResult,
 )
+from .cache import ValidationCache, cached_plan, clear_cache, freeze
 from .components import (
     ArrayTypeSchema,
     AttrsSchema,
     ChunksSchema,
     DimsSchema,
     DTypeSchema,
+    IndexSchema,
     NameSchema,
     ShapeSchema,
+    TimeAxisSchema,
+    ValuesSchema,
+)
+from .headers import DataArrayHeader
+from .plan import (
+    PlanMemo,
+    PlanStep,
+    ValidationPlan,
+    attribute_step,
+    checks_step,
+    extra_keys_step,
+    invalidate_plans,
+    memoized_plan,
+    missing_keys_step,
 )
 
 
-@_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
+@_attrs.define(
+    on_setattr=[_attrs.setters.convert, _attrs.setters.validate, invalidate_plans]
+)
 class CoordsSchema(BaseSchema):
     r"""
     Schema container for Coordinates
@@ -55,11 +77,52 @@ class CoordsSchema(BaseSchema):
     allow_extra_keys : bool, default: True
         Whether to allow coordinates not included in ``coords`` dict.
         Coordinates matching pattern keys are not considered "extra".
+
+    indexes : dict, optional
+        Dict of coordinate names and ``IndexSchema`` objects validating index
+        properties (ordering, uniqueness, spacing). Keys are exact coordinate
+        names.
+
+    time_axes : dict, optional
+        Dict of coordinate names and ``TimeAxisSchema`` objects validating the
+        cadence of time coordinates. Keys are exact coordinate names.
+
+    Notes
+    -----
+    Pattern keys are compiled when ``coords`` is assigned, and the compiled
+    plan is memoized until a field is reassigned. Reassign mappings rather than
+    modifying them in place.
     """
 
-    coords: Dict[str, DataArraySchema] = _attrs.field()
+    coords: Dict[str, DataArraySchema] = _attrs.field(
+        on_setattr=[
+            _attrs.setters.convert,
+            _attrs.setters.validate,
+            _match.update_key_table,
+            invalidate_plans,
+        ]
+    )
     require_all_keys: bool = _attrs.field(default=True)
     allow_extra_keys: bool = _attrs.field(default=True)
+    indexes: Dict[str, IndexSchema] = _attrs.field(
+        factory=dict,
+        converter=lambda value: {
+            k: IndexSchema.convert(v) for k, v in (value or {}).items()
+        },
+    )
+    time_axes: Dict[str, TimeAxisSchema] = _attrs.field(
+        factory=dict,
+        converter=lambda value: {
+            k: TimeAxisSchema.convert(v) for k, v in (value or {}).items()
+        },
+    )
+    _key_table: _match.KeyTable = _attrs.field(
+        init=False, repr=False, eq=False, on_setattr=_attrs.setters.NO_OP
+    )
+    _plan: PlanMemo = _attrs.field(factory=PlanMemo, init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        self._key_table = _match.KeyTable.from_mapping(self.coords)
 
     def serialize(self) -> dict:
         obj = {
@@ -67,6 +130,10 @@ class CoordsSchema(BaseSchema):
             "allow_extra_keys": self.allow_extra_keys,
             "coords": {k: v.serialize() for k, v in self.coords.items()},
         }
+        if self.indexes:
+            obj["indexes"] = {k: v.serialize() for k, v in self.indexes.items()}
+        if self.time_axes:
+            obj["time_axes"] = {k: v.serialize() for k, v in self.time_axes.items()}
         return obj
 
     @classmethod
@@ -81,61 +148,177 @@ class CoordsSchema(BaseSchema):
         coords = {k: DataArraySchema.convert(v) for k, v in list(coords.items())}
         return cls(coords=coords, **kwargs)
 
-    def validate(
-        self, coords: Mapping[str, Any], context: ValidationContext | None = None
-    ) -> None:
-        # Inherit docstring
+    def compile(self) -> ValidationPlan:
+        """
+        Compile this schema into a reusable validation plan.
 
-        # Separate exact keys from pattern keys and compile patterns
-        exact_keys, pattern_keys, compiled_patterns = _match.separate_keys(self.coords)
+        The plan is memoized until a schema field is reassigned.
+
+        Returns
+        -------
+        ValidationPlan
+            Plan validating a coordinate mapping.
+        """
+        return memoized_plan(self._plan, self._compile)
+
+    def _compile(self) -> ValidationPlan:
+        # Exact and pattern keys are separated once, when coords are assigned
+        key_table = self._key_table
+        steps = []
 
         if self.require_all_keys:
             # Only check exact keys for require_all_keys
-            missing_keys = set(exact_keys) - set(coords)
-            if missing_keys:
-                error = SchemaError(f"coords has missing keys: {missing_keys}")
-                if context:
-                    context.handle_error(error)
-                else:
-                    raise error
+            steps.append(missing_keys_step("coords", key_table.exact_keys))
 
         if not self.allow_extra_keys:
             # Check that all coordinates match either exact or pattern keys
-            matched_coords = _match.find_matched_keys(
-                coords, exact_keys, compiled_patterns
-            )
-            extra_keys = set(coords) - matched_coords
-            if extra_keys:
-                error = SchemaError(f"coords has extra keys: {extra_keys}")
-                if context:
-                    context.handle_error(error)
-                else:
-                    raise error
+            steps.append(extra_keys_step("coords", key_table))
 
         # Validate coordinates matching exact keys
-        for key, da_schema in exact_keys.items():
-            if key not in coords:
-                error = SchemaError(f"key {key} not in coords")
-                if context:
-                    context.handle_error(error)
-                else:
-                    raise error
-            else:
-                child_context = context.push(f"coords.{key}") if context else None
-                da_schema.validate(coords[key], child_context)
+        for key, da_schema in key_table.exact_keys.items():
+            steps.append(_exact_coord_step(key, da_schema.compile()))
 
         # Validate coordinates matching pattern keys
-        for pattern_key, da_schema in pattern_keys.items():
-            regex = compiled_patterns[pattern_key]
-            for coord_name in coords:
-                if regex.fullmatch(coord_name) and coord_name not in exact_keys:
-                    child_context = (
-                        context.push(f"coords.{coord_name}") if context else None
-                    )
-                    da_schema.validate(coords[coord_name], child_context)
+        if key_table.pattern_keys:
+            plans = {
+                pattern_key: da_schema.compile()
+                for pattern_key, da_schema in key_table.pattern_keys.items()
+            }
+            steps.append(_pattern_coords_step(key_table, plans))
+
+        # Validate index properties and time axis cadences
+        for key, index_schema in self.indexes.items():
+            steps.append(_coord_property_step(key, "index", index_schema))
+        for key, time_axis_schema in self.time_axes.items():
+            steps.append(_coord_property_step(key, "time_axis", time_axis_schema))
+
+        return ValidationPlan(steps)
+
+    def validate(
+        self, coords: Mapping[str, Any], context: ValidationContext | None = None
+    ) -> None:
+        # Inherit docstring
+        if context is None:
+            context = ValidationContext()
+        self.compile().run(coords, context)
+
+    def is_valid(self, coords: Mapping[str, Any]) -> bool:
+        # Inherit docstring
+        return self.compile().test(coords)
+
+    def _has_checks(self) -> bool:
+        # Index properties and cadences depend on coordinate values
+        return bool(self.indexes or self.time_axes) or any(
+            da_schema._has_checks() for da_schema in self.coords.values()
+        )
+
+    def _fingerprint(self, coords: Mapping[str, Any]) -> tuple:
+        # Coordinate names and the metadata inspected by the governing schemas
+        key_table = self._key_table
+        claim = key_table.claim
+        schemas = {**key_table.pattern_keys, **key_table.exact_keys}
+        result = []
+        for name, coord in coords.items():
+            result.append(
+                (
+                    name,
+                    tuple(
+                        schemas[schema_key]._fingerprint(coord)
+                        for schema_key in claim(name)
+                    ),
+                )
+            )
+        return tuple(result)
 
 
-@_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
+def _exact_coord_step(key: str, plan: ValidationPlan) -> PlanStep:
+    path = f"coords.{key}"
+
+    def run(coords, context):
+        if key not in coords:
+            context.handle_error(
+                SchemaError(code="key_missing", key=key, label="coords")
+            )
+        else:
+            plan.run(coords[key], context.push(path))
+
+    def test(coords):
+        return key in coords and plan.test(coords[key])
+
+    return PlanStep(None, run, test)
+
+
+def _coord_property_step(key: str, name: str, schema: BaseSchema) -> PlanStep:
+    path = f"coords.{key}.{name}"
+
+    def run(coords, context):
+        if key not in coords:
+            context.handle_error(
+                SchemaError(code="key_missing", key=key, label="coords")
+            )
+        else:
+            schema.validate(coords[key], context.push(path))
+
+    def test(coords):
+        return key in coords and schema.is_valid(coords[key])
+
+    return PlanStep(None, run, test)
+
+
+def _pattern_coords_step(key_table: _match.KeyTable, plans: dict) -> PlanStep:
+    exact_keys = key_table.exact_keys
+    match = key_table.matcher.match
+
+    def run(coords, context):
+        # Coordinates are validated against all the pattern keys they match
+        for coord_name in coords:
+            if coord_name in exact_keys:
+                continue
+            for pattern_key in match(coord_name):
+                if context.stopped:
+                    return
+                plans[pattern_key].run(
+                    coords[coord_name], context.push(f"coords.{coord_name}")
+                )
+
+    def test(coords):
+        for coord_name in coords:
+            if coord_name in exact_keys:
+                continue
+            for pattern_key in match(coord_name):
+                if not plans[pattern_key].test(coords[coord_name]):
+                    return False
+        return True
+
+    return PlanStep(None, run, test)
+
+
+def _check_dataarray(da: Any) -> None:
+    if not isinstance(da, (xr.DataArray, DataArrayHeader)):
+        raise ValueError("Input must be an xarray.DataArray")
+
+
+def _chunks_step(schema: ChunksSchema) -> PlanStep:
+    validate = schema.validate
+    is_valid = schema.is_valid
+
+    def run(da, context):
+        validate(da.chunks, da.dims, da.shape, context)
+
+    def test(da):
+        return is_valid(da.chunks, da.dims, da.shape)
+
+    return PlanStep("chunks", run, test)
+
+
+@_attrs.define(
+    on_setattr=[
+        _attrs.setters.convert,
+        _attrs.setters.validate,
+        clear_cache,
+        invalidate_plans,
+    ]
+)
 class DataArraySchema(BaseSchema):
     """
     A lightweight xarray.DataArray validator.
@@ -168,8 +351,28 @@ class DataArraySchema(BaseSchema):
     array_type : type, optional
         Type of the underlying data in a DataArray (*e.g.* :class:`numpy.ndarray`).
 
+    values : ValuesSchema or dict, optional
+        Values validation schema. Statistics are computed in a single pass
+        over the data.
+
     checks : list of callables, optional
-        List of callables that will further validate the DataArray.
+        List of callables that will further validate the DataArray. Each check
+        is reported at path ``checks.<name>``, where ``<name>`` is the
+        function name (or the check index for lambdas). In lazy mode,
+        exceptions raised by checks are recorded as ``"check_failed"``
+        errors; the wall time of each check is recorded in
+        :attr:`.ValidationResult.check_durations`.
+
+    parallel_checks : bool or int, default: False
+        Whether to run ``checks`` concurrently on a thread pool (suitable
+        for checks which release the GIL, *e.g.* NumPy or Dask reductions).
+        An integer sets the number of threads; ``True`` uses one thread per
+        check.
+
+    cache : ValidationCache or bool or int, optional
+        Opt-in cache of validation outcomes keyed by the structure of the
+        validated DataArray (see :class:`.ValidationCache`). ``True`` enables a
+        cache with default settings; an integer sets the cache size.
     """
 
     _schema_slots: ClassVar = [
@@ -181,6 +384,7 @@ class DataArraySchema(BaseSchema):
         "chunks",
         "attrs",
         "array_type",
+        "values",
     ]
 
     dtype: Optional[DTypeSchema] = _attrs.field(
@@ -223,11 +427,32 @@ class DataArraySchema(BaseSchema):
         converter=_attrs.converters.optional(ArrayTypeSchema.convert),
     )
 
+    values: Optional[ValuesSchema] = _attrs.field(
+        default=None,
+        converter=_attrs.converters.optional(ValuesSchema.convert),
+    )
+
     checks: List[Callable] = _attrs.field(
         factory=list,
         validator=_attrs.validators.deep_iterable(_attrs.validators.is_callable()),
     )
 
+    parallel_checks: Union[bool, int] = _attrs.field(
+        default=False, validator=_attrs.validators.instance_of((bool, int))
+    )
+
+    cache: Optional[ValidationCache] = _attrs.field(
+        default=None,
+        converter=ValidationCache.convert,
+        validator=_attrs.validators.optional(
+            _attrs.validators.instance_of(ValidationCache)
+        ),
+        eq=False,
+        repr=False,
+    )
+
+    _plan: PlanMemo = _attrs.field(factory=PlanMemo, init=False, repr=False, eq=False)
+
     def serialize(self) -> dict:
         obj = {}
         for slot in self._schema_slots:
@@ -257,6 +482,8 @@ class DataArraySchema(BaseSchema):
             kwargs["array_type"] = ArrayTypeSchema.convert(obj["array_type"])
         if "attrs" in obj:
             kwargs["attrs"] = AttrsSchema.convert(obj["attrs"])
+        if "values" in obj:
+            kwargs["values"] = ValuesSchema.convert(obj["values"])
 
         return cls(**kwargs)
 
@@ -267,11 +494,95 @@ class DataArraySchema(BaseSchema):
         da_schema["attrs"] = {"attrs": da_schema["attrs"]}
         return cls.deserialize(da_schema)
 
+    def compile(self) -> ValidationPlan:
+        """
+        Compile this schema into a reusable validation plan.
+
+        The schema tree is walked once and unset slots are discarded, so
+        that running the plan only performs the required checks. This is
+        useful when validating many DataArrays against the same schema. The
+        plan is memoized until a schema field is reassigned.
+
+        Returns
+        -------
+        ValidationPlan
+            Plan validating a DataArray.
+
+        Examples
+        --------
+        >>> plan = xv.DataArraySchema(dtype="int64", dims=["x"]).compile()
+        >>> plan.validate(xr.DataArray(np.arange(3), dims="x"))
+        """
+        return memoized_plan(self._plan, self._compile)
+
+    def _compile(self, values: bool = True) -> ValidationPlan:
+        # If values is False, the values slot is skipped: the caller is then
+        # responsible for validating values (e.g. to fuse reductions)
+        steps = []
+
+        # Component slots are validated against the DataArray attribute of the
+        # same name
+        for slot in ["dtype", "name", "dims", "shape"]:
+            schema = getattr(self, slot)
+            if schema is not None:
+                steps.append(
+                    attribute_step(slot, slot, schema.validate, schema.is_valid)
+                )
+
+        if self.coords is not None:
+            # Coordinates are validated through views, which do not build a
+            # DataArray for each coordinate
+            coords_plan = self.coords.compile()
+            steps.append(
+                attribute_step(
+                    "coords", _views.coordinates, coords_plan.run, coords_plan.test
+                )
+            )
+
+        if self.chunks is not None:
+            steps.append(_chunks_step(self.chunks))
+
+        if self.attrs:
+            steps.append(
+                attribute_step(
+                    "attrs", "attrs", self.attrs.validate, self.attrs.is_valid
+                )
+            )
+
+        if self.array_type is not None:
+            steps.append(
+                attribute_step(
+                    "array_type",
+                    "data",
+                    self.array_type.validate,
+                    self.array_type.is_valid,
+                )
+            )
+
+        if values and self.values is not None:
+            steps.append(
+                attribute_step(
+                    "values", "variable", self.values.validate, self.values.is_valid
+                )
+            )
+
+        if self.checks:
+            # Checks receive a DataArray, even when validating a view
+            step = checks_step(self.checks, self._checks_workers())
+            steps.append(
+                attribute_step(step.path, _views.as_dataarray, step.run, step.test)
+            )
+
+        return ValidationPlan(steps, input_check=_check_dataarray)
+
     def validate(
         self,
         da: xr.DataArray,
         context: ValidationContext | None = None,
         mode: Literal["eager", "lazy"] | None = None,
+        max_errors: int | None = None,
+        max_errors_per_path: int | None = None,
+        client: Any = None,
     ) -> ValidationResult | None:
         """
         Validate an xarray.DataArray against this schema.
@@ -287,58 +598,212 @@ class DataArraySchema(BaseSchema):
         mode : {"eager", "lazy"}, optional
             Validation mode. If unset, the global default mode (eager) is used.
 
+        max_errors : int, optional
+            Lazy mode only. Stop validation after collecting this many errors
+            and mark the result as truncated. Ignored if ``context`` is passed.
+
+        max_errors_per_path : int, optional
+            Lazy mode only. Maximum number of errors collected for a single
+            path; further errors at that path are dropped. Ignored if
+            ``context`` is passed.
+
+        client : distributed.Client, optional
+            Distributed mode. Value statistics of the whole schema tree are
+            collected into a single task graph, submitted once to ``client``
+            (or any Dask scheduler), so that data is reduced where it lives
+            and only the statistics are gathered. ``checks`` still run in the
+            calling process. Ignored if ``context`` is passed.
+
         Returns
         -------
         ValidationResult or None
             In eager mode, this method returns ``None``. In lazy mode, it
             returns a :class:`ValidationResult` object.
+
+        Notes
+        -----
+        The compiled plan is memoized and reused until a schema field is
+        reassigned. Enable the ``cache`` if validated objects share their
+        structure.
+        """
+        plan = cached_plan(self, da, _check_dataarray) or self.compile()
+        return plan.validate(
+            da,
+            context,
+            mode,
+            max_errors=max_errors,
+            max_errors_per_path=max_errors_per_path,
+            client=client,
+        )
+
+    def is_valid(self, da: xr.DataArray) -> bool:
         """
+        Check whether an xarray.DataArray is valid against this schema.
 
-        if mode is None:
-            mode = "eager"
+        This method does not collect or raise schema errors: it returns as
+        soon as a check fails, which makes it much cheaper than
+        :meth:`validate` when only a pass/fail answer is needed (*e.g.* for
+        filtering or routing).
 
-        if context is None:
-            context = ValidationContext(mode=mode)
+        Parameters
+        ----------
+        da : DataArray
+            DataArray to validate.
 
-        if not isinstance(da, xr.DataArray):
-            raise ValueError("Input must be an xarray.DataArray")
+        Returns
+        -------
+        bool
+            ``True`` if ``da`` passes validation, ``False`` otherwise.
 
-        if context is None:
-            context = ValidationContext()
+        Raises
+        ------
+        ValueError
+            If ``da`` is not an xarray.DataArray.
+        """
+        plan = cached_plan(self, da, _check_dataarray) or self.compile()
+        return plan.is_valid(da)
 
-        if self.dtype is not None:
-            dtype_context = context.push("dtype")
-            self.dtype.validate(da.dtype, dtype_context)
+    async def avalidate(
+        self,
+        da: xr.DataArray,
+        mode: Literal["eager", "lazy"] | None = None,
+        max_errors: int | None = None,
+        max_errors_per_path: int | None = None,
+        executor: Executor | None = None,
+        limiter: asyncio.Semaphore | None = None,
+        offload: bool | None = None,
+    ) -> ValidationResult | None:
+        """
+        Validate an xarray.DataArray against this schema without blocking the
+        event loop.
+
+        Parameters
+        ----------
+        da : DataArray
+            DataArray to validate.
 
-        if self.name is not None:
-            name_context = context.push("name")
-            self.name.validate(da.name, name_context)
+        mode : {"eager", "lazy"}, optional
+            Validation mode. If unset, the global default mode (eager) is used.
 
-        if self.dims is not None:
-            dims_context = context.push("dims")
-            self.dims.validate(da.dims, dims_context)
+        max_errors : int, optional
+            Lazy mode only. Stop validation after collecting this many errors.
 
-        if self.shape is not None:
-            shape_context = context.push("shape")
-            self.shape.validate(da.shape, shape_context)
+        max_errors_per_path : int, optional
+            Lazy mode only. Maximum number of errors collected for a single
+            path.
 
-        if self.coords is not None:
-            coords_context = context.push("coords")
-            self.coords.validate(da.coords, coords_context)
+        executor : Executor, optional
+            Executor running blocking validations. Defaults to the event
+            loop's default executor.
 
-        if self.chunks is not None:
-            chunks_context = context.push("chunks")
-            self.chunks.validate(da.chunks, da.dims, da.shape, chunks_context)
+        limiter : asyncio.Semaphore, optional
+            Semaphore shared by concurrent validations to limit how many of
+            them run in ``executor`` at the same time.
 
-        if self.attrs:
-            attrs_context = context.push("attrs")
-            self.attrs.validate(da.attrs, attrs_context)
+        offload : bool, optional
+            Whether to run validation in ``executor``. If unset, it is
+            inferred from the schema and the validated object.
 
-        if self.array_type is not None:
-            array_type_context = context.push("array_type")
-            self.array_type.validate(da.data, array_type_context)
+        See :meth:`.DatasetSchema.avalidate` for details.
+        """
+        return await aio.avalidate(
+            self,
+            da,
+            mode=mode,
+            max_errors=max_errors,
+            max_errors_per_path=max_errors_per_path,
+            executor=executor,
+            limiter=limiter,
+            offload=offload,
+        )
+
+    def validate_many(
+        self,
+        objects: Iterable[xr.DataArray],
+        mode: Literal["eager", "lazy"] | None = None,
+        executor: Literal["thread", "process"] | Executor | None = None,
+        max_workers: int | None = None,
+        as_completed: bool = False,
+    ) -> list | Iterator[tuple[int, ValidationResult | None]]:
+        """
+        Validate many DataArrays concurrently against this schema.
+
+        Parameters
+        ----------
+        objects : iterable of DataArray
+            DataArrays to validate.
+
+        mode : {"eager", "lazy"}, optional
+            Validation mode applied to each object. If unset, the global
+            default mode (eager) is used.
+
+        executor : {"thread", "process"} or Executor, optional
+            Executor running validation tasks:
 
-        for check in self.checks:
-            check(da)
+            * ``"thread"`` (default): a thread pool, suitable when ``checks``
+              release the GIL (*e.g.* NumPy or Dask reductions);
+            * ``"process"``: a process pool, suitable for metadata-heavy
+              workloads; the schema is sent once to each worker process and
+              must be picklable;
+            * a :class:`concurrent.futures.Executor` instance, used as is and
+              not shut down; the schema is sent with each task.
 
-        return None if context.mode is ValidationMode.EAGER else context.result
+        max_workers : int, optional
+            Maximum number of workers of the created pool. Ignored if an
+            executor instance is passed.
+
+        as_completed : bool, default: False
+            If ``True``, return an iterator yielding ``(index, result)`` pairs
+            as validation tasks complete. Otherwise, return results in input
+            order.
+
+        Returns
+        -------
+        list or iterator
+            Per-object results of :meth:`validate`: ``None`` in eager mode, a
+            :class:`ValidationResult` in lazy mode.
+
+        Raises
+        ------
+        SchemaError
+            In eager mode, the error raised by the first invalid object
+            (in input order, or in completion order if ``as_completed`` is set).
+            Pending tasks are then cancelled.
+        """
+        return batch.validate_many(
+            self,
+            objects,
+            mode=mode,
+            executor=executor,
+            max_workers=max_workers,
+            as_completed=as_completed,
+        )
+
+    def _checks_workers(self) -> Optional[int]:
+        if self.parallel_checks is True:
+            return len(self.checks)
+        return self.parallel_checks or None
+
+    def _has_checks(self) -> bool:
+        # Value-level checks are not covered by fingerprints
+        return bool(self.checks or self.values) or (
+            self.coords is not None and self.coords._has_checks()
+        )
+
+    def _fingerprint(self, da: xr.DataArray) -> tuple:
+        # Only the metadata inspected by set slots is part of the fingerprint
+        result = []
+        for slot in ["dtype", "name", "dims", "shape", "chunks"]:
+            if getattr(self, slot) is not None:
+                result.append(freeze(getattr(da, slot)))
+        if self.chunks is not None:
+            # Chunks are validated against dimension names and sizes
+            result.append(freeze(da.dims))
+            result.append(freeze(da.shape))
+        if self.coords is not None:
+            result.append(self.coords._fingerprint(_views.coordinates(da)))
+        if self.attrs:
+            result.append(freeze(da.attrs))
+        if self.array_type is not None:
+            result.append(type(da.data))
+        return tuple(result)
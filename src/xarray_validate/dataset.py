@@ -1,23 +1,38 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Iterable, Literal, Optional, Union
+import asyncio
+import os
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, Iterator, Literal, Optional, Union
 
 import attrs as _attrs
 import xarray as xr
 
-from . import _match
-from .base import (
-    BaseSchema,
-    SchemaError,
-    ValidationContext,
-    ValidationMode,
-    ValidationResult,
-)
-from .components import AttrsSchema
+from . import _match, _views, aio, batch, headers
+from .base import BaseSchema, SchemaError, ValidationContext, ValidationResult
+from .cache import ValidationCache, cached_plan, clear_cache, freeze
+from .components import AttrsSchema, compute_statistics
 from .dataarray import CoordsSchema, DataArraySchema
+from .plan import (
+    PlanMemo,
+    PlanStep,
+    ValidationPlan,
+    attribute_step,
+    checks_step,
+    invalidate_plans,
+    memoized_plan,
+    missing_keys_step,
+)
 
 
-@_attrs.define(on_setattr=[_attrs.setters.convert, _attrs.setters.validate])
+@_attrs.define(
+    on_setattr=[
+        _attrs.setters.convert,
+        _attrs.setters.validate,
+        clear_cache,
+        invalidate_plans,
+    ]
+)
 class DatasetSchema(BaseSchema):
     r"""
     A lightweight xarray.Dataset validator.
@@ -47,7 +62,29 @@ class DatasetSchema(BaseSchema):
         Attributes value validation schema.
 
     checks : list of callables, optional
-        List of callables that will further validate the Dataset.
+        List of callables that will further validate the Dataset. Each check
+        is reported at path ``checks.<name>``, where ``<name>`` is the
+        function name (or the check index for lambdas). In lazy mode,
+        exceptions raised by checks are recorded as ``"check_failed"``
+        errors; the wall time of each check is recorded in
+        :attr:`.ValidationResult.check_durations`.
+
+    parallel_checks : bool or int, default: False
+        Whether to run ``checks`` concurrently on a thread pool (suitable
+        for checks which release the GIL, *e.g.* NumPy or Dask reductions).
+        An integer sets the number of threads; ``True`` uses one thread per
+        check.
+
+    cache : ValidationCache or bool or int, optional
+        Opt-in cache of validation outcomes keyed by the structure of the
+        validated Dataset (see :class:`.ValidationCache`). ``True`` enables a
+        cache with default settings; an integer sets the cache size.
+
+    Notes
+    -----
+    Pattern keys are compiled when ``data_vars`` is assigned, and the compiled
+    plan is memoized until a field is reassigned. Reassign mappings rather
+    than modifying them in place.
     """
 
     data_vars: Optional[Dict[str, Optional[DataArraySchema]]] = _attrs.field(
@@ -58,6 +95,13 @@ class DatasetSchema(BaseSchema):
                 for k, v in x.items()
             }
         ),
+        on_setattr=[
+            _attrs.setters.convert,
+            _attrs.setters.validate,
+            _match.update_key_table,
+            clear_cache,
+            invalidate_plans,
+        ],
     )
 
     require_all_keys: bool = _attrs.field(default=True)
@@ -79,6 +123,32 @@ class DatasetSchema(BaseSchema):
         validator=_attrs.validators.deep_iterable(_attrs.validators.is_callable()),
     )
 
+    parallel_checks: Union[bool, int] = _attrs.field(
+        default=False, validator=_attrs.validators.instance_of((bool, int))
+    )
+
+    cache: Optional[ValidationCache] = _attrs.field(
+        default=None,
+        converter=ValidationCache.convert,
+        validator=_attrs.validators.optional(
+            _attrs.validators.instance_of(ValidationCache)
+        ),
+        eq=False,
+        repr=False,
+    )
+
+    _key_table: Optional[_match.KeyTable] = _attrs.field(
+        init=False, repr=False, eq=False, on_setattr=_attrs.setters.NO_OP
+    )
+    _plan: PlanMemo = _attrs.field(factory=PlanMemo, init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        self._key_table = (
+            _match.KeyTable.from_mapping(self.data_vars)
+            if self.data_vars is not None
+            else None
+        )
+
     def serialize(self):
         obj = {
             "require_all_keys": self.require_all_keys,
@@ -117,19 +187,104 @@ class DatasetSchema(BaseSchema):
         ds_schema = value.to_dict(data=False)
         return cls.deserialize(ds_schema)
 
+    def compile(self) -> ValidationPlan:
+        """
+        Compile this schema into a reusable validation plan.
+
+        The schema tree, including data variable and coordinate schemas, is
+        walked once and pattern tables are built upfront. This is useful when
+        validating many Datasets against the same schema. The plan is
+        memoized until a schema field is reassigned.
+
+        Returns
+        -------
+        ValidationPlan
+            Plan validating a Dataset.
+        """
+        return memoized_plan(self._plan, self._compile)
+
+    def _compile(self) -> ValidationPlan:
+        steps = []
+
+        if self.data_vars is not None:
+            data_vars_plan = self._compile_data_vars()
+            # Data variables are validated through views, which do not build
+            # a DataArray for each variable
+            steps.append(
+                attribute_step(
+                    None,
+                    _views.data_variables,
+                    data_vars_plan.run,
+                    data_vars_plan.test,
+                )
+            )
+
+        if self.coords is not None:
+            coords_plan = self.coords.compile()
+            steps.append(
+                attribute_step(
+                    "coords", _views.coordinates, coords_plan.run, coords_plan.test
+                )
+            )
+
+        if self.attrs:
+            steps.append(
+                attribute_step(
+                    "attrs", "attrs", self.attrs.validate, self.attrs.is_valid
+                )
+            )
+
+        if self.checks:
+            steps.append(checks_step(self.checks, self._checks_workers()))
+
+        return ValidationPlan(steps)
+
+    def _compile_data_vars(self) -> ValidationPlan:
+        # Exact and pattern keys are separated once, when data_vars are assigned
+        key_table = self._key_table
+        steps = []
+
+        if self.require_all_keys:
+            # Only check exact keys for require_all_keys
+            steps.append(missing_keys_step("data_vars", key_table.exact_keys))
+
+        # Variables are assigned to their schema entry in a single pass, then
+        # validated; values are validated separately
+        plans = {
+            key: da_schema._compile(values=False) if da_schema is not None else None
+            for key, da_schema in self.data_vars.items()
+        }
+        check_values = any(
+            da_schema is not None and da_schema.values is not None
+            for da_schema in self.data_vars.values()
+        )
+        steps.append(
+            _data_vars_step(key_table, plans, self.allow_extra_keys, check_values)
+        )
+
+        return ValidationPlan(steps)
+
     def validate(
         self,
-        ds: xr.Dataset,
+        ds: xr.Dataset | headers.DatasetHeader | str | os.PathLike,
         context: ValidationContext | None = None,
         mode: Literal["eager", "lazy"] | None = None,
+        max_errors: int | None = None,
+        max_errors_per_path: int | None = None,
+        client: Any = None,
     ) -> ValidationResult | None:
         """
-        Validate an xarray.DataArray against this schema.
+        Validate an xarray.Dataset against this schema.
 
         Parameters
         ----------
-        ds : Dataset
-            Dataset to validate.
+        ds : Dataset or DatasetHeader or path-like
+            Dataset to validate. If a path is passed, the metadata of the
+            file or store it points to is read and validated without opening
+            it with xarray (see :func:`.headers.read_header`). Chunks are
+            then those obtained with the function usually opening it; to
+            validate the on-disk chunks of a netCDF file, pass
+            ``headers.read_header(path, storage_chunks=True)`` instead.
 
         context : ValidationContext, optional
             Validation context for tracking tree traversal state.
@@ -137,74 +292,360 @@ class DatasetSchema(BaseSchema):
         mode : {"eager", "lazy"}, optional
             Validation mode. If unset, the global default mode (eager) is used.
 
+        max_errors : int, optional
+            Lazy mode only. Stop validation after collecting this many errors
+            and mark the result as truncated. Ignored if ``context`` is passed.
+
+        max_errors_per_path : int, optional
+            Lazy mode only. Maximum number of errors collected for a single
+            path; further errors at that path are dropped. Ignored if
+            ``context`` is passed.
+
+        client : distributed.Client, optional
+            Distributed mode. Value statistics of the whole schema tree are
+            collected into a single task graph, submitted once to ``client``
+            (or any Dask scheduler), so that data is reduced where it lives
+            and only the statistics are gathered. ``checks`` still run in the
+            calling process. Ignored if ``context`` is passed.
+
         Returns
         -------
         ValidationResult or None
             In eager mode, this method returns ``None``. In lazy mode, it
             returns a :class:`ValidationResult` object.
+
+        Notes
+        -----
+        The compiled plan is memoized and reused until a schema field is
+        reassigned. Enable the ``cache`` if validated objects share their
+        structure.
         """
+        ds = _as_dataset(ds)
+        plan = cached_plan(self, ds) or self.compile()
+        return plan.validate(
+            ds,
+            context,
+            mode,
+            max_errors=max_errors,
+            max_errors_per_path=max_errors_per_path,
+            client=client,
+        )
+
+    def is_valid(
+        self, ds: xr.Dataset | headers.DatasetHeader | str | os.PathLike
+    ) -> bool:
+        """
+        Check whether an xarray.Dataset is valid against this schema.
 
-        if mode is None:
-            mode = "eager"
+        This method does not collect or raise schema errors: it returns as
+        soon as a check fails, which makes it much cheaper than
+        :meth:`validate` when only a pass/fail answer is needed (*e.g.* for
+        filtering or routing).
 
-        if context is None:
-            context = ValidationContext(mode=mode)
+        Parameters
+        ----------
+        ds : Dataset or DatasetHeader or path-like
+            Dataset to validate. If a path is passed, the metadata of the
+            file or store it points to is read and validated without opening
+            it with xarray (see :func:`.headers.read_header`).
 
-        if self.data_vars is not None:
-            # Separate exact keys from pattern keys and compile patterns
-            exact_keys, pattern_keys, compiled_patterns = _match.separate_keys(
-                self.data_vars
+        Returns
+        -------
+        bool
+            ``True`` if ``ds`` passes validation, ``False`` otherwise.
+        """
+        ds = _as_dataset(ds)
+        plan = cached_plan(self, ds) or self.compile()
+        return plan.is_valid(ds)
+
+    async def avalidate(
+        self,
+        ds: xr.Dataset | headers.DatasetHeader | str | os.PathLike,
+        mode: Literal["eager", "lazy"] | None = None,
+        max_errors: int | None = None,
+        max_errors_per_path: int | None = None,
+        executor: Executor | None = None,
+        limiter: asyncio.Semaphore | None = None,
+        offload: bool | None = None,
+    ) -> ValidationResult | None:
+        """
+        Validate an xarray.Dataset against this schema without blocking the
+        event loop.
+
+        Parameters
+        ----------
+        ds : Dataset or DatasetHeader or path-like
+            Dataset to validate, or path to a file or store whose header is
+            validated.
+
+        mode : {"eager", "lazy"}, optional
+            Validation mode. If unset, the global default mode (eager) is used.
+
+        max_errors : int, optional
+            Lazy mode only. Stop validation after collecting this many errors.
+
+        max_errors_per_path : int, optional
+            Lazy mode only. Maximum number of errors collected for a single
+            path.
+
+        executor : Executor, optional
+            Executor running blocking validations. Defaults to the event
+            loop's default executor.
+
+        limiter : asyncio.Semaphore, optional
+            Semaphore shared by concurrent validations to limit how many of
+            them run in ``executor`` at the same time.
+
+        offload : bool, optional
+            Whether to run validation in ``executor``. If unset, it is
+            inferred from the schema and the validated object.
+
+        Returns
+        -------
+        ValidationResult or None
+            In eager mode, this method returns ``None``. In lazy mode, it
+            returns a :class:`ValidationResult` object.
+
+        Raises
+        ------
+        SchemaError
+            In eager mode, if validation fails.
+
+        Notes
+        -----
+        Validation is run in ``executor`` if it may block: when ``ds`` is a
+        path, or when the schema has ``checks``, value, index or time axis
+        schemas (which load or compute data). Schemas which only inspect
+        metadata are validated inline, which is faster than a round trip to
+        a worker thread; pass ``offload=True`` to override this, *e.g.* if
+        inspecting the array type of lazily loaded variables reads them.
+
+        Cancelling the awaiting task stops validation at the next step
+        boundary. A running Dask computation cannot be interrupted and runs
+        to completion in the background.
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> schema = xv.DatasetSchema(data_vars={"foo": {"dtype": "float64"}})
+        >>> ds = xr.Dataset({"foo": ("x", np.zeros(3))})
+        >>> asyncio.run(schema.avalidate(ds, mode="lazy"))
+        ValidationResult(errors=[])
+        """
+        return await aio.avalidate(
+            self,
+            ds,
+            mode=mode,
+            max_errors=max_errors,
+            max_errors_per_path=max_errors_per_path,
+            executor=executor,
+            limiter=limiter,
+            offload=offload,
+        )
+
+    def validate_many(
+        self,
+        objects: Iterable[xr.Dataset],
+        mode: Literal["eager", "lazy"] | None = None,
+        executor: Literal["thread", "process"] | Executor | None = None,
+        max_workers: int | None = None,
+        as_completed: bool = False,
+    ) -> list | Iterator[tuple[int, ValidationResult | None]]:
+        """
+        Validate many Datasets concurrently against this schema.
+
+        Parameters
+        ----------
+        objects : iterable of Dataset
+            Datasets to validate.
+
+        mode : {"eager", "lazy"}, optional
+            Validation mode applied to each object. If unset, the global
+            default mode (eager) is used.
+
+        executor : {"thread", "process"} or Executor, optional
+            Executor running validation tasks:
+
+            * ``"thread"`` (default): a thread pool, suitable when ``checks``
+              release the GIL (*e.g.* NumPy or Dask reductions);
+            * ``"process"``: a process pool, suitable for metadata-heavy
+              workloads; the schema is sent once to each worker process and
+              must be picklable;
+            * a :class:`concurrent.futures.Executor` instance, used as is and
+              not shut down; the schema is sent with each task.
+
+        max_workers : int, optional
+            Maximum number of workers of the created pool. Ignored if an
+            executor instance is passed.
+
+        as_completed : bool, default: False
+            If ``True``, return an iterator yielding ``(index, result)`` pairs
+            as validation tasks complete. Otherwise, return results in input
+            order.
+
+        Returns
+        -------
+        list or iterator
+            Per-object results of :meth:`validate`: ``None`` in eager mode, a
+            :class:`ValidationResult` in lazy mode.
+
+        Raises
+        ------
+        SchemaError
+            In eager mode, the error raised by the first invalid object
+            (in input order, or in completion order if ``as_completed`` is set).
+            Pending tasks are then cancelled.
+        """
+        return batch.validate_many(
+            self,
+            objects,
+            mode=mode,
+            executor=executor,
+            max_workers=max_workers,
+            as_completed=as_completed,
+        )
+
+    def _checks_workers(self) -> Optional[int]:
+        if self.parallel_checks is True:
+            return len(self.checks)
+        return self.parallel_checks or None
+
+    def _has_checks(self) -> bool:
+        return (
+            bool(self.checks)
+            or (
+                self.data_vars is not None
+                and any(
+                    da_schema is not None and da_schema._has_checks()
+                    for da_schema in self.data_vars.values()
+                )
             )
+            or (self.coords is not None and self.coords._has_checks())
+        )
 
-            if self.require_all_keys:
-                # Only check exact keys for require_all_keys
-                missing_keys = set(exact_keys.keys()) - set(ds.data_vars.keys())
-                if missing_keys:
-                    error = SchemaError(f"data_vars has missing keys: {missing_keys}")
-                    if context:
-                        context.handle_error(error)
-                    else:
-                        raise error
-
-            if not self.allow_extra_keys:
-                # Check that all dataset variables match either exact or pattern keys
-                matched_vars = _match.find_matched_keys(
-                    ds.data_vars, exact_keys, compiled_patterns
+    def _fingerprint(self, ds: xr.Dataset) -> tuple:
+        # Variable names and the metadata inspected by the governing schemas
+        result = []
+        if self.data_vars is not None:
+            key_table = self._key_table
+            claim = key_table.claim
+            schemas = {**key_table.pattern_keys, **key_table.exact_keys}
+            data_vars = []
+            for name, var in _views.data_variables(ds).items():
+                data_vars.append(
+                    (
+                        name,
+                        tuple(
+                            None
+                            if schemas[key] is None
+                            else schemas[key]._fingerprint(var)
+                            for key in claim(name)
+                        ),
+                    )
                 )
-                extra_keys = set(ds.data_vars.keys()) - matched_vars
-                if extra_keys:
-                    error = SchemaError(f"data_vars has extra keys: {extra_keys}")
-                    if context:
-                        context.handle_error(error)
-                    else:
-                        raise error
-
-            # Validate variables matching exact keys
-            for key, da_schema in exact_keys.items():
-                if da_schema is not None and key in ds.data_vars:
-                    data_var_context = context.push(f"data_vars.{key}")
-                    da_schema.validate(ds.data_vars[key], data_var_context)
-
-            # Validate variables matching pattern keys
-            for pattern_key, da_schema in pattern_keys.items():
-                if da_schema is None:
+            result.append(tuple(data_vars))
+        if self.coords is not None:
+            result.append(self.coords._fingerprint(_views.coordinates(ds)))
+        if self.attrs:
+            result.append(freeze(ds.attrs))
+        return tuple(result)
+
+
+def _as_dataset(ds: Any) -> Any:
+    # Paths are validated against their header, without opening them
+    if isinstance(ds, (str, os.PathLike)):
+        return headers.read_header(ds)
+    return ds
+
+
+def _data_vars_step(
+    key_table: _match.KeyTable,
+    plans: Dict[str, Optional[ValidationPlan]],
+    allow_extra_keys: bool,
+    check_values: bool,
+) -> PlanStep:
+    # Data variables are classified once: each is assigned the schema entries
+    # governing it, then validated. Exact keys are validated in schema order,
+    # variables matching pattern keys in dataset order (against each matching
+    # pattern key, in schema order), and values last.
+    exact_keys = key_table.exact_keys
+    exact_plans = [(key, plans[key]) for key in exact_keys if plans[key] is not None]
+    schemas = {**key_table.pattern_keys, **exact_keys}
+    classify = key_table.classify
+
+    def entries(data_vars, claimed):
+        # Exact keys first, then pattern-matched variables
+        for key, plan in exact_plans:
+            if key in claimed:
+                yield key, plan
+        for var_name, schema_keys in claimed.items():
+            if var_name in exact_keys:
+                continue
+            for schema_key in schema_keys:
+                if plans[schema_key] is not None:
+                    yield var_name, plans[schema_key]
+
+    def collect(data_vars, claimed):
+        # Gather value statistics of all variables
+        names, values_schemas, stats = [], [], []
+        for var_name, schema_keys in claimed.items():
+            for schema_key in schema_keys:
+                da_schema = schemas[schema_key]
+                if da_schema is None or da_schema.values is None:
                     continue
-                regex = compiled_patterns[pattern_key]
-                for var_name in ds.data_vars.keys():
-                    if regex.fullmatch(var_name) and var_name not in exact_keys:
-                        data_var_context = context.push(f"data_vars.{var_name}")
-                        da_schema.validate(ds.data_vars[var_name], data_var_context)
+                names.append(var_name)
+                values_schemas.append(da_schema.values)
+                stats.append(da_schema.values.statistics(data_vars[var_name].variable))
+        return names, values_schemas, stats
+
+    def gather(data_vars, claimed):
+        # Compute value statistics of all variables at once
+        names, values_schemas, stats = collect(data_vars, claimed)
+        return zip(names, values_schemas, compute_statistics(stats))
+
+    def run_values(data_vars, claimed, context):
+        if context.defers_values:
+            for var_name, values_schema, stats in zip(*collect(data_vars, claimed)):
+                context.push(f"data_vars.{var_name}.values").defer(
+                    stats, values_schema.validate_statistics
+                )
+            return
 
-        if self.coords is not None:  # pragma: no cover
-            coords_context = context.push("coords")
-            self.coords.validate(ds.coords, coords_context)
+        for var_name, values_schema, stats in gather(data_vars, claimed):
+            if context.stopped:
+                return
+            values_schema.validate_statistics(
+                stats, context.push(f"data_vars.{var_name}.values")
+            )
 
-        if self.attrs:
-            attrs_context = context.push("attrs")
-            self.attrs.validate(ds.attrs, attrs_context)
+    def run(data_vars, context):
+        claimed, unclaimed = classify(data_vars)
 
-        if self.checks:
-            for check in self.checks:
-                check(ds)
+        if unclaimed and not allow_extra_keys:
+            context.handle_error(
+                SchemaError(code="extra_keys", label="data_vars", keys=set(unclaimed))
+            )
 
-        return None if context.mode is ValidationMode.EAGER else context.result
+        for var_name, plan in entries(data_vars, claimed):
+            if context.stopped:
+                return
+            plan.run(data_vars[var_name], context.push(f"data_vars.{var_name}"))
+
+        if check_values and not context.stopped:
+            run_values(data_vars, claimed, context)
+
+    def test(data_vars):
+        claimed, unclaimed = classify(data_vars)
+        if unclaimed and not allow_extra_keys:
+            return False
+        if not all(
+            plan.test(data_vars[var_name])
+            for var_name, plan in entries(data_vars, claimed)
+        ):
+            return False
+        return not check_values or all(
+            next(values_schema._check_statistics(stats), None) is None
+            for _, values_schema, stats in gather(data_vars, claimed)
+        )
+
+    return PlanStep(None, run, test)
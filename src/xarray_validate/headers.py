@@ -0,0 +1,552 @@
+"""
+Metadata-only views of on-disk datasets.
+
+Readers in this module extract variable names, dimensions, shapes, data types,
+chunking and attributes straight from file metadata, without constructing an
+:class:`xarray.Dataset`. The resulting header objects expose the attributes
+inspected by :class:`.DataArraySchema` and :class:`.DatasetSchema` and can be
+validated like live xarray objects.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+import attrs as _attrs
+import numpy as np
+
+#: Calendars decoded by xarray to :class:`numpy.datetime64` values
+_STANDARD_CALENDARS = {"standard", "gregorian", "proleptic_gregorian"}
+
+#: Attributes moved to the encoding by CF decoding
+_MASK_ATTRS = ("_FillValue", "missing_value")
+_SCALE_ATTRS = ("scale_factor", "add_offset")
+
+
+@_attrs.define(eq=False)
+class DataArrayHeader:
+    """
+    Metadata of a variable read from a file header.
+
+    This object mimics the parts of the :class:`xarray.DataArray` interface
+    inspected by :class:`.DataArraySchema`.
+
+    Parameters
+    ----------
+    name : str
+        Variable name.
+
+    dims : tuple of str
+        Dimension names.
+
+    shape : tuple of int
+        Array shape.
+
+    dtype : numpy.dtype
+        Data type, after CF decoding if applied.
+
+    chunks : tuple of tuple of int, optional
+        Chunk sizes along each dimension, in the format of
+        :attr:`xarray.DataArray.chunks`; ``None`` for contiguous storage.
+
+    attrs : dict
+        Attributes, after CF decoding if applied.
+
+    coords : dict
+        Coordinate headers, keyed by name.
+    """
+
+    name: str
+    dims: Tuple[str, ...] = _attrs.field(converter=tuple)
+    shape: Tuple[int, ...] = _attrs.field(converter=tuple)
+    dtype: np.dtype = _attrs.field(converter=np.dtype)
+    chunks: Optional[Tuple[Tuple[int, ...], ...]] = None
+    attrs: Dict[str, Any] = _attrs.field(factory=dict)
+    coords: Dict[str, DataArrayHeader] = _attrs.field(factory=dict, repr=False)
+
+    @property
+    def data(self):
+        raise TypeError("array type cannot be validated from a file header")
+
+    @property
+    def variable(self):
+        raise TypeError("array values cannot be validated from a file header")
+
+
+@_attrs.define(eq=False)
+class DatasetHeader:
+    """
+    Metadata of a dataset read from a file header.
+
+    This object mimics the parts of the :class:`xarray.Dataset` interface
+    inspected by :class:`.DatasetSchema`.
+
+    Parameters
+    ----------
+    data_vars : dict
+        Data variable headers, keyed by name.
+
+    coords : dict
+        Coordinate headers, keyed by name.
+
+    attrs : dict
+        Global attributes.
+    """
+
+    data_vars: Dict[str, DataArrayHeader] = _attrs.field(factory=dict)
+    coords: Dict[str, DataArrayHeader] = _attrs.field(factory=dict)
+    attrs: Dict[str, Any] = _attrs.field(factory=dict)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data_vars or key in self.coords
+
+    def __getitem__(self, key: str) -> DataArrayHeader:
+        try:
+            return self.data_vars[key]
+        except KeyError:
+            return self.coords[key]
+
+
+# ------------------------------------------------------------------------------
+#                                 CF decoding
+# ------------------------------------------------------------------------------
+
+
+def _choose_float_dtype(dtype: np.dtype, attrs: Mapping[str, Any]) -> np.dtype:
+    # Follows xarray's choice of the decoded floating-point type
+    scale_dtypes = [
+        np.asarray(attrs[key]).dtype for key in _SCALE_ATTRS if key in attrs
+    ]
+    float_dtypes = [x for x in scale_dtypes if np.issubdtype(x, np.floating)]
+    if float_dtypes:
+        return np.result_type(*float_dtypes)
+    if dtype.itemsize <= 4 and np.issubdtype(dtype, np.floating):
+        return np.dtype("float32")
+    if dtype.itemsize <= 2 and np.issubdtype(dtype, np.integer):
+        return np.dtype("float32")
+    return np.dtype("float64")
+
+
+def decode_cf(dtype: np.dtype, attrs: Mapping[str, Any]) -> Tuple[np.dtype, dict]:
+    """
+    Apply the effect of xarray's CF decoding to a variable's metadata.
+
+    This approximates :func:`xarray.decode_cf` for the most common
+    conventions: unsigned integer flags, masking, packing and time decoding.
+    Attributes consumed by decoding are removed.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype
+        On-disk data type.
+
+    attrs : mapping
+        On-disk attributes.
+
+    Returns
+    -------
+    dtype : numpy.dtype
+        Decoded data type.
+
+    attrs : dict
+        Decoded attributes.
+    """
+    attrs = dict(attrs)
+    attrs.pop("coordinates", None)
+
+    unsigned = attrs.pop("_Unsigned", None)
+    if dtype.kind == "i" and str(unsigned).lower() == "true":
+        dtype = np.dtype(f"u{dtype.itemsize}")
+    elif dtype.kind == "u" and str(unsigned).lower() == "false":
+        dtype = np.dtype(f"i{dtype.itemsize}")
+
+    masked = any(key in attrs for key in _MASK_ATTRS)
+    if any(key in attrs for key in _SCALE_ATTRS):
+        dtype = _choose_float_dtype(dtype, attrs)
+    elif masked and dtype.kind in "iu":
+        dtype = np.dtype("float32" if dtype.itemsize <= 2 else "float64")
+    for key in (*_MASK_ATTRS, *_SCALE_ATTRS):
+        attrs.pop(key, None)
+
+    units = attrs.get("units")
+    if isinstance(units, str) and " since " in units and dtype.kind in "iuf":
+        calendar = str(attrs.pop("calendar", "standard")).lower()
+        del attrs["units"]
+        dtype = np.dtype("datetime64[ns]" if calendar in _STANDARD_CALENDARS else "O")
+
+    return dtype, attrs
+
+
+# ------------------------------------------------------------------------------
+#                               Header assembly
+# ------------------------------------------------------------------------------
+
+
+class _Variable:
+    # Raw on-disk variable metadata
+    __slots__ = ("dims", "shape", "dtype", "chunk_shape", "attrs")
+
+    def __init__(self, dims, shape, dtype, chunk_shape, attrs):
+        self.dims = tuple(dims)
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self.chunk_shape = None if chunk_shape is None else tuple(chunk_shape)
+        self.attrs = attrs
+
+
+def _chunks(
+    shape: Tuple[int, ...], chunk_shape: Tuple[int, ...]
+) -> Tuple[Tuple[int, ...], ...]:
+    # Expand a regular chunk shape to per-dimension chunk sizes
+    result = []
+    for size, chunk in zip(shape, chunk_shape):
+        if size == 0:
+            result.append((0,))
+            continue
+        chunk = max(min(chunk, size), 1)
+        n, remainder = divmod(size, chunk)
+        result.append((chunk,) * n + ((remainder,) if remainder else ()))
+    return tuple(result)
+
+
+def _assemble(
+    variables: Dict[str, _Variable],
+    attrs: Dict[str, Any],
+    decode: bool,
+    storage_chunks: bool,
+) -> DatasetHeader:
+    # Sort variables into coordinates and data variables as xarray does:
+    # dimension variables and those listed in "coordinates" attributes are
+    # coordinates
+    coord_names = set()
+    for name, var in variables.items():
+        if (name,) == var.dims:
+            coord_names.add(name)
+        coord_names.update(str(var.attrs.get("coordinates", "")).split())
+    coord_names.update(str(attrs.get("coordinates", "")).split())
+    coord_names &= set(variables)
+
+    headers = {}
+    for name, var in variables.items():
+        dtype, var_attrs = (
+            decode_cf(var.dtype, var.attrs) if decode else (var.dtype, var.attrs)
+        )
+        # Dimension coordinates are loaded into memory to build indexes
+        index = (name,) == var.dims
+        headers[name] = DataArrayHeader(
+            name=name,
+            dims=var.dims,
+            shape=var.shape,
+            dtype=dtype,
+            chunks=None
+            if index or not storage_chunks or var.chunk_shape is None
+            else _chunks(var.shape, var.chunk_shape),
+            attrs=var_attrs,
+        )
+
+    coords = {name: headers[name] for name in headers if name in coord_names}
+    for header in headers.values():
+        dims = set(header.dims)
+        header.coords = {
+            name: coord for name, coord in coords.items() if set(coord.dims) <= dims
+        }
+
+    if decode:
+        attrs = {key: value for key, value in attrs.items() if key != "coordinates"}
+
+    return DatasetHeader(
+        data_vars={
+            name: header for name, header in headers.items() if name not in coords
+        },
+        coords=coords,
+        attrs=attrs,
+    )
+
+
+# ------------------------------------------------------------------------------
+#                                    Zarr
+# ------------------------------------------------------------------------------
+
+
+def _read_json(path: Path) -> dict:
+    with open(path, "rb") as f:
+        return json.load(f)
+
+
+def _zarr_v2_dtype(value: Union[str, List]) -> np.dtype:
+    if isinstance(value, list):  # Structured data type
+        return np.dtype([tuple(field) for field in value])
+    return np.dtype(value)
+
+
+def _zarr_v2_variable(name: str, zarray: dict, zattrs: dict) -> _Variable:
+    zattrs = dict(zattrs)
+    try:
+        dims = zattrs.pop("_ARRAY_DIMENSIONS")
+    except KeyError:
+        raise ValueError(
+            f"zarr array '{name}' has no '_ARRAY_DIMENSIONS' attribute"
+        ) from None
+    if zarray.get("fill_value") is not None:
+        # xarray uses the zarr v2 fill value as the missing data mask
+        zattrs["_FillValue"] = zarray["fill_value"]
+    return _Variable(
+        dims, zarray["shape"], _zarr_v2_dtype(zarray["dtype"]), zarray["chunks"], zattrs
+    )
+
+
+def _zarr_v3_dtype(value: Any) -> np.dtype:
+    try:
+        return np.dtype(value)
+    except TypeError:  # Extension data types (e.g. variable-length strings)
+        return np.dtype("O")
+
+
+def _zarr_v3_variable(name: str, meta: dict) -> _Variable:
+    dims = meta.get("dimension_names")
+    if dims is None:
+        raise ValueError(f"zarr array '{name}' has no dimension names")
+    chunk_grid = meta.get("chunk_grid", {})
+    chunk_shape = chunk_grid.get("configuration", {}).get("chunk_shape")
+    return _Variable(
+        dims,
+        meta["shape"],
+        _zarr_v3_dtype(meta["data_type"]),
+        chunk_shape,
+        dict(meta.get("attributes", {})),
+    )
+
+
+def _read_zarr_v2(root: Path) -> Tuple[Dict[str, _Variable], dict]:
+    if (root / ".zmetadata").is_file():
+        metadata = _read_json(root / ".zmetadata")["metadata"]
+    else:
+        # Unconsolidated store: collect metadata documents of root arrays
+        metadata = {}
+        for name in (".zattrs", ".zgroup"):
+            if (root / name).is_file():
+                metadata[name] = _read_json(root / name)
+        for child in root.iterdir():
+            for name in (".zarray", ".zattrs"):
+                if (child / name).is_file():
+                    metadata[f"{child.name}/{name}"] = _read_json(child / name)
+
+    variables = {}
+    for key, zarray in metadata.items():
+        name, _, document = key.rpartition("/")
+        if document != ".zarray" or "/" in name:
+            continue
+        zattrs = metadata.get(f"{name}/.zattrs", {})
+        variables[name] = _zarr_v2_variable(name, zarray, zattrs)
+
+    return variables, dict(metadata.get(".zattrs", {}))
+
+
+def _read_zarr_v3(root: Path) -> Tuple[Dict[str, _Variable], dict]:
+    group = _read_json(root / "zarr.json")
+    consolidated = group.get("consolidated_metadata")
+
+    if consolidated is not None:
+        metadata = consolidated["metadata"]
+    else:
+        metadata = {}
+        for child in root.iterdir():
+            if (child / "zarr.json").is_file():
+                metadata[child.name] = _read_json(child / "zarr.json")
+
+    variables = {
+        name: _zarr_v3_variable(name, meta)
+        for name, meta in metadata.items()
+        if meta.get("node_type") == "array" and "/" not in name
+    }
+
+    return variables, dict(group.get("attributes", {}))
+
+
+def is_zarr_store(path: Union[str, os.PathLike]) -> bool:
+    """Check if a path points to a local Zarr store."""
+    root = Path(path)
+    return root.is_dir() and any(
+        (root / name).is_file() for name in (".zmetadata", ".zgroup", "zarr.json")
+    )
+
+
+def read_zarr_header(
+    path: Union[str, os.PathLike], decode_cf: bool = True, storage_chunks: bool = True
+) -> DatasetHeader:
+    """
+    Read dataset metadata from a local Zarr store.
+
+    Only JSON metadata documents are read: consolidated metadata
+    (``.zmetadata`` for Zarr v2, the root ``zarr.json`` for Zarr v3) if
+    available, array metadata documents otherwise. Only arrays in the root
+    group are considered.
+
+    Parameters
+    ----------
+    path : path-like
+        Path to the store.
+
+    decode_cf : bool, default: True
+        Whether to apply the effect of CF decoding to data types and
+        attributes (see :func:`decode_cf`), as :func:`xarray.open_zarr` does.
+
+    storage_chunks : bool, default: True
+        If ``True``, variables are reported as chunked along their on-disk
+        chunks, which is the chunking obtained with :func:`xarray.open_zarr`
+        (as with :func:`xarray.open_zarr`, dimension coordinates are not
+        chunked). If ``False``, no variable is chunked, as with
+        ``xarray.open_dataset(path, engine="zarr")``.
+
+    Returns
+    -------
+    DatasetHeader
+    """
+    root = Path(path)
+    if (root / "zarr.json").is_file():
+        variables, attrs = _read_zarr_v3(root)
+    elif (root / ".zmetadata").is_file() or (root / ".zgroup").is_file():
+        variables, attrs = _read_zarr_v2(root)
+    else:
+        raise ValueError(f"'{path}' is not a Zarr store")
+
+    return _assemble(variables, attrs, decode_cf, storage_chunks)
+
+
+# ------------------------------------------------------------------------------
+#                                netCDF / HDF5
+# ------------------------------------------------------------------------------
+
+#: File signatures
+_NETCDF3_SIGNATURE = b"CDF"
+_HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"
+
+#: Offsets at which the HDF5 superblock may be found (a user block may precede
+#: it)
+_HDF5_OFFSETS = (0, 512, 1024, 2048, 4096)
+
+
+def is_netcdf_file(path: Union[str, os.PathLike]) -> bool:
+    """Check if a path points to a netCDF or HDF5 file."""
+    if not os.path.isfile(path):
+        return False
+    with open(path, "rb") as f:
+        if f.read(3) == _NETCDF3_SIGNATURE:
+            return True
+        for offset in _HDF5_OFFSETS:
+            f.seek(offset)
+            if f.read(8) == _HDF5_SIGNATURE:
+                return True
+    return False
+
+
+def read_netcdf_header(
+    path: Union[str, os.PathLike], decode_cf: bool = True, storage_chunks: bool = False
+) -> DatasetHeader:
+    """
+    Read dataset metadata from a netCDF or HDF5 file.
+
+    The file header is read with the low-level netCDF4 library: variable
+    data is never accessed. Only variables in the root group are considered.
+
+    Parameters
+    ----------
+    path : path-like
+        Path to the file.
+
+    decode_cf : bool, default: True
+        Whether to apply the effect of CF decoding to data types and
+        attributes (see :func:`decode_cf`), as :func:`xarray.open_dataset`
+        does.
+
+    storage_chunks : bool, default: False
+        If ``False``, no variable is chunked, as with
+        :func:`xarray.open_dataset`. If ``True``, chunked variables are
+        reported as chunked along their on-disk chunks, which is the chunking
+        obtained with ``xarray.open_dataset(path, chunks={})`` (contiguous
+        variables and dimension coordinates are not chunked).
+
+    Returns
+    -------
+    DatasetHeader
+
+    Notes
+    -----
+    Variable-length strings are reported with the ``object`` data type: their
+    length is only known after reading the data.
+    """
+    try:
+        import netCDF4
+    except ImportError as e:
+        raise ImportError(
+            "Reading netCDF headers requires the netCDF4 library. Install "
+            "with pip install netCDF4"
+        ) from e
+
+    with netCDF4.Dataset(path, mode="r") as nc:
+        variables = {}
+        for name, var in nc.variables.items():
+            chunking = var.chunking() if storage_chunks else None
+            variables[name] = _Variable(
+                var.dimensions,
+                var.shape,
+                np.dtype("O") if var.dtype is str else np.dtype(var.dtype),
+                None if chunking in (None, "contiguous") else chunking,
+                {key: var.getncattr(key) for key in var.ncattrs()},
+            )
+        attrs = {key: nc.getncattr(key) for key in nc.ncattrs()}
+
+    return _assemble(variables, attrs, decode_cf, storage_chunks)
+
+
+def read_header(
+    path: Union[str, os.PathLike],
+    decode_cf: bool = True,
+    storage_chunks: Optional[bool] = None,
+) -> DatasetHeader:
+    """
+    Read dataset metadata from a file or store, without opening it with
+    xarray.
+
+    Supported formats are Zarr stores (see :func:`read_zarr_header`) and
+    netCDF or HDF5 files (see :func:`read_netcdf_header`); the format is
+    detected from the store layout or the file signature.
+
+    Parameters
+    ----------
+    path : path-like
+        Path to the file or store.
+
+    decode_cf : bool, default: True
+        Whether to apply the effect of CF decoding to data types and
+        attributes.
+
+    storage_chunks : bool, optional
+        Whether variables are reported as chunked along their on-disk chunks.
+        If unset, variables are chunked as with the function usually opening
+        the file: :func:`xarray.open_zarr` for Zarr stores (on-disk chunks),
+        :func:`xarray.open_dataset` for netCDF and HDF5 files (not chunked).
+
+    Returns
+    -------
+    DatasetHeader
+
+    Raises
+    ------
+    ValueError
+        If the file format is not supported.
+    """
+    if is_zarr_store(path):
+        return read_zarr_header(
+            path,
+            decode_cf=decode_cf,
+            storage_chunks=True if storage_chunks is None else storage_chunks,
+        )
+    if is_netcdf_file(path):
+        return read_netcdf_header(
+            path, decode_cf=decode_cf, storage_chunks=bool(storage_chunks)
+        )
+    raise ValueError(f"unsupported file format: '{path}'")
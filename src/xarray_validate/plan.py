@@ -0,0 +1,514 @@
+"""Compiled validation plans."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import itertools
+import operator
+import time
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import attrs
+
+from . import _match
+from .base import SchemaError, ValidationContext, ValidationMode, ValidationResult
+from .components import compute_statistics
+
+
+class PlanStep(NamedTuple):
+    """
+    A validation plan step.
+    """
+
+    #: Path component pushed onto the validation context, or ``None`` to run
+    #: in the parent context
+    path: Optional[str]
+
+    #: Callable performing the check on the validated object within a context
+    run: Callable[[Any, ValidationContext], None]
+
+    #: Predicate performing the check on the validated object without raising
+    #: or collecting errors
+    test: Callable[[Any], bool]
+
+
+@attrs.frozen
+class ValidationPlan:
+    """
+    Immutable, flat sequence of specialised validation steps.
+
+    Plans are produced by the ``compile()`` method of container schemas
+    (:meth:`.DataArraySchema.compile`, :meth:`.DatasetSchema.compile`,
+    :meth:`.CoordsSchema.compile`). Compiling a schema resolves unset slots,
+    pattern tables and child schemas once; the resulting plan can then be run
+    many times at minimal per-call overhead.
+
+    A plan is a snapshot: modifying the schema after compilation does not
+    affect plans compiled from it.
+
+    Parameters
+    ----------
+    steps : tuple of PlanStep
+        Validation steps, executed in order.
+
+    input_check : callable, optional
+        Callable applied to the validated object before any step is run by
+        :meth:`validate`. It should raise if the input type is not supported.
+    """
+
+    steps: Tuple[PlanStep, ...] = attrs.field(converter=tuple)
+    input_check: Optional[Callable[[Any], None]] = attrs.field(default=None, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def run(self, obj: Any, context: ValidationContext) -> None:
+        """
+        Run all steps of this plan on ``obj`` within an existing context.
+
+        Parameters
+        ----------
+        obj
+            Object to validate.
+
+        context : ValidationContext
+            Validation context for tracking tree traversal state.
+        """
+        if context.notifier is not None:
+            self._run_observed(obj, context)
+            return
+
+        for path, func, _ in self.steps:
+            if context.stopped:  # Error budget spent
+                return
+            func(obj, context.push(path) if path is not None else context)
+
+    def _run_observed(self, obj: Any, context: ValidationContext) -> None:
+        # Steps with a path are schema tree nodes; so is the plan itself,
+        # unless its context was already entered by a parent plan step
+        notifier = context.notifier
+        entered = notifier.current is not context
+        if entered:
+            notifier.enter(context)
+        try:
+            for path, func, _ in self.steps:
+                if context.stopped:  # Error budget spent
+                    return
+                if path is None:
+                    func(obj, context)
+                    continue
+                child = context.push(path)
+                notifier.enter(child)
+                try:
+                    func(obj, child)
+                finally:
+                    notifier.exit()
+        finally:
+            if entered:
+                notifier.exit()
+
+    def test(self, obj: Any) -> bool:
+        """
+        Check whether ``obj`` passes all steps of this plan.
+
+        Unlike :meth:`run`, this method does not instantiate any error or
+        context and returns as soon as a check fails.
+        """
+        for step in self.steps:
+            if not step.test(obj):
+                return False
+        return True
+
+    def is_valid(self, obj: Any) -> bool:
+        """
+        Check whether an object is valid against this plan.
+
+        Parameters
+        ----------
+        obj
+            Object to validate.
+
+        Returns
+        -------
+        bool
+            ``True`` if all checks pass, ``False`` otherwise.
+        """
+        if self.input_check is not None:
+            self.input_check(obj)
+        return self.test(obj)
+
+    def validate(
+        self,
+        obj: Any,
+        context: ValidationContext | None = None,
+        mode: Literal["eager", "lazy"] | None = None,
+        max_errors: int | None = None,
+        max_errors_per_path: int | None = None,
+        client: Any = None,
+    ) -> ValidationResult | None:
+        """
+        Validate an object against this plan.
+
+        Parameters
+        ----------
+        obj
+            Object to validate.
+
+        context : ValidationContext, optional
+            Validation context for tracking tree traversal state.
+
+        mode : {"eager", "lazy"}, optional
+            Validation mode. If unset, the global default mode (eager) is used.
+
+        max_errors : int, optional
+            Lazy mode only. Stop validation after collecting this many errors.
+            Ignored if ``context`` is passed.
+
+        max_errors_per_path : int, optional
+            Lazy mode only. Maximum number of errors collected for a single
+            path. Ignored if ``context`` is passed.
+
+        client : distributed.Client, optional
+            Distributed mode: value statistics are deferred until the plan
+            has run, then computed at once by ``client`` (see
+            :func:`run_deferred`). Ignored if ``context`` is passed: values
+            are then deferred only if ``context`` defers them.
+
+        Returns
+        -------
+        ValidationResult or None
+            In eager mode, this method returns ``None``. In lazy mode, it
+            returns a :class:`.ValidationResult` object.
+        """
+        if context is None:
+            context = ValidationContext(
+                mode=mode if mode is not None else "eager",
+                max_errors=max_errors,
+                max_errors_per_path=max_errors_per_path,
+                defer_values=client is not None,
+            )
+
+        notifier = context.notifier
+        if notifier is None:
+            self._validate(obj, context, client)
+        else:
+            start = notifier.validate_start(context, obj)
+            try:
+                self._validate(obj, context, client)
+            except BaseException as e:
+                notifier.validate_end(context, start, e)
+                raise
+            notifier.validate_end(context, start, None)
+
+        return None if context.mode is ValidationMode.EAGER else context.result
+
+    def _validate(self, obj: Any, context: ValidationContext, client: Any) -> None:
+        if self.input_check is not None:
+            self.input_check(obj)
+
+        self.run(obj, context)
+        if context.defers_values:
+            run_deferred(context, client)
+
+
+def run_deferred(context: ValidationContext, scheduler: Any = None) -> None:
+    """
+    Compute and validate value statistics deferred during a validation run.
+
+    Statistics registered with :meth:`.ValidationContext.defer` are computed
+    in a single task graph: with a :class:`distributed.Client`, it is
+    submitted once to the cluster, and only the statistics (a few numbers per
+    array or chunk) are gathered back to the client.
+
+    Parameters
+    ----------
+    context : ValidationContext
+        Validation context which deferred value statistics.
+
+    scheduler : optional
+        Dask scheduler computing the statistics, *e.g.* a
+        :class:`distributed.Client`. Defaults to the current Dask scheduler.
+    """
+    deferred = context.pop_deferred()
+    computed = compute_statistics([stats for stats, _, _ in deferred], scheduler)
+    notifier = context.notifier
+    for stats, (_, callback, callback_context) in zip(computed, deferred):
+        if callback_context.stopped:  # Error budget spent
+            return
+        if notifier is None:
+            callback(stats, callback_context)
+            continue
+        notifier.enter(callback_context)
+        try:
+            callback(stats, callback_context)
+        finally:
+            notifier.exit()
+
+
+# ------------------------------------------------------------------------------
+#                              Plan memoization
+# ------------------------------------------------------------------------------
+
+
+#: Generation counter of schema definitions (see :func:`invalidate_plans`)
+_generations = itertools.count(1)
+
+#: Current generation of schema definitions
+_generation = 0
+
+
+class PlanMemo:
+    """
+    Holder of the plan memoized by a schema (see :func:`memoized_plan`).
+
+    It is reset when pickled or copied, since plans hold closures.
+    """
+
+    __slots__ = ("entry",)
+
+    def __init__(self):
+        #: Generation and compiled plan, replaced atomically
+        self.entry: Optional[Tuple[int, ValidationPlan]] = None
+
+    def __reduce__(self):
+        return type(self), ()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+def invalidate_plans(instance: Any, attribute: attrs.Attribute, value: Any) -> Any:
+    """
+    ``on_setattr`` hook invalidating memoized plans when a schema field is
+    reassigned.
+
+    Plans embed the plans of child schemas: all memoized plans are
+    invalidated, so that reassigning a field of a child schema is reflected
+    by its parents.
+    """
+    global _generation
+    _generation = next(_generations)
+    return value
+
+
+def memoized_plan(
+    memo: PlanMemo, compile: Callable[[], ValidationPlan]
+) -> ValidationPlan:
+    """
+    Get a memoized plan, compiling it if schema definitions changed since it
+    was compiled.
+
+    Parameters
+    ----------
+    memo : PlanMemo
+        Memo of the compiled schema.
+
+    compile : callable
+        Function compiling the schema.
+    """
+    generation = _generation
+    entry = memo.entry
+    if entry is not None and entry[0] == generation:
+        return entry[1]
+    plan = compile()
+    memo.entry = (generation, plan)
+    return plan
+
+
+# ------------------------------------------------------------------------------
+#                               Step factories
+# ------------------------------------------------------------------------------
+
+
+def attribute_step(
+    path: Optional[str],
+    attribute: Union[str, Callable[[Any], Any]],
+    validate: Callable[[Any, ValidationContext], None],
+    is_valid: Callable[[Any], bool],
+) -> PlanStep:
+    """
+    Make a step that validates an attribute of the validated object.
+
+    Parameters
+    ----------
+    path : str or None
+        Step path.
+
+    attribute : str or callable
+        Name of the attribute passed to ``validate``, or function getting it
+        from the validated object.
+
+    validate : callable
+        Validation function with signature ``validate(value, context)``.
+
+    is_valid : callable
+        Predicate with signature ``is_valid(value)``.
+    """
+    get = operator.attrgetter(attribute) if isinstance(attribute, str) else attribute
+
+    def run(obj, context):
+        validate(get(obj), context)
+
+    def test(obj):
+        return is_valid(get(obj))
+
+    return PlanStep(path, run, test)
+
+
+def _check_names(checks: Sequence[Callable]) -> list:
+    # Path components of checks: function names, made unique with their index
+    names = []
+    for i, check in enumerate(checks):
+        name = getattr(check, "__name__", type(check).__name__)
+        if name == "<lambda>":
+            name = str(i)
+        elif name in names:
+            name = f"{name}_{i}"
+        names.append(name)
+    return names
+
+
+def _call_check(check: Callable[[Any], Any], obj: Any) -> Tuple[Any, float]:
+    # Exceptions are returned rather than raised, with the check's wall time
+    start = time.perf_counter()
+    try:
+        check(obj)
+    except Exception as e:
+        return e, time.perf_counter() - start
+    return None, time.perf_counter() - start
+
+
+def checks_step(
+    checks: Sequence[Callable[[Any], Any]], max_workers: Optional[int] = None
+) -> PlanStep:
+    """
+    Make a step that calls user-defined checks on the validated object.
+
+    Each check runs in a context at path ``checks.<name>``, where ``<name>``
+    is the check function's name (or its index for lambdas), and its wall
+    time is recorded in :attr:`.ValidationResult.check_durations`. In eager
+    mode, the exception raised by the first failing check is re-raised; in
+    lazy mode, it is recorded as a ``"check_failed"`` error (checks raising
+    :class:`.SchemaError` have their error recorded as is).
+
+    Parameters
+    ----------
+    checks : sequence of callable
+        Check functions. They should raise if validation fails.
+
+    max_workers : int, optional
+        If set, checks run concurrently on a thread pool of this size.
+        Errors are reported in check order regardless.
+    """
+    checks = tuple(checks)
+    names = _check_names(checks)
+
+    def run(obj, context):
+        if max_workers is None or len(checks) < 2:
+            # Lazily evaluated: validation stops at the first failure in eager
+            # mode, or as soon as the context is stopped
+            outcomes = (
+                _call_check(check, obj) for check in checks if not context.stopped
+            )
+            report(outcomes, context)
+            return
+
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        futures = [pool.submit(_call_check, check, obj) for check in checks]
+        try:
+            report((future.result() for future in futures), context)
+        finally:
+            for future in futures:
+                future.cancel()
+            pool.shutdown()
+
+    def report(outcomes, context):
+        for name, (error, duration) in zip(names, outcomes):
+            check_context = context.push(name)
+            context.result.check_durations[check_context.get_path_string()] = duration
+            if error is None:
+                continue
+            if context.mode is ValidationMode.EAGER:
+                if context.notifier is not None:
+                    context.notifier.error(check_context, error)
+                raise error
+            if not isinstance(error, SchemaError):
+                error = SchemaError(code="check_failed", check=name, error=error)
+            check_context.handle_error(error)
+            if context.stopped:
+                return
+
+    def test(obj):
+        for check in checks:
+            try:
+                check(obj)
+            except Exception:
+                return False
+        return True
+
+    return PlanStep("checks", run, test)
+
+
+def missing_keys_step(label: str, required: Iterable[str]) -> PlanStep:
+    """
+    Make a step that checks that a mapping holds all required keys.
+
+    Parameters
+    ----------
+    label : str
+        Name of the validated mapping, used in error messages.
+
+    required : iterable of str
+        Required keys.
+    """
+    required = tuple(required)
+
+    def run(mapping, context):
+        missing_keys = {key for key in required if key not in mapping}
+        if missing_keys:
+            context.handle_error(
+                SchemaError(code="missing_keys", label=label, keys=missing_keys)
+            )
+
+    def test(mapping):
+        return all(key in mapping for key in required)
+
+    return PlanStep(None, run, test)
+
+
+def extra_keys_step(label: str, key_table: _match.KeyTable) -> PlanStep:
+    """
+    Make a step that checks that all keys of a mapping are matched by an exact
+    or a pattern key.
+
+    Parameters
+    ----------
+    label : str
+        Name of the validated mapping, used in error messages.
+
+    key_table : KeyTable
+        Lookup table of the schema keys.
+    """
+    claim = key_table.claim
+
+    def run(mapping, context):
+        extra_keys = {key for key in mapping if not claim(key)}
+        if extra_keys:
+            context.handle_error(
+                SchemaError(code="extra_keys", label=label, keys=extra_keys)
+            )
+
+    def test(mapping):
+        return all(claim(key) for key in mapping)
+
+    return PlanStep(None, run, test)
@@ -68,6 +68,8 @@ def parse(
     try:
         return ureg.Unit(unit_string)
     except (pint.UndefinedUnitError, pint.errors.DefinitionSyntaxError) as e:
-        error = SchemaError(f"{error_prefix} '{unit_string}': {e}")
+        error = SchemaError(
+            code="units_invalid", got=unit_string, prefix=error_prefix, reason=e
+        )
         raise_or_handle(error, context, from_exc=e)
         return None
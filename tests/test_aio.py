@@ -0,0 +1,161 @@
+"""Tests for asynchronous validation."""
+
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from xarray_validate import (
+    DataArraySchema,
+    DatasetSchema,
+    SchemaError,
+    avalidate_files,
+)
+
+
+@pytest.fixture
+def schema():
+    return DatasetSchema(data_vars={"foo": DataArraySchema(dtype=np.float64)})
+
+
+def test_avalidate(schema, ds):
+    assert asyncio.run(schema.avalidate(ds.astype("float64"))) is None
+    result = asyncio.run(schema.avalidate(ds, mode="lazy"))
+    assert [path for path, _ in result.errors] == ["data_vars.foo.dtype"]
+    with pytest.raises(SchemaError, match="dtype mismatch"):
+        asyncio.run(schema.avalidate(ds))
+
+    # DataArray schemas
+    da_schema = DataArraySchema(dtype=np.int32)
+    assert asyncio.run(da_schema.avalidate(ds["foo"])) is None
+
+
+def test_avalidate_offload(ds):
+    threads = []
+
+    def check(da):
+        threads.append(threading.current_thread())
+
+    async def main():
+        # Metadata checks run inline, checks run in the executor
+        await DataArraySchema(dtype=np.int32).avalidate(ds["foo"], offload=False)
+        await DataArraySchema(checks=[check]).avalidate(ds["foo"])
+        await DataArraySchema(checks=[check]).avalidate(ds["foo"], offload=False)
+
+    asyncio.run(main())
+    assert threads[0] is not threading.main_thread()
+    assert threads[1] is threading.main_thread()
+
+
+def test_avalidate_limiter(ds):
+    running, peak = 0, 0
+    lock = threading.Lock()
+
+    def check(da):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        threading.Event().wait(0.02)
+        with lock:
+            running -= 1
+
+    schema = DataArraySchema(checks=[check])
+
+    async def main():
+        limiter = asyncio.Semaphore(2)
+        await asyncio.gather(
+            *(schema.avalidate(ds["foo"], limiter=limiter) for _ in range(6))
+        )
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_avalidate_cancel(ds):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def blocking(da):
+        started.set()
+        release.wait(5)
+        calls.append("blocking")
+
+    def after(da):
+        calls.append("after")
+
+    schema = DataArraySchema(checks=[blocking, after])
+
+    async def main():
+        task = asyncio.ensure_future(schema.avalidate(ds["foo"], mode="lazy"))
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+
+    # The event loop waits for the worker thread before closing; remaining
+    # steps are skipped once the running one returns
+    asyncio.run(main())
+    assert calls == ["blocking"]
+
+
+@pytest.mark.parametrize("engine", ["zarr", "netcdf4"])
+def test_avalidate_files(tmp_path, schema, engine):
+    pytest.importorskip("netCDF4" if engine == "netcdf4" else engine)
+    paths = []
+    for i, dtype in enumerate(["float64", "int32", "float64"]):
+        path = tmp_path / f"data_{i}"
+        ds = xr.Dataset({"foo": ("x", np.zeros(3, dtype=dtype))})
+        if engine == "zarr":
+            ds.to_zarr(path)
+        else:
+            ds.to_netcdf(path, engine=engine)
+        paths.append(path)
+    paths.append(tmp_path / "missing")
+
+    async def main(executor):
+        return {
+            path: result
+            async for path, result in avalidate_files(
+                schema, paths, engine=engine, max_concurrency=2, executor=executor
+            )
+        }
+
+    # The HDF5 library is not thread-safe: netCDF files are opened in processes
+    if engine == "netcdf4":
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = asyncio.run(main(executor))
+    else:
+        results = asyncio.run(main(None))
+    assert [results[path].has_errors for path in paths] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert results[paths[3]].errors[0][1].code == "file_unreadable"
+
+
+def test_avalidate_files_lazy(tmp_path, schema):
+    pulled = []
+
+    def paths():
+        for i in range(10):
+            pulled.append(i)
+            yield tmp_path / f"missing_{i}"
+
+    async def main():
+        return [
+            len(pulled)
+            async for _ in avalidate_files(schema, paths(), max_concurrency=2)
+        ]
+
+    # Paths are not consumed ahead of completed validations
+    counts = asyncio.run(main())
+    assert len(counts) == 10
+    assert all(count <= i + 2 for i, count in enumerate(counts))
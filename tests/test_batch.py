@@ -0,0 +1,92 @@
+"""Tests for concurrent batch validation."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from xarray_validate import DataArraySchema, DatasetSchema, SchemaError, validate_files
+
+
+@pytest.fixture
+def datasets():
+    return [
+        xr.Dataset({"foo": ("x", np.zeros(3, dtype=dtype))})
+        for dtype in ["float64", "int32", "float64", "int64"]
+    ]
+
+
+@pytest.fixture
+def schema():
+    return DatasetSchema(data_vars={"foo": DataArraySchema(dtype=np.float64)})
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_validate_many(schema, datasets, executor):
+    results = schema.validate_many(
+        datasets, mode="lazy", executor=executor, max_workers=2
+    )
+    assert [result.has_errors for result in results] == [False, True, False, True]
+    assert [path for path, _ in results[1].errors] == ["data_vars.foo.dtype"]
+
+    # Valid objects pass in eager mode
+    assert schema.validate_many(datasets[::2], executor=executor) == [None, None]
+
+
+def test_validate_many_eager_raises(schema, datasets):
+    with pytest.raises(SchemaError, match=r"got dtype\('int32'\)"):
+        schema.validate_many(datasets)
+
+
+def test_validate_many_as_completed(schema, datasets):
+    results = dict(schema.validate_many(datasets, mode="lazy", as_completed=True))
+    assert sorted(results) == [0, 1, 2, 3]
+    assert not results[2].has_errors
+    assert results[3].has_errors
+
+
+def test_validate_many_executor_instance(datasets):
+    schema = DataArraySchema(dtype=np.float64)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = schema.validate_many(
+            [ds["foo"] for ds in datasets], mode="lazy", executor=executor
+        )
+        # User-provided executors are not shut down
+        assert executor.submit(lambda: 1).result() == 1
+    assert [result.has_errors for result in results] == [False, True, False, True]
+
+    with pytest.raises(ValueError, match="executor must be"):
+        schema.validate_many([], executor="foo")
+
+
+@pytest.mark.parametrize("engine, suffix", [("netcdf4", ".nc"), ("zarr", ".zarr")])
+def test_validate_files(tmp_path, schema, datasets, engine, suffix):
+    pytest.importorskip("netCDF4" if engine == "netcdf4" else engine)
+    paths = []
+    for i, ds in enumerate(datasets):
+        path = tmp_path / f"data_{i}{suffix}"
+        if engine == "zarr":
+            ds.to_zarr(path)
+        else:
+            ds.to_netcdf(path, engine=engine)
+        paths.append(path)
+
+    results = dict(validate_files(schema, paths, engine=engine, workers=2))
+    assert [results[path].has_errors for path in paths] == [False, True, False, True]
+    assert [path for path, _ in results[paths[1]].errors] == ["data_vars.foo.dtype"]
+
+
+def test_validate_files_unreadable(tmp_path, schema):
+    path = tmp_path / "missing.nc"
+    ((_, result),) = validate_files(schema, [path], workers=1)
+    assert [error.code for _, error in result.errors] == ["file_unreadable"]
+
+
+def test_validate_files_dataarray(tmp_path, datasets):
+    pytest.importorskip("netCDF4")
+    path = tmp_path / "foo.nc"
+    datasets[1]["foo"].to_netcdf(path)
+    schema = DataArraySchema(dtype=np.int32, dims=["x"])
+    ((_, result),) = validate_files(schema, [path], workers=1)
+    assert not result.has_errors
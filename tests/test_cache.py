@@ -0,0 +1,131 @@
+"""Tests for validation outcome caching."""
+
+import pickle
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from xarray_validate import (
+    DataArraySchema,
+    DatasetSchema,
+    SchemaError,
+    ValidationCache,
+)
+
+
+def test_cache_lru():
+    cache = ValidationCache(maxsize=2)
+    cache.put("a", ())
+    cache.put("b", ())
+    assert cache.get("a") == ()  # "a" is now the most recently used entry
+    cache.put("c", ())
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+    with pytest.raises(ValueError, match="'maxsize' must be positive"):
+        ValidationCache(maxsize=0)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, None), (False, None), (True, 128), (16, 16)],
+)
+def test_cache_convert(value, expected):
+    schema = DataArraySchema(cache=value)
+    if expected is None:
+        assert schema.cache is None
+    else:
+        assert schema.cache.maxsize == expected
+
+
+def test_dataarray_cache():
+    schema = DataArraySchema(
+        dtype=np.float64, dims=["x"], attrs={"units": "m"}, cache=8
+    )
+    da = xr.DataArray(np.zeros(3), dims="x", attrs={"units": "m"})
+
+    schema.validate(da)
+    schema.validate(da.copy(data=np.ones(3)))  # Same structure, different values
+    assert (schema.cache.hits, schema.cache.misses) == (1, 1)
+
+    # Replayed errors are reported like fresh ones
+    invalid = da.astype("int64")
+    result = schema.validate(invalid, mode="lazy")
+    assert [path for path, _ in result.errors] == ["dtype"]
+    assert schema.validate(invalid, mode="lazy").errors[0][0] == "dtype"
+    assert schema.cache.hits == 2
+    with pytest.raises(SchemaError, match="dtype mismatch"):
+        schema.validate(invalid)
+    assert not schema.is_valid(invalid)
+    assert schema.is_valid(da)
+
+    # Attribute values are part of the fingerprint
+    assert not schema.is_valid(da.assign_attrs(units="km"))
+
+    # Reassigning a field invalidates the cache
+    schema.dtype = np.int64
+    assert len(schema.cache) == 0
+    schema.validate(invalid)
+
+    # Unset slots are not part of the fingerprint
+    schema = DataArraySchema(dims=["x"], cache=True)
+    schema.validate(da)
+    schema.validate(da.astype("int32").rename("foo"))
+    assert schema.cache.hits == 1
+
+
+def test_cache_chunks_fingerprint():
+    # Chunks are validated against dimensions, which must be part of the key
+    schema = DataArraySchema(chunks={"x": 2}, cache=True)
+    da = xr.DataArray(np.zeros((4, 4)), dims=["x", "y"]).chunk({"x": 2, "y": 4})
+    schema.validate(da)
+    # Same chunks, transposed dimensions
+    with pytest.raises(SchemaError, match="chunk mismatch"):
+        schema.validate(da.rename({"x": "y", "y": "x"}))
+    # Same chunks, missing dimension: fails like the uncached schema
+    with pytest.raises(KeyError):
+        schema.validate(da.rename({"x": "z"}))
+    assert schema.cache.hits == 0
+
+
+def test_cache_bypassed_with_checks(ds):
+    def check(da):
+        assert (da > 0).all()
+
+    schema = DataArraySchema(coords={"x": DataArraySchema(checks=[check])}, cache=True)
+    schema.validate(ds["foo"].assign_coords(x=[1, 2, 3, 4]))
+    with pytest.raises(AssertionError):
+        schema.validate(ds["foo"])
+    assert len(schema.cache) == 0
+
+
+def test_dataset_cache(ds):
+    schema = DatasetSchema(
+        data_vars={"foo": DataArraySchema(dtype=np.int32), "b*": DataArraySchema()},
+        coords={"x": DataArraySchema(dtype=np.int64)},
+        cache=True,
+    )
+    schema.validate(ds)
+    schema.validate(ds + 1)
+    assert (schema.cache.hits, schema.cache.misses) == (1, 1)
+
+    result = schema.validate(ds.drop_vars("foo"), mode="lazy", max_errors=1)
+    assert [path for path, _ in result.errors] == ["<root>"]
+
+    schema.data_vars = {"foo": DataArraySchema(dtype=np.float64)}
+    assert len(schema.cache) == 0
+    assert not schema.is_valid(ds)
+
+
+def test_cache_pickle(ds):
+    schema = DataArraySchema(dtype=np.int32, cache=True)
+    schema.validate(ds["foo"])
+    restored = pickle.loads(pickle.dumps(schema))
+    restored.validate(ds["foo"])
+    assert restored.cache.hits == 1
@@ -1,5 +1,6 @@
 import dask.array
 import numpy as np
+import pandas as pd
 import pytest
 import xarray as xr
 
@@ -12,12 +13,17 @@ from xarray_validate import (
     DataArraySchema,
     DimsSchema,
     DTypeSchema,
+    IndexSchema,
     NameSchema,
     SchemaError,
     ShapeSchema,
+    TimeAxisSchema,
     ValidationContext,
+    ValuesSchema,
+    components,
     testing,
 )
+from xarray_validate.components import compute_statistics
 
 
 class TestAttrSchema:
@@ -44,6 +50,7 @@ class TestAttrSchema:
     def test_attr_schema_basic(self, kwargs, validate, json):
         schema = AttrSchema(**kwargs)
         schema.validate(validate)
+        assert schema.is_valid(validate)
         assert schema.serialize() == json
 
     def test_exact_value_match(self):
@@ -182,11 +189,13 @@ class TestAttrSchema:
         # Test valid values
         for value in valid_values:
             schema.validate(value)
+            assert schema.is_valid(value)
 
         # Test invalid values
         for value in invalid_values:
             with pytest.raises(SchemaError, match="(Unit mismatch|Invalid unit)"):
                 schema.validate(value)
+            assert not schema.is_valid(value)
 
     @pytest.mark.parametrize(
         "schema_kwargs, valid_values, invalid_values",
@@ -357,6 +366,7 @@ class TestAttrsSchema:
 
         for v in validate:
             schema.validate(v)
+            assert schema.is_valid(v)
 
         testing.assert_json(schema, json)
 
@@ -438,6 +448,9 @@ class TestAttrsSchema:
             schema.validate(
                 {"valid_min": 0.0, "units": "meters", "unexpected": "value"}
             )
+        assert not schema.is_valid(
+            {"valid_min": 0.0, "units": "meters", "unexpected": "value"}
+        )
 
     def test_multiple_patterns(self):
         """Test multiple pattern keys."""
@@ -449,6 +462,14 @@ class TestAttrsSchema:
             {"valid_min": 0.0, "valid_max": 0.0, "flag_0": True, "flag_1": True}
         )
 
+    def test_overlapping_patterns(self):
+        """Test that attributes are validated against all matching patterns."""
+        schema = AttrsSchema.deserialize({"valid_*": 0.0, "*_max": 1.0})
+        schema.validate({"valid_min": 0.0, "flag_max": 1.0})
+        with pytest.raises(SchemaError):
+            schema.validate({"valid_max": 0.0})
+        assert not schema.is_valid({"valid_max": 1.0})
+
     def test_pattern_validation_failure(self):
         """Test that pattern validation catches value mismatches."""
         schema = AttrsSchema.deserialize({"valid_*": 0.0})
@@ -456,6 +477,7 @@ class TestAttrsSchema:
         # Raises when pattern-matched values don't validate
         with pytest.raises(SchemaError, match="name .* != .*"):
             schema.validate({"valid_min": "wrong_type"})
+        assert not schema.is_valid({"valid_min": "wrong_type"})
 
     def test_empty_pattern_matches_nothing(self):
         """Test that schema with only patterns doesn't require any keys."""
@@ -479,6 +501,20 @@ class TestAttrsSchema:
                 {"attrs": {"{[a-z]+_[0-9]{2}}": 100}, "allow_extra_keys": False}
             ).validate({"foo_1": 100})
 
+    def test_key_table_rebuilt_on_assignment(self):
+        """Test that pattern keys are recompiled when attrs are reassigned."""
+        schema = AttrsSchema.deserialize({"attrs": {"valid_*": 0.0}})
+        key_table = schema._key_table
+        schema.validate({"valid_min": 0.0})
+        # Validation reuses the cached key table
+        assert schema._key_table is key_table
+
+        schema.attrs = {"{flag_\\d+}": AttrSchema(value=True)}
+        assert schema._key_table is not key_table
+        schema.validate({"valid_min": 0.0, "flag_0": True})
+        with pytest.raises(SchemaError):
+            schema.validate({"flag_0": False})
+
 
 class TestDTypeSchema:
     VALIDATION_VALUES = {
@@ -528,6 +564,354 @@ class TestDTypeSchema:
             DTypeSchema("integer").validate(np.dtype(dtype))
 
 
+class TestIndexSchema:
+    @pytest.mark.parametrize("indexed", [True, False])
+    @pytest.mark.parametrize(
+        "kwargs, values, codes",
+        [
+            ({"monotonic": "increasing", "unique": True}, [1, 2, 3], []),
+            ({"monotonic": "increasing"}, [1, 2, 2], []),
+            (
+                {"monotonic": "increasing", "unique": True},
+                [1, 2, 2],
+                ["index_not_unique"],
+            ),
+            ({"monotonic": "decreasing"}, [1, 2, 3], ["index_not_monotonic"]),
+            (
+                {"monotonic": "increasing", "unique": True},
+                [1, 3, 1],
+                ["index_not_monotonic", "index_not_unique"],
+            ),
+            ({"unique": True}, [3, 1, 3], ["index_not_unique"]),
+            ({"regular": True}, [0.0, 0.1, 0.2, 0.3], []),
+            ({"step": 0.1}, [0.0, 0.1, 0.2, 0.4], ["index_not_regular"]),
+            ({"step": 2}, [0, 2, 4], []),
+            ({"step": 2, "tolerance": 1}, [0, 2, 5], []),
+            ({"regular": True}, [0, 2, 5], ["index_not_regular"]),
+            ({"step": -2}, np.array([5, 3, 1], dtype="uint32"), []),
+            (
+                {"regular": True},
+                np.array([5, 3, 0], dtype="uint8"),
+                ["index_not_regular"],
+            ),
+            (
+                {"step": np.timedelta64(1, "h")},
+                np.arange(4).astype("datetime64[h]").astype("datetime64[ns]"),
+                [],
+            ),
+            (
+                {"monotonic": "increasing", "step": np.timedelta64(1, "D")},
+                np.array(["2000-01-02", "2000-01-01"], dtype="datetime64[ns]"),
+                ["index_not_monotonic", "index_not_regular"],
+            ),
+        ],
+    )
+    def test_index_schema(self, kwargs, values, codes, indexed):
+        schema = IndexSchema(**kwargs)
+        if indexed:
+            coord = xr.Dataset(coords={"x": values})["x"]
+            assert "x" in coord.xindexes
+        else:
+            coord = xr.DataArray(values, dims="y", name="x")
+
+        context = ValidationContext(mode="lazy")
+        schema.validate(coord, context)
+        assert [error.code for _, error in context.result.errors] == codes
+        assert schema.is_valid(coord) is not codes
+
+    def test_index_schema_error(self):
+        coord = xr.DataArray([0, 1, 2, 4, 5], dims="x")
+        with pytest.raises(
+            SchemaError,
+            match="not regularly spaced: got step 2 at position 2, expected 1",
+        ):
+            IndexSchema(regular=True).validate(coord)
+
+        # Unsigned differences do not wrap around
+        coord = xr.DataArray(np.array([9, 7, 4], dtype="uint32"), dims="x")
+        context = ValidationContext(mode="lazy")
+        IndexSchema(step=-2).validate(coord, context)
+        ((_, error),) = context.result.errors
+        assert str(error) == (
+            "index is not regularly spaced: got step -3 at position 1, expected -2"
+        )
+
+        # Range indexes are regular by construction
+        assert IndexSchema(step=2).is_valid(pd.RangeIndex(0, 10**12, 2))
+        assert not IndexSchema(step=3).is_valid(pd.RangeIndex(0, 10**12, 2))
+
+    def test_index_schema_blocks(self, monkeypatch):
+        monkeypatch.setattr(components, "_INDEX_BLOCK_SIZE", 3)
+        values = np.arange(10)
+        values[7] = 6
+        coord = xr.DataArray(values, dims="y")
+        assert IndexSchema(monotonic="increasing").is_valid(coord)
+        assert not IndexSchema(monotonic="increasing", unique=True).is_valid(coord)
+        with pytest.raises(SchemaError, match="at position 6"):
+            IndexSchema(step=1).validate(coord)
+
+
+class TestTimeAxisSchema:
+    @pytest.fixture
+    def time(self):
+        return pd.date_range("2000-01-01", periods=24, freq="h")
+
+    def test_time_axis_schema(self, time):
+        schema = TimeAxisSchema(freq="1h")
+        assert schema.step == np.timedelta64(1, "h")
+        schema.validate(xr.Dataset(coords={"time": time})["time"])
+        assert not TimeAxisSchema(freq="30min").is_valid(time.values)
+
+        # Gaps and duplicates are reported as ranges and runs
+        values = time.delete([3, 4, 5, 10]).insert(11, time[14]).insert(11, time[14])
+        context = ValidationContext(mode="lazy")
+        schema.validate(xr.DataArray(values, dims="time"), context)
+        (_, gaps), (_, duplicates) = context.result.errors
+        assert gaps.code == "time_gaps"
+        assert gaps.params["positions"].tolist() == [2, 6]
+        assert gaps.params["sizes"].tolist() == [3, 1]
+        assert str(gaps) == (
+            "2 gaps (4 missing timestamps): 2000-01-01 03:00:00 to "
+            "2000-01-01 05:00:00 (3), 2000-01-01 10:00:00 to 2000-01-01 10:00:00 (1)"
+        )
+        assert duplicates.code == "time_duplicates"
+        assert duplicates.params["positions"].tolist() == [10]
+        assert duplicates.params["sizes"].tolist() == [3]
+        assert str(duplicates) == "1 duplicated timestamps: 2000-01-01 14:00:00 (x3)"
+
+        schema = TimeAxisSchema(freq="1h", allow_gaps=True, allow_duplicates=True)
+        assert schema.is_valid(values)
+
+    def test_time_axis_schema_off_cadence(self, time):
+        values = time.insert(5, time[4] + pd.Timedelta("30min"))
+        with pytest.raises(
+            SchemaError,
+            match=r"2 time steps do not match frequency 1h, first at position 4 "
+            r"\(got 0 days 00:30:00\)",
+        ):
+            TimeAxisSchema(freq="1h", allow_gaps=True).validate(values.values)
+
+        # Unsorted time axes do not follow the cadence
+        assert not TimeAxisSchema(freq="h").is_valid(time[::-1].values)
+
+    def test_time_axis_schema_blocks(self, monkeypatch, time):
+        monkeypatch.setattr(components, "_INDEX_BLOCK_SIZE", 5)
+        context = ValidationContext(mode="lazy")
+        TimeAxisSchema(freq="1h").validate(time.delete([4, 5, 6, 12]).values, context)
+        ((_, error),) = context.result.errors
+        assert error.params["missing"] == 4
+        assert error.params["sizes"].tolist() == [3, 1]
+
+    def test_time_axis_schema_large(self, monkeypatch):
+        # Every other step is missing: errors are not built by is_valid, and
+        # only the ranges shown in messages are converted to timestamps
+        time = pd.date_range("2000-01-01", periods=200_000, freq="2h")
+        schema = TimeAxisSchema(freq="1h")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("error built by is_valid")
+
+        with monkeypatch.context() as m:
+            m.setattr(components, "SchemaError", fail)
+            assert not schema.is_valid(time.values)
+
+        context = ValidationContext(mode="lazy")
+        schema.validate(time.values, context)
+        ((_, error),) = context.result.errors
+        assert error.params["positions"].size == 199_999
+        assert error.params["missing"] == 199_999
+        assert str(error).startswith(
+            "199999 gaps (199999 missing timestamps): 2000-01-01 01:00:00 to "
+            "2000-01-01 01:00:00 (1), "
+        )
+        assert str(error).endswith(", ...")
+
+        # Duplicates are reported as runs without building timestamps
+        values = np.repeat(time.values, 2)
+        context = ValidationContext(mode="lazy")
+        TimeAxisSchema(freq="2h").validate(values, context)
+        ((_, error),) = context.result.errors
+        assert error.code == "time_duplicates"
+        assert error.params["positions"].size == 200_000
+        assert (error.params["sizes"] == 2).all()
+
+    def test_time_axis_schema_cftime(self):
+        pytest.importorskip("cftime")
+        time = xr.date_range(
+            "2000-02-27", periods=5, freq="D", calendar="noleap", use_cftime=True
+        )
+        schema = TimeAxisSchema(freq="1D")
+        assert schema.is_valid(xr.Dataset(coords={"time": time})["time"])
+        assert schema.is_valid(np.asarray(time))
+
+        values = np.asarray(time.delete(2))
+        with pytest.raises(SchemaError, match="2000-03-01 00:00:00 to 2000-03-01"):
+            schema.validate(values)
+
+    def test_time_axis_schema_invalid(self):
+        with pytest.raises(ValueError, match="'freq' must be a fixed frequency"):
+            TimeAxisSchema(freq="MS")
+        with pytest.raises(ValueError, match="'freq' must be positive"):
+            TimeAxisSchema(freq=np.timedelta64(0, "s"))
+        with pytest.raises(TypeError, match="datetime64 or cftime"):
+            TimeAxisSchema(freq="1h").validate(np.arange(3))
+
+
+class TestValuesSchema:
+    @pytest.mark.parametrize("lazy", [False, True])
+    @pytest.mark.parametrize(
+        "kwargs, data, codes",
+        [
+            ({"min": 0, "max": 3}, [0.0, 1.0, np.nan, 3.0], []),
+            (
+                {"min": 1, "max": 2},
+                [0.0, 1.0, np.nan, 3.0],
+                ["values_below_min", "values_above_max"],
+            ),
+            ({"max_nan_fraction": 0.25}, [0.0, 1.0, np.nan, 3.0], []),
+            (
+                {"max_nan_fraction": 0.1},
+                [0.0, 1.0, np.nan, 3.0],
+                ["nan_fraction_exceeded"],
+            ),
+            ({"finite": True}, [0.0, 1.0, np.inf], ["values_not_finite"]),
+            ({"finite": True, "min": 0}, [0, 1, 2], []),
+            (
+                {"min": 0, "max_nan_fraction": 0.5},
+                [np.nan, np.nan],
+                ["nan_fraction_exceeded"],
+            ),
+            ({"min": 0, "finite": True}, [], []),
+        ],
+    )
+    def test_values_schema(self, kwargs, data, codes, lazy):
+        schema = ValuesSchema(**kwargs)
+        data = np.array(data)
+        if lazy:
+            data = dask.array.from_array(data, chunks=2)
+
+        context = ValidationContext(mode="lazy")
+        schema.validate(data, context)
+        assert [error.code for _, error in context.result.errors] == codes
+        assert schema.is_valid(data) is not codes
+
+    def test_values_schema_serialize(self):
+        schema = ValuesSchema.deserialize({"min": 0, "finite": True})
+        testing.assert_json(
+            schema,
+            {
+                "min": 0,
+                "max": None,
+                "max_nan_fraction": None,
+                "finite": True,
+                "blockwise": False,
+                "sample": None,
+                "seed": 0,
+            },
+        )
+        with pytest.raises(ValueError):
+            ValuesSchema(max_nan_fraction=2.0)
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_values_schema_blockwise(self, lazy):
+        data = np.zeros((4, 6))
+        data[1, 4] = -1.0
+        data[3, 5] = -1.0
+        data[2, 1] = np.inf
+        if lazy:
+            data = dask.array.from_array(data, chunks=(2, 3))
+        schema = ValuesSchema(min=0, finite=True, max_nan_fraction=0.0, blockwise=True)
+
+        context = ValidationContext(mode="lazy")
+        schema.validate(data, context)
+        errors = [error for _, error in context.result.errors]
+        assert [error.code for error in errors] == [
+            "chunks_out_of_range",
+            "chunks_not_finite",
+        ]
+        if lazy:
+            assert errors[0].params["count"] == 2
+            assert errors[0].params["total"] == 4
+            assert errors[0].params["blocks"] == [(0, 1), (1, 1)]
+            assert str(errors[0]) == (
+                "2 chunks out of range, first at block (0, 1) (element offset (1, 1))"
+            )
+            assert errors[1].params["block"] == (1, 0)
+            assert errors[1].params["offset"] == (0, 1)
+        else:  # Small arrays fit in a single chunk
+            assert errors[0].params["block"] == (0, 0)
+            assert errors[0].params["offset"] == (1, 4)
+        assert not schema.is_valid(data)
+
+        # Variables are chunked without being loaded
+        variable = xr.Variable(("x", "y"), np.arange(24.0).reshape(4, 6))
+        schema = ValuesSchema(min=0, max=23, max_nan_fraction=0.0, blockwise=True)
+        assert schema.is_valid(variable)
+        schema.max = 22
+        with pytest.raises(SchemaError, match="1 chunks out of range"):
+            schema.validate(variable)
+
+    def test_values_schema_sample(self):
+        data = dask.array.zeros((10, 10), chunks=(2, 5))  # 10 chunks of 10
+        data[9, 9] = -1.0
+
+        # Sampling is reproducible
+        schema = ValuesSchema(min=0, sample=4, seed=1)
+        (a,) = compute_statistics([schema.statistics(data)])
+        (b,) = compute_statistics([schema.statistics(data)])
+        assert a["block_indices"] == b["block_indices"]
+        assert len(a["block_indices"]) == 4
+        assert a["block_indices"] == sorted(a["block_indices"])
+
+        context = ValidationContext(mode="lazy")
+        schema.validate(data, context)
+        coverage = context.result.coverage["<root>"]
+        assert (coverage.chunks_checked, coverage.chunks_total) == (4, 10)
+        assert (coverage.elements_checked, coverage.elements_total) == (40, 100)
+        assert coverage.fraction == 0.4
+        # The sample misses the failing chunk (4, 1)
+        assert a["block_indices"] == [(0, 0), (2, 0), (3, 1), (4, 0)]
+        assert coverage.chunks_failed == 0
+        assert not context.result.errors
+        assert coverage.max_failing_fraction == pytest.approx(1 - 0.05**0.25)
+        assert "with 95% confidence, less than 0.527 of chunks fail" in (
+            coverage.statement
+        )
+
+        # The sample hits the failing chunk
+        context = ValidationContext(mode="lazy")
+        ValuesSchema(min=0, sample=4, seed=3).validate(data, context)
+        coverage = context.result.coverage["<root>"]
+        assert coverage.chunks_failed == 1
+        assert coverage.max_failing_fraction is None
+        assert [error.code for _, error in context.result.errors] == [
+            "chunks_out_of_range"
+        ]
+
+        # Fractions are fractions of elements covered by the sampled chunks
+        context = ValidationContext(mode="lazy")
+        ValuesSchema(min=0, sample=0.25).validate(data, context)
+        assert context.result.coverage["<root>"].chunks_checked == 3
+
+        # Full coverage
+        context = ValidationContext(mode="lazy")
+        ValuesSchema(min=0, sample=1.0).validate(data, context)
+        coverage = context.result.coverage["<root>"]
+        assert coverage.chunks_failed == 1
+        assert [error.code for _, error in context.result.errors] == [
+            "chunks_out_of_range"
+        ]
+        assert "1 failed" in coverage.statement
+
+    @pytest.mark.parametrize(
+        "sample, error",
+        [(0, ValueError), (1.5, ValueError), (0.0, ValueError), (True, TypeError)],
+    )
+    def test_values_schema_sample_invalid(self, sample, error):
+        with pytest.raises(error, match="'sample' must"):
+            ValuesSchema(sample=sample)
+
+
 @pytest.mark.parametrize(
     "component, schema_args, validate, json",
     [
@@ -587,8 +971,10 @@ def test_component_schema(component, schema_args, validate, json):
     for v in validate:
         if component in [ChunksSchema]:  # special case construction
             schema.validate(*v)
+            assert schema.is_valid(*v)
         else:
             schema.validate(v)
+            assert schema.is_valid(v)
 
     # JSON checks
     assert schema.serialize() == json, f"JSON export of {component} failed"
@@ -639,6 +1025,7 @@ def test_dims_schema(dims, ordered, validate, json):
     # Validation
     for v in validate:
         schema.validate(v)
+        assert schema.is_valid(v)
 
     # JSON checks
     assert schema.serialize() == json
@@ -713,6 +1100,12 @@ def test_component_raises_schema_error(component, schema_args, value, match):
         else:
             schema.validate(value)
 
+    # The boolean fast path agrees with validate()
+    if component in [ChunksSchema]:
+        assert not schema.is_valid(*value)
+    else:
+        assert not schema.is_valid(value)
+
 
 @pytest.mark.parametrize(
     "dims, ordered, value, match",
@@ -746,6 +1139,7 @@ def test_dims_raises_schema_error(dims, ordered, value, match):
 
     with pytest.raises(SchemaError, match=match):
         schema.validate(value)
+    assert not schema.is_valid(value)
 
 
 def test_chunks_schema_raises_for_invalid_chunks():
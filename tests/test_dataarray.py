@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 import pytest
 import xarray as xr
@@ -10,6 +12,7 @@ from xarray_validate import (
     DimsSchema,
     DTypeSchema,
     NameSchema,
+    SchemaError,
     ShapeSchema,
 )
 
@@ -113,3 +116,128 @@ def test_schema_from_dataarray(ds):
         "attrs": {"require_all_keys": True, "allow_extra_keys": True, "attrs": {}},
     }
     assert schema.serialize() == expected
+
+
+def test_compile_dataarray(ds):
+    da = ds["bar"]
+    schema = DataArraySchema(dtype=np.float64, dims=["x", "y"], shape=(4, None))
+    plan = schema.compile()
+
+    # Unset slots are not part of the plan
+    assert [step.path for step in plan.steps] == ["dtype", "dims", "shape"]
+    assert plan.validate(da) is None
+    assert not plan.validate(da, mode="lazy").has_errors
+
+    # Plans are reusable and report errors like the schema they derive from
+    result = plan.validate(ds["foo"], mode="lazy")
+    assert [path for path, _ in result.errors] == [
+        path for path, _ in schema.validate(ds["foo"], mode="lazy").errors
+    ]
+    with pytest.raises(SchemaError, match="dtype mismatch"):
+        plan.validate(ds["foo"])
+
+    with pytest.raises(ValueError, match="Input must be an xarray.DataArray"):
+        plan.validate(ds)
+
+
+def test_compile_dataarray_snapshot(ds):
+    schema = DataArraySchema(dtype=np.float64)
+    plan = schema.compile()
+    schema.dtype = np.int32
+
+    # Modifying the schema after compilation does not affect the plan
+    plan.validate(ds["bar"])
+    with pytest.raises(SchemaError):
+        schema.validate(ds["bar"])
+
+
+def test_compile_dataarray_memoized(ds, monkeypatch):
+    schema = DataArraySchema(dtype=np.float64, coords={"x": DataArraySchema()})
+    calls = []
+    compile = DataArraySchema._compile
+
+    def counting_compile(self, *args, **kwargs):
+        calls.append(self)
+        return compile(self, *args, **kwargs)
+
+    monkeypatch.setattr(DataArraySchema, "_compile", counting_compile)
+
+    # Repeated validation reuses the memoized plan
+    for _ in range(3):
+        schema.validate(ds["bar"])
+        assert schema.is_valid(ds["bar"])
+    assert calls == [schema, schema.coords.coords["x"]]
+    assert schema.compile() is schema.compile()
+
+    # Reassigning a field, including a field of a child schema, recompiles
+    schema.coords.coords["x"].dtype = np.int32
+    assert not schema.is_valid(ds["bar"])
+    assert len(calls) == 4
+    schema.dtype = np.int32
+    with pytest.raises(SchemaError, match="dtype mismatch"):
+        schema.validate(ds["bar"])
+    assert len(calls) == 6
+
+    # The memoized plan is not pickled
+    restored = pickle.loads(pickle.dumps(schema))
+    assert restored == schema
+    assert not restored.is_valid(ds["bar"])
+
+
+def test_is_valid(ds):
+    schema = DataArraySchema(
+        dtype=np.float64,
+        dims=["x", "y"],
+        shape=(4, None),
+        coords={"x": DataArraySchema(dtype=np.int64)},
+        attrs={},
+    )
+    assert schema.is_valid(ds["bar"])
+    assert not schema.is_valid(ds["foo"])
+    assert not schema.is_valid(ds["bar"].rename(x="z"))
+
+    def check_name(da):
+        assert da.name == "foo"
+
+    assert not DataArraySchema(checks=[check_name]).is_valid(ds["bar"])
+
+    with pytest.raises(ValueError, match="Input must be an xarray.DataArray"):
+        schema.is_valid(ds)
+
+
+def test_values(ds):
+    schema = DataArraySchema(values={"min": 0, "max": 1})
+    assert schema.serialize()["values"] == {
+        "min": 0,
+        "max": 1,
+        "max_nan_fraction": None,
+        "finite": False,
+        "blockwise": False,
+        "sample": None,
+        "seed": 0,
+    }
+    schema.validate(ds["foo"])
+    with pytest.raises(SchemaError, match="minimum value -2 is below lower bound 0"):
+        DataArraySchema(coords={"x": DataArraySchema(values={"min": 0})}).validate(
+            ds["foo"]
+        )
+
+
+def test_values_sample():
+    dask_array = pytest.importorskip("dask.array")
+    read = []
+
+    def record(block, block_info=None):
+        read.append(block_info[0]["chunk-location"])
+        return block
+
+    data = dask_array.zeros((6, 6), chunks=3).map_blocks(record, dtype=float)
+    da = xr.DataArray(data, dims=("x", "y"))
+    schema = DataArraySchema(values={"min": 0, "sample": 2, "seed": 3})
+    result = schema.validate(da, mode="lazy")
+    assert not result.has_errors
+    assert result.coverage["values"].chunks_checked == 2
+    assert result.coverage["values"].chunks_total == 4
+
+    # Only sampled chunks are read
+    assert len(read) == 2
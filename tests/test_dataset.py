@@ -1,9 +1,12 @@
+import threading
+
 import numpy as np
+import pandas as pd
 import pytest
 import xarray as xr
 
-from xarray_validate import DataArraySchema, DatasetSchema
-from xarray_validate.base import SchemaError
+from xarray_validate import CoordsSchema, DataArraySchema, DatasetSchema
+from xarray_validate.base import SchemaError, ValidationContext
 from xarray_validate.components import AttrSchema, AttrsSchema
 
 
@@ -57,6 +60,53 @@ def test_checks_ds(ds):
     #     DatasetSchema(checks=[2])
 
 
+def test_checks_lazy(ds):
+    def check_foo(ds):
+        assert "foo" in ds, "foo is missing"
+
+    def check_schema(ds):
+        raise SchemaError("custom failure")
+
+    schema = DatasetSchema(checks=[check_foo, lambda ds: None, check_schema])
+    result = schema.validate(ds.drop_vars("foo"), mode="lazy")
+    assert [path for path, _ in result.errors] == [
+        "checks.check_foo",
+        "checks.check_schema",
+    ]
+    error = result.errors[0][1]
+    assert error.code == "check_failed"
+    assert isinstance(error.params["error"], AssertionError)
+    assert "check check_foo failed" in str(error)
+    assert list(result.check_durations) == [
+        "checks.check_foo",
+        "checks.1",
+        "checks.check_schema",
+    ]
+    assert all(duration >= 0 for duration in result.check_durations.values())
+
+
+@pytest.mark.parametrize("parallel_checks", [True, 2])
+def test_checks_parallel(ds, parallel_checks):
+    # Both checks must run at the same time for the barrier to be passed
+    barrier = threading.Barrier(2, timeout=5)
+
+    def check_a(ds):
+        barrier.wait()
+
+    def check_b(ds):
+        barrier.wait()
+        raise ValueError("b failed")
+
+    schema = DatasetSchema(checks=[check_b, check_a], parallel_checks=parallel_checks)
+    result = schema.validate(ds, mode="lazy")
+    assert [path for path, _ in result.errors] == ["checks.check_b"]
+    assert set(result.check_durations) == {"checks.check_a", "checks.check_b"}
+
+    barrier.reset()
+    with pytest.raises(ValueError, match="b failed"):
+        schema.validate(ds)
+
+
 def test_dataset_with_attrs_schema():
     name = "name"
     expected_value = "expected_value"
@@ -400,6 +450,34 @@ def test_pattern_exact_key_precedence():
     ds_schema.validate(ds)
 
 
+def test_overlapping_patterns():
+    """Test that variables are validated against all the patterns they match."""
+    ds = xr.Dataset(
+        {
+            "x_1": xr.DataArray([1, 2], dims=["time"]),
+            "x_a": xr.DataArray([1.0, 2.0], dims=["time"]),
+        },
+        coords={"c_1": ("time", [1, 2])},
+    )
+    ds_schema = DatasetSchema(
+        data_vars={
+            "x_*": DataArraySchema(dtype=np.float64),
+            "{x_\\d+}": DataArraySchema(dtype=np.int64),
+        }
+    )
+    result = ds_schema.validate(ds, mode="lazy")
+    assert [path for path, _ in result.errors] == ["data_vars.x_1.dtype"]
+    assert not ds_schema.is_valid(ds)
+
+    coords_schema = CoordsSchema(
+        {"c_*": DataArraySchema(dtype=np.int64), "*_1": DataArraySchema(name="c")}
+    )
+    context = ValidationContext(mode="lazy")
+    coords_schema.validate(ds.coords, context)
+    assert [path for path, _ in context.result.errors] == ["coords.c_1.name"]
+    assert not coords_schema.is_valid(ds.coords)
+
+
 def test_regex_vs_glob_patterns():
     """Test that regex patterns are more restrictive than glob patterns."""
     ds = xr.Dataset(
@@ -428,3 +506,247 @@ def test_regex_vs_glob_patterns():
     )
     with pytest.raises(SchemaError, match="data_vars has extra keys"):
         regex_schema.validate(ds)
+
+
+def test_compile_dataset(ds):
+    ds_schema = DatasetSchema(
+        data_vars={
+            "foo": DataArraySchema(dtype=np.int32, dims=["x"]),
+            "b*": DataArraySchema(dtype=np.float64),
+        },
+        coords={"x": DataArraySchema(dtype=np.int64)},
+        attrs={},
+    )
+    plan = ds_schema.compile()
+    assert plan.validate(ds) is None
+
+    ds["foo"] = ds.foo.astype("float32")
+    ds["baz"] = ds.bar.astype("int32")
+    result = plan.validate(ds, mode="lazy")
+    assert [path for path, _ in result.errors] == [
+        "data_vars.foo.dtype",
+        "data_vars.baz.dtype",
+    ]
+    assert [(path, str(error)) for path, error in result.errors] == [
+        (path, str(error)) for path, error in ds_schema.validate(ds, mode="lazy").errors
+    ]
+
+
+def test_key_table_rebuilt_on_assignment(ds):
+    ds_schema = DatasetSchema(
+        data_vars={"b*": DataArraySchema(dtype=np.float64)}, allow_extra_keys=False
+    )
+    with pytest.raises(SchemaError, match="data_vars has extra keys"):
+        ds_schema.validate(ds)
+
+    ds_schema.data_vars = {"*": DataArraySchema()}
+    ds_schema.validate(ds)
+
+    ds_schema.data_vars = None
+    ds_schema.validate(ds)
+
+
+def test_compile_dataset_memoized(ds, monkeypatch):
+    ds_schema = DatasetSchema(
+        data_vars={"b*": DataArraySchema(dtype=np.float64)},
+        coords={"x": DataArraySchema()},
+    )
+    calls = []
+    for cls in [DatasetSchema, CoordsSchema]:
+        monkeypatch.setattr(
+            cls,
+            "_compile",
+            lambda self, _compile=cls._compile: calls.append(self) or _compile(self),
+        )
+
+    # Repeated validation reuses the memoized plans of the schema tree
+    for _ in range(3):
+        ds_schema.validate(ds)
+        assert ds_schema.is_valid(ds)
+    assert calls == [ds_schema, ds_schema.coords]
+
+    # Reassigning a field of a child schema recompiles its parents
+    ds_schema.data_vars["b*"].dtype = np.int32
+    assert not ds_schema.is_valid(ds)
+    assert calls == [ds_schema, ds_schema.coords] * 2
+
+
+def test_is_valid(ds):
+    ds_schema = DatasetSchema(
+        data_vars={
+            "foo": DataArraySchema(dtype=np.int32, dims=["x"]),
+            "b*": DataArraySchema(dtype=np.float64),
+        },
+        coords={"x": DataArraySchema(dtype=np.int64)},
+        checks=[lambda ds: None],
+    )
+    assert ds_schema.is_valid(ds)
+
+    ds["baz"] = ds.bar.astype("int32")
+    assert not ds_schema.is_valid(ds)
+
+    # Failing checks are reported as invalid instead of raising
+    def check_foo(ds):
+        assert "foo" not in ds
+
+    assert not DatasetSchema(checks=[check_foo]).is_valid(ds)
+
+
+def test_values_fused_compute(monkeypatch):
+    dask = pytest.importorskip("dask")
+    compute = dask.compute
+    calls = []
+
+    def counting_compute(*args, **kwargs):
+        calls.append(args)
+        return compute(*args, **kwargs)
+
+    monkeypatch.setattr(dask, "compute", counting_compute)
+
+    ds = xr.Dataset(
+        {
+            "a": ("x", np.array([0.0, 1.0, np.nan, 3.0])),
+            "b_0": ("x", np.array([0.0, 1.0, 2.0, np.inf])),
+            "b_1": ("x", np.array([0.0, -1.0, 2.0, 3.0])),
+        }
+    ).chunk(x=2)
+    schema = DatasetSchema(
+        data_vars={
+            "a": {"values": {"min": 0, "max": 3, "max_nan_fraction": 0.5}},
+            "b_*": {"values": {"min": 0, "finite": True}},
+        }
+    )
+    result = schema.validate(ds, mode="lazy")
+    assert [(path, error.code) for path, error in result.errors] == [
+        ("data_vars.b_0.values", "values_not_finite"),
+        ("data_vars.b_1.values", "values_below_min"),
+    ]
+    assert len(calls) == 1
+
+    assert not schema.is_valid(ds)
+    assert len(calls) == 2
+
+
+def test_values_blockwise(tmp_path):
+    pytest.importorskip("netCDF4")
+    sst = np.full((4, 2, 6), 280.0)
+    sst[2, 1, 4] = 305.0
+    path = tmp_path / "sst.nc"
+    xr.Dataset({"sst": (("time", "y", "x"), sst)}).to_netcdf(path)
+
+    schema = DatasetSchema(
+        data_vars={"sst": {"values": {"min": 270, "max": 310, "blockwise": True}}}
+    )
+    # Unchunked file variables are read chunk by chunk
+    with xr.open_dataset(path) as ds:
+        assert schema.is_valid(ds)
+        schema.data_vars["sst"].values.max = 300
+        result = schema.validate(ds.chunk(time=1, x=3), mode="lazy")
+    ((path, error),) = result.errors
+    assert path == "data_vars.sst.values"
+    assert str(error) == (
+        "1 chunks out of range, first at block (2, 0, 1) (element offset (0, 1, 1))"
+    )
+
+
+def test_coords_indexes():
+    ds = xr.Dataset(
+        {"t": ("time", np.zeros(4))},
+        coords={"time": pd.date_range("2000-01-01", periods=4, freq="h")},
+    )
+    schema = DatasetSchema(
+        coords={
+            "coords": {},
+            "indexes": {
+                "time": {
+                    "monotonic": "increasing",
+                    "unique": True,
+                    "step": np.timedelta64(1, "h"),
+                },
+                "lat": {"monotonic": "increasing"},
+            },
+        }
+    )
+    assert schema.serialize()["coords"]["indexes"]["time"]["unique"]
+    assert schema.coords._has_checks()
+
+    result = schema.validate(ds, mode="lazy")
+    assert [(path, error.code) for path, error in result.errors] == [
+        ("coords", "key_missing")
+    ]
+
+    schema.coords.indexes = {"time": schema.coords.indexes["time"]}
+    schema.validate(ds)
+    result = schema.validate(ds.isel(time=[0, 1, 3]), mode="lazy")
+    assert [(path, error.code) for path, error in result.errors] == [
+        ("coords.coords.time.index", "index_not_regular")
+    ]
+    assert not schema.is_valid(ds.isel(time=[1, 0, 2]))
+
+
+def test_coords_time_axes():
+    time = pd.date_range("2000-01-01", periods=48, freq="h")
+    ds = xr.Dataset({"t": ("time", np.zeros(48))}, coords={"time": time})
+    schema = DatasetSchema(coords={"coords": {}, "time_axes": {"time": {"freq": "1h"}}})
+    assert schema.serialize()["coords"]["time_axes"] == {
+        "time": {"freq": "1h", "allow_gaps": False, "allow_duplicates": False}
+    }
+    schema.validate(ds)
+
+    result = schema.validate(ds.isel(time=np.r_[0:10, 20:48]), mode="lazy")
+    ((path, error),) = result.errors
+    assert path == "coords.coords.time.time_axis"
+    assert error.params["positions"].tolist() == [9]
+    assert str(error) == (
+        "1 gaps (10 missing timestamps): 2000-01-01 10:00:00 to 2000-01-01 19:00:00 "
+        "(10)"
+    )
+
+
+def test_variables_validated_without_dataarrays(monkeypatch):
+    ds = xr.Dataset(
+        {
+            "t2m": (("time", "x"), np.zeros((2, 3), dtype="f4"), {"units": "K"}),
+            "sst": ("x", np.zeros(3, dtype="f4")),
+        },
+        coords={"time": [0, 1], "x": [1, 2, 3], "lat": ("x", [0.0, 1.0, 2.0])},
+    )
+    built = []
+    getitem = xr.Dataset.__getitem__
+
+    def counting_getitem(self, key):
+        built.append(key)
+        return getitem(self, key)
+
+    monkeypatch.setattr(xr.Dataset, "__getitem__", counting_getitem)
+
+    schema = DatasetSchema(
+        data_vars={
+            "t2m": DataArraySchema(
+                dtype=np.float32,
+                dims=["time", "x"],
+                attrs={"units": AttrSchema(value="K")},
+                coords={"lat": DataArraySchema(dims=["x"]), "time": {}},
+            ),
+            "s*": DataArraySchema(dims=["x"], coords={"x": {"dtype": "int64"}}),
+        },
+        coords={"lat": DataArraySchema(dtype=np.float64)},
+    )
+    schema.validate(ds)
+    assert built == []
+
+    # Coordinates are attached to variables as xarray does
+    schema = DatasetSchema(
+        data_vars={"sst": DataArraySchema(coords={"time": {}}, name="sst")}
+    )
+    result = schema.validate(ds, mode="lazy")
+    assert {path for path, _ in result.errors} == {"data_vars.sst.coords"}
+    assert built == []
+
+    # Checks receive the DataArray they validate
+    def check_sst(da):
+        assert isinstance(da, xr.DataArray)
+        assert set(da.coords) == {"x", "lat"}
+
+    DatasetSchema(data_vars={"sst": DataArraySchema(checks=[check_sst])}).validate(ds)
+    assert built == ["sst"]
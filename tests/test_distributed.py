@@ -0,0 +1,71 @@
+"""Tests for validation against a distributed cluster."""
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from xarray_validate import DataArraySchema, DatasetSchema, SchemaError
+
+distributed = pytest.importorskip("distributed")
+
+
+@pytest.fixture(scope="module")
+def client():
+    with distributed.LocalCluster(
+        n_workers=2, threads_per_worker=1, processes=False, dashboard_address=None
+    ) as cluster, distributed.Client(cluster) as client:
+        yield client
+
+
+@pytest.fixture
+def ds():
+    return xr.Dataset(
+        {
+            "a": ("x", np.array([0.0, 1.0, np.nan, 3.0])),
+            "b": ("x", np.array([0.0, -1.0, 2.0, np.inf])),
+        },
+        coords={"x": ("x", np.arange(4.0)), "y": ("x", -np.arange(4.0))},
+    ).chunk(x=2)
+
+
+def test_validate_distributed(client, ds, monkeypatch):
+    graphs = []
+    get = client.get
+
+    def counting_get(dsk, keys, **kwargs):
+        graphs.append(keys)
+        return get(dsk, keys, **kwargs)
+
+    monkeypatch.setattr(client, "get", counting_get)
+
+    schema = DatasetSchema(
+        data_vars={
+            "a": {"values": {"min": 0, "max_nan_fraction": 0.1}},
+            "b": {
+                "values": {"min": 0, "finite": True, "blockwise": True},
+                "coords": {"coords": {"y": {"values": {"max": -1}}}},
+            },
+        },
+    )
+    result = schema.validate(ds, mode="lazy", client=client)
+    assert [(path, error.code) for path, error in result.errors] == [
+        ("data_vars.b.coords.coords.y.values", "values_above_max"),
+        ("data_vars.a.values", "nan_fraction_exceeded"),
+        ("data_vars.b.values", "chunks_out_of_range"),
+        ("data_vars.b.values", "chunks_not_finite"),
+    ]
+    # All value statistics are computed in a single graph
+    assert len(graphs) == 1
+
+    # Results match local validation
+    local = schema.validate(ds, mode="lazy")
+    assert sorted(path for path, _ in local.errors) == sorted(
+        path for path, _ in result.errors
+    )
+
+
+def test_validate_distributed_dataarray(client, ds):
+    schema = DataArraySchema(values={"min": 0, "max": 3}, dims=["x"])
+    schema.validate(ds["a"], client=client)
+    with pytest.raises(SchemaError, match="minimum value -1.0 is below lower bound 0"):
+        schema.validate(ds["b"], client=client)
@@ -0,0 +1,204 @@
+"""Tests for header-only validation of on-disk datasets."""
+
+import json
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from xarray_validate import DataArraySchema, DatasetSchema, SchemaError
+from xarray_validate.headers import (
+    DataArrayHeader,
+    decode_cf,
+    read_header,
+    read_zarr_header,
+)
+
+
+@pytest.fixture
+def dataset():
+    ds = xr.Dataset(
+        {
+            "t": (("time", "x"), np.zeros((4, 3), dtype="f4"), {"units": "K"}),
+            "q": ("x", np.arange(3, dtype="f4")),
+            "n": ("x", np.arange(3, dtype="i4")),
+        },
+        coords={
+            "time": np.arange(4).astype("datetime64[D]").astype("datetime64[ns]"),
+            "x": [1, 2, 3],
+            "lat": ("x", [1.0, 2.0, 3.0]),
+        },
+        attrs={"title": "foo"},
+    )
+    ds["q"].encoding = {"scale_factor": 0.1, "_FillValue": -1, "dtype": "i2"}
+    ds["t"].encoding = {"chunks": (2, 2)}
+    return ds
+
+
+def assert_header_matches(header, ds, check_chunks=True):
+    assert set(header.data_vars) == set(ds.data_vars)
+    assert set(header.coords) == set(ds.coords)
+    assert header.attrs == ds.attrs
+    for name, var in ds.variables.items():
+        expected = ds[name]
+        actual = header[name]
+        assert actual.dims == expected.dims
+        assert actual.shape == expected.shape
+        assert actual.dtype == expected.dtype
+        if check_chunks:
+            assert actual.chunks == expected.chunks
+        assert actual.attrs == expected.attrs
+        assert set(actual.coords) == set(expected.coords)
+
+
+@pytest.mark.parametrize("consolidated", [True, False])
+def test_read_zarr_header(tmp_path, dataset, consolidated):
+    pytest.importorskip("zarr")
+    path = tmp_path / "data.zarr"
+    dataset.to_zarr(path, consolidated=consolidated)
+
+    header = read_zarr_header(path)
+    assert_header_matches(header, xr.open_zarr(path, consolidated=consolidated))
+    assert read_header(path).data_vars.keys() == header.data_vars.keys()
+    assert read_header(path)["t"].chunks == header["t"].chunks
+
+    header = read_header(path, storage_chunks=False)
+    assert_header_matches(
+        header, xr.open_dataset(path, engine="zarr", consolidated=consolidated)
+    )
+
+    # Raw metadata
+    header = read_zarr_header(path, decode_cf=False)
+    assert header["q"].dtype == np.int16
+    assert header["q"].attrs == {
+        "coordinates": "lat",
+        "scale_factor": 0.1,
+        "_FillValue": -1,
+    }
+    assert header["time"].dtype == np.int64
+
+
+def test_read_zarr_v3_header(tmp_path):
+    path = tmp_path / "data.zarr"
+    (path / "foo").mkdir(parents=True)
+    (path / "zarr.json").write_text(
+        json.dumps({"zarr_format": 3, "node_type": "group", "attributes": {"a": 1}})
+    )
+    (path / "foo" / "zarr.json").write_text(
+        json.dumps(
+            {
+                "zarr_format": 3,
+                "node_type": "array",
+                "shape": [10, 4],
+                "data_type": "float32",
+                "chunk_grid": {
+                    "name": "regular",
+                    "configuration": {"chunk_shape": [4, 4]},
+                },
+                "dimension_names": ["x", "y"],
+                "fill_value": 0.0,
+                "attributes": {"units": "m"},
+            }
+        )
+    )
+
+    header = read_zarr_header(path)
+    assert header.attrs == {"a": 1}
+    foo = header.data_vars["foo"]
+    assert (foo.dims, foo.shape, foo.dtype) == (("x", "y"), (10, 4), np.float32)
+    assert foo.chunks == ((4, 4, 2), (4,))
+    assert foo.attrs == {"units": "m"}
+
+
+@pytest.mark.parametrize(
+    "dtype, attrs, expected_dtype, expected_attrs",
+    [
+        ("i2", {"scale_factor": np.float32(0.1)}, "f4", {}),
+        ("i2", {"scale_factor": 0.1, "add_offset": 1.0}, "f8", {}),
+        ("i2", {"_FillValue": -1}, "f4", {}),
+        ("i4", {"missing_value": -1, "units": "m"}, "f8", {"units": "m"}),
+        ("f4", {"_FillValue": np.nan}, "f4", {}),
+        ("i1", {"_Unsigned": "true"}, "u1", {}),
+        ("i8", {"units": "days since 2000-01-01"}, "M8[ns]", {}),
+        ("f8", {"units": "days since 2000-01-01", "calendar": "noleap"}, "O", {}),
+        ("S1", {"coordinates": "lat lon"}, "S1", {}),
+    ],
+)
+def test_decode_cf(dtype, attrs, expected_dtype, expected_attrs):
+    assert decode_cf(np.dtype(dtype), attrs) == (
+        np.dtype(expected_dtype),
+        expected_attrs,
+    )
+
+
+def test_validate_path(tmp_path, dataset):
+    pytest.importorskip("zarr")
+    path = tmp_path / "data.zarr"
+    dataset.to_zarr(path)
+
+    schema = DatasetSchema.from_dataset(xr.open_zarr(path))
+    schema.validate(path)
+    assert schema.is_valid(str(path))
+
+    schema = DatasetSchema(
+        data_vars={"t": DataArraySchema(dtype=np.float64, chunks={"time": 2})}
+    )
+    result = schema.validate(path, mode="lazy")
+    assert [path for path, _ in result.errors] == ["data_vars.t.dtype"]
+
+    with pytest.raises(ValueError, match="unsupported file format"):
+        schema.validate(tmp_path / "missing.zarr")
+
+
+def test_validate_dataarray_header():
+    header = DataArrayHeader(name="foo", dims=["x"], shape=[3], dtype="int32")
+    DataArraySchema(name="foo", dims=["x"], shape=(3,), dtype=np.int32).validate(header)
+    with pytest.raises(SchemaError, match="expected array to be chunked"):
+        DataArraySchema(chunks=True).validate(header)
+
+
+@pytest.mark.parametrize("format", ["NETCDF4", "NETCDF3_64BIT"])
+def test_read_netcdf_header(tmp_path, dataset, format):
+    pytest.importorskip("netCDF4")
+    path = tmp_path / "data.nc"
+    if format == "NETCDF4":
+        dataset["t"].encoding = {"chunksizes": (2, 2)}
+    else:
+        dataset["t"].encoding = {}
+    dataset.to_netcdf(path, format=format, engine="netcdf4")
+
+    # Variables are not chunked, as with a default open_dataset
+    header = read_header(path)
+    with xr.open_dataset(path) as ds:
+        assert_header_matches(header, ds)
+
+    # Optionally, chunked variables are reported with their on-disk chunks,
+    # contiguous variables are not chunked
+    header = read_header(path, storage_chunks=True)
+    if format == "NETCDF4":
+        assert header["t"].chunks == ((2, 2), (2, 1))
+        with xr.open_dataset(path, chunks={}) as ds:
+            assert header["t"].chunks == ds["t"].chunks
+    else:
+        assert header["t"].chunks is None
+    assert header["n"].chunks is None
+
+
+def test_validate_netcdf_path(tmp_path, dataset):
+    pytest.importorskip("netCDF4")
+    path = tmp_path / "data.nc"
+    dataset.to_netcdf(path, engine="netcdf4")
+
+    with xr.open_dataset(path) as ds:
+        schema = DatasetSchema.from_dataset(ds)
+    schema.validate(path)
+    schema.validate(str(path))
+
+    schema = DatasetSchema(data_vars={"q": DataArraySchema(dtype=np.int16)})
+    assert not schema.is_valid(path)
+
+    # Paths are chunked like datasets opened with default options
+    schema = DatasetSchema(data_vars={"t": DataArraySchema(chunks=False)})
+    with xr.open_dataset(path) as ds:
+        schema.validate(ds)
+    schema.validate(path)
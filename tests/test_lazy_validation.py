@@ -13,7 +13,10 @@ from xarray_validate import (
     SchemaError,
     ValidationContext,
     ValidationMode,
+    ValidationObserver,
     ValidationResult,
+    register_observer,
+    unregister_observer,
 )
 
 
@@ -51,6 +54,54 @@ class TestValidationResult:
         assert "Validation failed with errors:" in summary
         assert "test.path: Test error" in summary
 
+    def test_filter_errors(self):
+        result = ValidationResult()
+        result.add_error("dtype", SchemaError(code="dtype_mismatch"))
+        result.add_error("name", SchemaError(code="name_mismatch"))
+        result.add_error("other", SchemaError("Custom error"))
+
+        assert result.filter_errors("name_mismatch") == [result.errors[1]]
+        assert result.filter_errors("schema_error") == [result.errors[2]]
+        assert result.filter_errors("missing_keys") == []
+
+
+class TestSchemaError:
+    """Test SchemaError class."""
+
+    def test_message(self):
+        error = SchemaError("Test error")
+        assert error.code == "schema_error"
+        assert str(error) == "Test error"
+        assert repr(error) == "SchemaError('Test error')"
+
+    def test_deferred_message(self):
+        dims = ("x", "y")
+        error = SchemaError(code="dims_missing", got=dims, expected="z")
+        assert error.code == "dims_missing"
+        assert error.params == {"got": dims, "expected": "z"}
+        # Message is not rendered upon construction
+        assert error._message is None
+        assert str(error) == (
+            "dimension mismatch: expected z is missing from actual dimension "
+            "list ('x', 'y')"
+        )
+
+    def test_unknown_code(self):
+        error = SchemaError(code="custom", value=1)
+        assert str(error) == "value=1"
+
+    def test_pickle(self):
+        import pickle
+
+        for error in [
+            SchemaError("Test error"),
+            SchemaError(code="name_mismatch", got="foo", expected="bar"),
+        ]:
+            unpickled = pickle.loads(pickle.dumps(error))
+            assert unpickled.code == error.code
+            assert unpickled.params == error.params
+            assert str(unpickled) == str(error)
+
 
 class TestValidationContext:
     """Test ValidationContext class."""
@@ -83,6 +134,20 @@ class TestValidationContext:
         assert ctx2.mode == ctx.mode
         assert ctx2.result is ctx.result
 
+    def test_push_nested(self):
+        ctx = ValidationContext(path=["root"], mode="lazy")
+        leaf = ctx.push("data_vars.temp").push("attrs").push("attrs.units")
+
+        assert leaf.path == ["root", "data_vars.temp", "attrs", "attrs.units"]
+        assert leaf.get_path_string() == "root.data_vars.temp.attrs.attrs.units"
+        assert leaf.mode is ValidationMode.LAZY
+        assert leaf.result is ctx.result
+        assert "path=['root', 'data_vars.temp', 'attrs', 'attrs.units']" in repr(leaf)
+
+        # The error path is resolved when the error is recorded
+        leaf.handle_error(SchemaError("Test error"))
+        assert ctx.result.errors[0][0] == "root.data_vars.temp.attrs.attrs.units"
+
     def test_get_path_string_empty(self):
         ctx = ValidationContext()
         assert ctx.get_path_string() == "<root>"
@@ -322,6 +387,270 @@ class TestDatasetLazyValidation:
         assert len(result.errors) == 0
 
 
+class TestErrorBudget:
+    """Test error budget settings in lazy mode."""
+
+    @pytest.fixture
+    def ds(self):
+        return xr.Dataset(
+            {f"x_{i}": (["x"], np.arange(3, dtype=np.int32)) for i in range(10)}
+        )
+
+    @pytest.fixture
+    def schema(self):
+        return DatasetSchema(
+            data_vars={
+                "x_*": DataArraySchema(
+                    dtype=DTypeSchema(np.float64), dims=DimsSchema(["y"])
+                )
+            }
+        )
+
+    def test_no_budget(self, ds, schema):
+        result = schema.validate(ds, mode="lazy")
+        assert len(result.errors) == 20
+        assert result.truncated is False
+
+    def test_max_errors(self, ds, schema):
+        result = schema.validate(ds, mode="lazy", max_errors=3)
+        assert [path for path, _ in result.errors] == [
+            "data_vars.x_0.dtype",
+            "data_vars.x_0.dims",
+            "data_vars.x_1.dtype",
+        ]
+        assert result.truncated is True
+        assert "truncated" in result.get_error_summary()
+
+    def test_max_errors_not_reached(self, ds, schema):
+        result = schema.validate(ds, mode="lazy", max_errors=100)
+        assert len(result.errors) == 20
+        assert result.truncated is False
+
+    def test_max_errors_per_path(self):
+        da = xr.DataArray(np.zeros((2, 2)), dims=["x", "y"])
+        schema = DataArraySchema(dims=["a", "b"])
+        result = schema.validate(da, mode="lazy", max_errors_per_path=1)
+        assert [path for path, _ in result.errors] == ["dims"]
+        assert result.truncated is True
+
+    def test_context_budget(self, ds, schema):
+        ctx = ValidationContext(mode="lazy", max_errors=1)
+        assert ctx.push("foo").max_errors == 1
+        schema.validate(ds, context=ctx)
+        assert len(ctx.result.errors) == 1
+        assert ctx.stopped and ctx.result.truncated
+
+        # Errors reported after the budget is spent are dropped
+        ctx.handle_error(SchemaError("Test error"))
+        assert len(ctx.result.errors) == 1
+
+    def test_eager_ignores_budget(self, ds, schema):
+        with pytest.raises(SchemaError):
+            schema.validate(ds, max_errors=100)
+
+    @pytest.mark.parametrize("budget", ["max_errors", "max_errors_per_path"])
+    @pytest.mark.parametrize("value", [0, -1])
+    def test_invalid_budget(self, ds, schema, budget, value):
+        with pytest.raises(ValueError, match=f"'{budget}' must be positive"):
+            schema.validate(ds, mode="lazy", **{budget: value})
+        with pytest.raises(ValueError, match=f"'{budget}' must be positive"):
+            ValidationContext(mode="lazy", **{budget: value})
+
+
+class TestProfiling:
+    """Test per-path profiling of validation runs."""
+
+    @pytest.fixture
+    def ds(self):
+        return xr.Dataset(
+            {
+                "t2m": ("time", np.zeros(3), {"units": "K"}),
+                "sst": ("time", np.zeros(3), {"units": "K"}),
+            },
+            coords={"time": np.arange(3)},
+        )
+
+    @pytest.fixture
+    def schema(self):
+        def check_time(ds):
+            assert ds.sizes["time"] == 3
+
+        return DatasetSchema(
+            data_vars={
+                "t2m": DataArraySchema(dtype=np.float64, attrs={"units": "K"}),
+                "s*": DataArraySchema(dims=["x"]),
+            },
+            coords={"time": DataArraySchema(dtype=np.int64)},
+            checks=[check_time],
+        )
+
+    def test_disabled(self, ds, schema):
+        result = schema.validate(ds, mode="lazy")
+        assert result.profile == {}
+
+    def test_profile(self, ds, schema):
+        ctx = ValidationContext(mode="lazy", profile=True)
+        schema.validate(ds, context=ctx)
+        profile = ctx.result.profile
+        assert list(profile) == [
+            "<root>",
+            "data_vars.t2m",
+            "data_vars.t2m.dtype",
+            "data_vars.t2m.attrs",
+            "data_vars.sst",
+            "data_vars.sst.dims",
+            "coords",
+            "coords.coords.time",
+            "coords.coords.time.dtype",
+            "checks",
+        ]
+        assert all(entry.calls == 1 for entry in profile.values())
+        assert all(entry.memory is None for entry in profile.values())
+        # Times include children
+        assert profile["<root>"].time >= profile["data_vars.t2m"].time
+        assert profile["data_vars.t2m"].time >= profile["data_vars.t2m.dtype"].time
+
+        # Calls accumulate over runs sharing a result
+        schema.validate(ds, context=ctx)
+        assert profile["coords.coords.time"].calls == 2
+
+        table = ctx.result.get_profile_table(sort_by="time")
+        lines = table.splitlines()
+        assert lines[0].split() == ["path", "calls", "time", "(ms)"]
+        assert lines[1].startswith("<root>")
+        assert len(lines) == len(profile) + 1
+        with pytest.raises(ValueError, match="sort_by"):
+            ctx.result.get_profile_table(sort_by="foo")
+
+    def test_profile_eager_error(self, ds, schema):
+        ctx = ValidationContext(profile=True)
+        with pytest.raises(SchemaError):
+            schema.validate(ds, context=ctx)
+        # Paths are recorded up to the failure
+        assert list(ctx.result.profile)[-1] == "data_vars.sst.dims"
+        assert ctx.profiler.current is None
+
+    def test_trace_memory(self, ds):
+        tracemalloc = pytest.importorskip("tracemalloc")
+        if not hasattr(tracemalloc, "reset_peak"):
+            pytest.skip("requires Python 3.9+")
+
+        def allocate(ds):
+            _ = np.ones(1 << 20, dtype=np.uint8)
+
+        schema = DatasetSchema(
+            data_vars={"t2m": DataArraySchema(dtype=np.float64)}, checks=[allocate]
+        )
+        ctx = ValidationContext(mode="lazy", trace_memory=True)
+        schema.validate(ds, context=ctx)
+        profile = ctx.result.profile
+        assert profile["checks"].memory >= 1 << 20
+        assert profile["<root>"].memory >= profile["checks"].memory
+        assert profile["data_vars.t2m.dtype"].memory < 1 << 20
+        assert "memory (KiB)" in ctx.result.get_profile_table()
+        # Tracing started by the profiler is stopped when done
+        assert not tracemalloc.is_tracing()
+
+
+class RecordingObserver(ValidationObserver):
+    def __init__(self):
+        self.events = []
+
+    def on_validate_start(self, context, obj):
+        self.events.append(("start", context.get_path_string()))
+
+    def on_validate_end(self, context, duration, exception):
+        assert duration >= 0
+        self.events.append(("end", type(exception).__name__ if exception else None))
+
+    def on_node_enter(self, context):
+        self.events.append(("enter", context.get_path_string()))
+
+    def on_node_exit(self, context, duration):
+        assert duration >= 0
+        self.events.append(("exit", context.get_path_string()))
+
+    def on_error(self, context, error):
+        self.events.append(("error", context.get_path_string(), error.code))
+
+
+class TestObservers:
+    """Test validation event observers."""
+
+    @pytest.fixture
+    def da(self):
+        return xr.DataArray(np.zeros(3, dtype=np.int32), dims="x", name="foo")
+
+    @pytest.fixture
+    def schema(self):
+        return DataArraySchema(dtype=np.float64, name="foo")
+
+    def test_no_observer(self):
+        assert ValidationContext().notifier is None
+
+    def test_context_observer(self, da, schema):
+        observer = RecordingObserver()
+        ctx = ValidationContext(mode="lazy", observers=[observer])
+        assert ctx.push("foo").notifier is ctx.notifier
+        schema.validate(da, context=ctx)
+        assert observer.events == [
+            ("start", "<root>"),
+            ("enter", "<root>"),
+            ("enter", "dtype"),
+            ("error", "dtype", "dtype_mismatch"),
+            ("exit", "dtype"),
+            ("enter", "name"),
+            ("exit", "name"),
+            ("exit", "<root>"),
+            ("end", None),
+        ]
+
+    def test_eager_error(self, da, schema):
+        observer = RecordingObserver()
+        with pytest.raises(SchemaError):
+            schema.validate(da, context=ValidationContext(observers=[observer]))
+        assert observer.events[-4:] == [
+            ("error", "dtype", "dtype_mismatch"),
+            ("exit", "dtype"),
+            ("exit", "<root>"),
+            ("end", "SchemaError"),
+        ]
+
+    def test_global_observer(self, da, schema):
+        observer = RecordingObserver()
+        register_observer(observer)
+        register_observer(observer)  # Registered once
+        try:
+            schema.validate(da, mode="lazy")
+            schema.validate_many([da, da], mode="lazy")
+        finally:
+            unregister_observer(observer)
+        assert observer.events.count(("start", "<root>")) == 3
+
+        schema.validate(da, mode="lazy")
+        assert observer.events.count(("start", "<root>")) == 3
+        unregister_observer(observer)  # Unknown observers are ignored
+
+    def test_cached_schema(self, da):
+        # Cache misses and hits emit the same events
+        schema = DataArraySchema(dtype=np.float64, name="foo", cache=True)
+        observer = RecordingObserver()
+        register_observer(observer)
+        try:
+            schema.validate(da, mode="lazy")
+            miss = observer.events
+            observer.events = []
+            schema.validate(da, mode="lazy")
+            hit = observer.events
+        finally:
+            unregister_observer(observer)
+        assert (schema.cache.hits, schema.cache.misses) == (1, 1)
+        assert miss == hit
+        assert [event for event in hit if event[0] == "error"] == [
+            ("error", "dtype", "dtype_mismatch")
+        ]
+
+
 class TestNestedValidationPaths:
     """Test that error paths correctly represent the validation tree."""
 
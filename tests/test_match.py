@@ -5,10 +5,13 @@ import re
 import pytest
 
 from xarray_validate._match import (
+    KeyTable,
+    PatternMatcher,
     find_matched_keys,
     is_glob_pattern,
     is_pattern_key,
     is_regex_pattern,
+    literal_prefix,
     pattern_to_regex,
     separate_keys,
 )
@@ -292,3 +295,138 @@ def test_find_matched_keys(actual_keys, exact_keys, pattern_specs, expected):
     compiled_patterns = {k: pattern_to_regex(v) for k, v in pattern_specs.items()}
     matched = find_matched_keys(actual_keys, exact_keys, compiled_patterns)
     assert matched == expected
+
+
+class TestPatternMatcher:
+    """Tests for the PatternMatcher class."""
+
+    @staticmethod
+    def make_matcher(*keys):
+        return PatternMatcher({k: pattern_to_regex(k) for k in keys})
+
+    def test_empty(self):
+        matcher = self.make_matcher()
+        assert not matcher
+        assert matcher.match("x") == ()
+
+    @pytest.mark.parametrize(
+        "key, expected",
+        [
+            ("x_0", ("{x_\\d+}", "x_*")),
+            ("x_foo", ("x_*",)),
+            ("y_1", ("y_?",)),
+            ("y_10", ()),
+            ("z", ()),
+        ],
+    )
+    def test_match(self, key, expected):
+        matcher = self.make_matcher("{x_\\d+}", "x_*", "y_?")
+        assert matcher.match(key) == expected
+
+    def test_all_patterns_match(self):
+        """Test that all matching patterns are returned, in insertion order."""
+        assert self.make_matcher("x_*", "{x_\\d+}").match("x_0") == (
+            "x_*",
+            "{x_\\d+}",
+        )
+        assert self.make_matcher("{x_\\d+}", "x_*").match("x_0") == (
+            "{x_\\d+}",
+            "x_*",
+        )
+        matcher = self.make_matcher("{.*_0}", "{y_.*}", "{x_.*}", "*", "{x_\\d}")
+        assert matcher.match("x_0") == ("{.*_0}", "{x_.*}", "*", "{x_\\d}")
+        assert matcher.match("y_1") == ("{y_.*}", "*")
+
+    def test_patterns_with_groups(self):
+        """Test that groups in patterns do not confuse pattern identification."""
+        matcher = self.make_matcher(
+            "{(foo|bar)_(\\d+)}", "{(?P<name>[a-z]+)_max}", "{valid_(min|max)}"
+        )
+        assert matcher.match("foo_1") == ("{(foo|bar)_(\\d+)}",)
+        assert matcher.match("temp_max") == ("{(?P<name>[a-z]+)_max}",)
+        assert matcher.match("valid_max") == (
+            "{(?P<name>[a-z]+)_max}",
+            "{valid_(min|max)}",
+        )
+        assert matcher.match("valid_mean") == ()
+
+    @pytest.mark.parametrize(
+        "patterns, key, expected",
+        [
+            # Backreferences are shifted in a combined regex
+            (["{(a)\\1_\\d}", "*"], "aa_0", ("{(a)\\1_\\d}", "*")),
+            (["*", "{(a)\\1}"], "aa", ("*", "{(a)\\1}")),
+            (["x_*", "{(a)\\1}"], "aa", ("{(a)\\1}",)),
+            # Duplicate group names prevent combination
+            (["{(?P<n>x)_0}", "{(?P<n>x)_1}"], "x_1", ("{(?P<n>x)_1}",)),
+            # Global flags apply to the whole regex
+            (["{(?i)x}", "y"], "X", ("{(?i)x}",)),
+        ],
+        ids=["backref_first", "backref_last", "backref_only", "dup_names", "flags"],
+    )
+    def test_non_combinable_patterns(self, patterns, key, expected):
+        assert self.make_matcher(*patterns).match(key) == expected
+
+    @pytest.mark.parametrize(
+        "key, expected",
+        [
+            ("t2m_mean", ("t2m_*",)),
+            ("t2m_max", ("{.*_max}", "t2m_*")),
+            ("tp", ("t?",)),
+            ("sst_a", ("sst_[ab]*", "s*")),
+            ("sst_c", ("s*",)),
+            ("t2", ("t?",)),
+            ("u10", ()),
+        ],
+    )
+    def test_prefixed_patterns(self, key, expected):
+        """Test that patterns indexed by prefix are returned in order."""
+        matcher = self.make_matcher("{.*_max}", "t2m_*", "t?", "sst_[ab]*", "s*")
+        assert matcher.match(key) == expected
+
+    def test_many_prefixed_patterns(self):
+        keys = [f"var_{i}_*" for i in range(500)] + ["*"]
+        matcher = self.make_matcher(*keys)
+        assert matcher.match("var_250_x") == ("var_250_*", "*")
+        assert matcher.match("var_2500_x") == ("*",)
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        ("x_*", "x_"),
+        ("x_?", "x_"),
+        ("x[ab]*", "x"),
+        ("*_max", ""),
+        ("{x_\\d+}", ""),
+        ("time", "time"),
+    ],
+)
+def test_literal_prefix(key, expected):
+    assert literal_prefix(key) == expected
+
+
+def test_key_table():
+    table = KeyTable.from_mapping({"x_special": 0, "x_*": 1, "{x_\\d+}": 2})
+    assert table.exact_keys == {"x_special": 0}
+    assert table.pattern_keys == {"x_*": 1, "{x_\\d+}": 2}
+    assert table.claim("x_special") == ("x_special",)
+    assert table.claim("x_0") == ("x_*", "{x_\\d+}")
+    assert table.claim("x_a") == ("x_*",)
+    assert table.claim("y") == ()
+
+
+def test_key_table_classify():
+    table = KeyTable.from_mapping({"x_special": 0, "x_*": 1, "{._\\d+}": 2})
+    claimed, unclaimed = table.classify(["y_1", "z", "x_special", "x_0", "y_a"])
+    assert claimed == {
+        "y_1": ("{._\\d+}",),
+        "x_special": ("x_special",),
+        "x_0": ("x_*", "{._\\d+}"),
+    }
+    assert list(claimed) == ["y_1", "x_special", "x_0"]
+    assert unclaimed == ["z", "y_a"]
+
+    # Without pattern keys
+    table = KeyTable.from_mapping({"x": 0})
+    assert table.classify(["x", "y"]) == ({"x": ("x",)}, ["y"])